@@ -15,16 +15,23 @@ package: From the Flask docs (emphasis added):
     *ideally located outside the actual application package*.
 """
 
+import functools
 import logging
 import os
 from pathlib import Path
 
 from dotenv import load_dotenv
 from flask import Flask
+from sqlalchemy.pool import NullPool
 
 # Load dotenv early so that `_env` will work in the class definitions below.
 load_dotenv()
 
+# A plain-dict snapshot of the environment. `_env` is called many times while
+# the classes below are defined, and dict lookups are cheaper than going
+# through `os.environ`, which re-encodes keys on every access.
+_ENV_SNAPSHOT = dict(os.environ)
+
 #: The test environment. For unit tests only.
 TESTING = "testing"
 #: The development environment. For local development.
@@ -53,7 +60,7 @@ def _env(key: str, default=None) -> str | None:
     :param key: the environment variable to fetch
     :return: a value, or ``None`` if the variable is undefined.
     """
-    return os.environ.get(key, default)
+    return _ENV_SNAPSHOT.get(key, default)
 
 
 class BaseConfig:
@@ -80,6 +87,21 @@ class BaseConfig:
     #: https://docs.sqlalchemy.org/en/14/core/engines.html#database-urls
     SQLALCHEMY_DATABASE_URI = _env("SQLALCHEMY_DATABASE_URI")
 
+    #: Keyword arguments for SQLAlchemy's `create_engine`. The default pool
+    #: (size 5, overflow 10) is too small for concurrent requests, so we size
+    #: it explicitly. `pool_pre_ping` and `pool_recycle` guard against
+    #: connections that the database server has silently dropped.
+    #:
+    #: For details, see:
+    #:
+    #: https://docs.sqlalchemy.org/en/14/core/pooling.html
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+
     #: Where to store user uploads (PDFs, images, etc.).
     UPLOAD_FOLDER = _env("FLASK_UPLOAD_FOLDER")
 
@@ -220,6 +242,13 @@ class ProductionConfig(BaseConfig):
     #: Logger setup
     LOG_LEVEL = logging.INFO
 
+    #: Production serves more concurrent requests, so use a larger pool.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        **BaseConfig.SQLALCHEMY_ENGINE_OPTIONS,
+        "pool_size": 20,
+        "max_overflow": 40,
+    }
+
     # Deployment credentials
     # ----------------------
 
@@ -261,9 +290,14 @@ def _validate_config(config: BaseConfig):
             raise ValueError("Production config must define SENTRY_DSN.")
 
 
+# Config objects are never mutated after loading, so it's safe to reuse them.
+@functools.lru_cache(maxsize=None)
 def load_config_object(name: str):
     """Load a config object by name.
 
+    The result is cached so that repeated app creation (in tests, scripts, and
+    workers) doesn't rebuild and revalidate the config each time.
+
     :param name: the name of the config to load
     :return: a config object
     """
@@ -283,15 +317,27 @@ def load_config_object(name: str):
     return config
 
 
-def create_config_only_app(config_name: str):
+# Celery tasks call this once per task, so reuse one app per config.
+@functools.lru_cache(maxsize=None)
+def create_config_only_app(config_name: str, one_shot: bool = False):
     """Create a minimal Flask app that only loads config.
 
-    This is useful for scripts that need to access config values but don't
-    need the full application context.
+    This is useful for Celery workers and scripts that need to access config
+    values but don't need the full application context.
+
+    Celery workers reuse one app, and hence one engine, per process, so they
+    keep the config's connection pool. One-shot scripts should pass
+    `one_shot=True` to use `NullPool` instead, so that no idle connections are
+    left behind.
+
+    The app is cached per config name, so callers must not modify its config.
 
     :param config_name: the name of the config to load
+    :param one_shot: if true, don't pool database connections
     :return: a minimal Flask app
     """
     app = Flask(__name__)
     app.config.from_object(load_config_object(config_name))
+    if one_shot:
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {"poolclass": NullPool}
     return app
@@ -8,38 +8,61 @@ https://kalanjiyam.readthedocs.io/en/latest/
 import logging
 import sys
 
-import sentry_sdk
 from dotenv import load_dotenv
-from flask import Flask, session
+from flask import Flask, g, session
 from flask_babel import Babel, pgettext
-from sentry_sdk.integrations.flask import FlaskIntegration
 from sqlalchemy import exc
 
 import config
-from kalanjiyam import admin as admin_manager
-from kalanjiyam import auth as auth_manager
 from kalanjiyam import checks, filters, queries
 from kalanjiyam.consts import LOCALES
-from kalanjiyam.mail import mailer
 from kalanjiyam.utils import assets
 from kalanjiyam.utils.json_serde import KalanjiyamJSONEncoder
 from kalanjiyam.utils.url_converters import ListConverter
-from kalanjiyam.views.about import bp as about
-from kalanjiyam.views.api import bp as api
-from kalanjiyam.views.auth import bp as auth
-from kalanjiyam.views.blog import bp as blog
-from kalanjiyam.views.dictionaries import bp as dictionaries
-from kalanjiyam.views.proofing import bp as proofing
-from kalanjiyam.views.public import bp as public
-from kalanjiyam.views.reader.parses import bp as parses
-from kalanjiyam.views.reader.texts import bp as texts
-from kalanjiyam.views.site import bp as site
+
+# NOTE: Views, Flask-Admin, and other extensions are imported inside
+# `create_app`. Scripts and Celery tasks import `kalanjiyam.database` and
+# `kalanjiyam.queries`, which runs this module, and they shouldn't pay for
+# loading the entire view layer.
+
+#: Template filters. These don't depend on the app, so build them just once.
+_JINJA_FILTERS = {
+    "d": filters.devanagari,
+    "slp2dev": filters.slp_to_devanagari,
+    "devanagari": filters.devanagari,
+    "roman": filters.roman,
+    "markdown": filters.markdown,
+    "time_ago": filters.time_ago,
+}
+
+#: Template globals that don't depend on the app. `create_app` adds the
+#: app-specific `get_locale` on top of these.
+_JINJA_GLOBALS_BASE = {
+    "asset": assets.hashed_static,
+    "pgettext": pgettext,
+    "kalanjiyam_locales": LOCALES,
+}
 
 
 def _initialize_sentry(sentry_dsn: str):
     """Initialize basic monitoring through the third-party Sentry service."""
+    import sentry_sdk
+    from sentry_sdk.integrations.flask import FlaskIntegration
+    from sentry_sdk.integrations.logging import LoggingIntegration
+
+    # Enable only the integrations we use, and skip the per-request work of
+    # capturing local variables and request bodies.
     sentry_sdk.init(
-        dsn=sentry_dsn, integrations=[FlaskIntegration()], traces_sample_rate=0
+        dsn=sentry_dsn,
+        default_integrations=False,
+        integrations=[
+            FlaskIntegration(transaction_style="endpoint"),
+            LoggingIntegration(),
+        ],
+        include_local_variables=False,
+        max_request_body_size="never",
+        send_default_pii=False,
+        traces_sample_rate=0,
     )
 
 
@@ -81,6 +104,19 @@ def _initialize_logger(log_level: int) -> None:
 
 def create_app(config_env: str):
     """Initialize the Kalanjiyam application."""
+    from kalanjiyam import admin as admin_manager
+    from kalanjiyam import auth as auth_manager
+    from kalanjiyam.mail import mailer
+    from kalanjiyam.views.about import bp as about
+    from kalanjiyam.views.api import bp as api
+    from kalanjiyam.views.auth import bp as auth
+    from kalanjiyam.views.blog import bp as blog
+    from kalanjiyam.views.dictionaries import bp as dictionaries
+    from kalanjiyam.views.proofing import bp as proofing
+    from kalanjiyam.views.public import bp as public
+    from kalanjiyam.views.reader.parses import bp as parses
+    from kalanjiyam.views.reader.texts import bp as texts
+    from kalanjiyam.views.site import bp as site
 
     # We store all env variables in a `.env` file so that it's easier to manage
     # different configurations.
@@ -112,9 +148,12 @@ def create_app(config_env: str):
     # Database
     _initialize_db_session(app, config_env)
 
-    # A custom Babel locale_selector.
+    # A custom Babel locale_selector. Templates call this once per translated
+    # string, so memoize the result for the rest of the request.
     def get_locale():
-        return session.get("locale", config_spec.BABEL_DEFAULT_LOCALE)
+        if "locale" not in g:
+            g.locale = session.get("locale", config_spec.BABEL_DEFAULT_LOCALE)
+        return g.locale
 
     # Extensions
     Babel(app, locale_selector=get_locale)
@@ -154,24 +193,9 @@ def create_app(config_env: str):
     # i18n string trimming
     app.jinja_env.policies["ext.i18n.trimmed"] = True
     # Template functions and filters
-    app.jinja_env.filters.update(
-        {
-            "d": filters.devanagari,
-            "slp2dev": filters.slp_to_devanagari,
-            "devanagari": filters.devanagari,
-            "roman": filters.roman,
-            "markdown": filters.markdown,
-            "time_ago": filters.time_ago,
-        }
-    )
-    app.jinja_env.globals.update(
-        {
-            "asset": assets.hashed_static,
-            "pgettext": pgettext,
-            "kalanjiyam_locales": LOCALES,
-            "get_locale": get_locale,
-        }
-    )
+    app.jinja_env.filters.update(_JINJA_FILTERS)
+    app.jinja_env.globals.update(_JINJA_GLOBALS_BASE)
+    app.jinja_env.globals["get_locale"] = get_locale
 
     app.json_encoder = KalanjiyamJSONEncoder
     return app
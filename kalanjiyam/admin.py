@@ -1,27 +1,131 @@
 """Manages an internal admin view for site data."""
 
-from flask import abort, render_template, request, flash, redirect, url_for, send_file, current_app
+from flask import abort, render_template, request, flash, redirect, url_for, current_app, g, Response, stream_with_context
 from flask_admin import Admin, AdminIndexView, expose, BaseView as AdminBaseView
 from flask_admin.contrib import sqla
 from flask_login import current_user, login_required
 from werkzeug.utils import secure_filename
-import json
+import orjson
+import os
+import shutil
 import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 
 import kalanjiyam.database as db
 import kalanjiyam.queries as q
-from kalanjiyam.utils.assets import get_page_image_filepath
+from kalanjiyam.tasks import projects as project_tasks
+from kalanjiyam.utils import project_import
 
 
+#: Read size when copying files into an export archive.
+_ZIP_CHUNK_SIZE = 1024 * 1024
 
+#: Suffixes of files that are already compressed. Deflating them again costs
+#: CPU time and saves almost no space, so we store them as-is.
+_STORED_SUFFIXES = {".jpg", ".jpeg", ".pdf"}
+
+
+def _is_admin() -> bool:
+    """Return whether the current user is an admin.
+
+    Flask-Admin checks `is_accessible` for every view when it renders its menu,
+    so we compute the role check once per request.
+    """
+    if "_is_admin" not in g:
+        g._is_admin = current_user.is_authenticated and current_user.is_admin
+    return g._is_admin
+
+
+def _is_moderator() -> bool:
+    """Return whether the current user is a moderator (or admin)."""
+    if "_is_moderator" not in g:
+        g._is_moderator = current_user.is_authenticated and current_user.is_moderator
+    return g._is_moderator
+
+
+class _ZipStreamBuffer:
+    """A write-only sink for `zipfile.ZipFile` that we drain as we go.
+
+    It has no `tell` or `seek`, so `zipfile` treats it as an unseekable stream
+    and writes data descriptors instead of seeking back to patch headers.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> list[bytes]:
+        chunks, self._chunks = self._chunks, []
+        return chunks
+
+
+def _iter_zip(entries):
+    """Yield a ZIP archive chunk by chunk.
+
+    :param entries: a list of ``(arcname, source)`` pairs, where ``source`` is
+        a `Path` to copy from, the entry's contents as `bytes`, or an iterable
+        that yields the entry's contents in chunks.
+    """
+    buf = _ZipStreamBuffer()
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        for arcname, source in entries:
+            if isinstance(source, Path):
+                info = zipfile.ZipInfo.from_file(source, arcname)
+                if source.suffix.lower() in _STORED_SUFFIXES:
+                    info.compress_type = zipfile.ZIP_STORED
+                else:
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                with open(source, 'rb') as src, zipf.open(info, 'w') as dest:
+                    while chunk := src.read(_ZIP_CHUNK_SIZE):
+                        dest.write(chunk)
+                        yield from buf.drain()
+            elif isinstance(source, bytes):
+                zipf.writestr(arcname, source)
+            else:
+                info = zipfile.ZipInfo(arcname, date_time=datetime.now().timetuple()[:6])
+                info.compress_type = zipfile.ZIP_DEFLATED
+                with zipf.open(info, 'w', force_zip64=True) as dest:
+                    for chunk in source:
+                        dest.write(chunk)
+                        yield from buf.drain()
+            yield from buf.drain()
+    yield from buf.drain()
+
+
+def _save_upload(file, dest: Path):
+    """Save an uploaded file with large buffered writes.
+
+    `FileStorage.save` copies in 16 KiB chunks, which is many small writes
+    for a large project archive.
+    """
+    with open(dest, "wb", buffering=project_import.ARCHIVE_BUFFER_SIZE) as out:
+        shutil.copyfileobj(file.stream, out, length=project_import.ARCHIVE_BUFFER_SIZE)
+
+
+def _zip_response(entries, download_name: str) -> Response:
+    """Stream a ZIP archive to the client without staging it on disk.
+
+    The response keeps the request context alive so that entries can be
+    generated lazily from the database.
+    """
+    return Response(
+        stream_with_context(_iter_zip(entries)),
+        mimetype="application/zip",
+        headers={"Content-Disposition": f"attachment; filename={download_name}"},
+    )
 
 
 class KalanjiyamIndexView(AdminIndexView):
     def is_accessible(self):
-        return current_user.is_authenticated and current_user.is_moderator
+        return _is_moderator()
     
     def inaccessible_callback(self, name, **kwargs):
         abort(404)
@@ -29,8 +133,8 @@ class KalanjiyamIndexView(AdminIndexView):
     @expose("/")
     def index(self):
         # For admin users, show the export/import dashboard
-        if current_user.is_admin:
-            projects = q.projects()
+        if _is_admin():
+            projects = q.cached_project_summaries()
             print(f"DEBUG: Rendering admin dashboard with {len(projects)} projects")
             return render_template("admin/export_import.html", projects=projects)
         
@@ -41,177 +145,93 @@ class KalanjiyamIndexView(AdminIndexView):
     @login_required
     def export_project(self, project_slug):
         """Export a single project as a ZIP file."""
-        if not current_user.is_admin:
+        if not _is_admin():
             abort(404)
         
-        project = q.project(project_slug)
+        project = q.project_for_export(project_slug)
         if not project:
             abort(404)
         
-        # Create temporary directory for export
-        export_dir = Path(current_app.config["UPLOAD_FOLDER"]) / "exports" / f"{project_slug}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        export_dir.mkdir(parents=True, exist_ok=True)
-        
         try:
             # Export project data
             project_data = self._export_project_data(project)
+            json_bytes = orjson.dumps(project_data)
             
-            # Save JSON data
-            json_file = export_dir / "project_data.json"
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(project_data, f, indent=2, ensure_ascii=False)
+            # Collect the project files. These are streamed straight from their
+            # original location into the archive.
+            entries = [("project_data.json", json_bytes)]
             
-            # Copy project files
-            project_files_dir = export_dir / "files"
-            project_files_dir.mkdir(exist_ok=True)
-            
-            # Copy PDF
-            pdf_source = Path(current_app.config["UPLOAD_FOLDER"]) / "projects" / project_slug / "pdf" / "source.pdf"
+            project_dir = Path(current_app.config["UPLOAD_FOLDER"]) / "projects" / project_slug
+            pdf_source = project_dir / "pdf" / "source.pdf"
             if pdf_source.exists():
-                pdf_dest = project_files_dir / "source.pdf"
-                pdf_dest.write_bytes(pdf_source.read_bytes())
-            
-            # Copy page images
-            pages_dir = project_files_dir / "pages"
-            pages_dir.mkdir(exist_ok=True)
+                entries.append(("files/source.pdf", pdf_source))
             
+            # List the pages directory once instead of stat-ing each image.
+            pages_dir = project_dir / "pages"
+            try:
+                image_names = {e.name for e in os.scandir(pages_dir)}
+            except FileNotFoundError:
+                image_names = set()
             for page in project.pages:
-                image_path = get_page_image_filepath(project_slug, page.slug)
-                if image_path.exists():
-                    image_dest = pages_dir / f"{page.slug}.jpg"
-                    image_dest.write_bytes(image_path.read_bytes())
-            
-            # Create ZIP file
-            zip_path = export_dir.parent / f"{project_slug}_export.zip"
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # Add JSON data
-                zipf.write(json_file, "project_data.json")
-                
-                # Add files
-                for file_path in project_files_dir.rglob("*"):
-                    if file_path.is_file():
-                        zipf.write(file_path, f"files/{file_path.relative_to(project_files_dir)}")
-            
-            # Clean up temporary directory
-            import shutil
-            shutil.rmtree(export_dir)
-            
-            return send_file(
-                zip_path,
-                as_attachment=True,
-                download_name=f"{project_slug}_export.zip",
-                mimetype="application/zip"
-            )
+                image_name = f"{page.slug}.jpg"
+                if image_name in image_names:
+                    entries.append((f"files/pages/{image_name}", pages_dir / image_name))
             
         except Exception as e:
-            # Clean up on error
-            import shutil
-            if export_dir.exists():
-                shutil.rmtree(export_dir)
             flash(f"Export failed: {str(e)}")
             return redirect(url_for('admin.index'))
+        
+        return _zip_response(entries, f"{project_slug}_export.zip")
     
     @expose('/export/all-projects')
     @login_required
     def export_all_projects(self):
         """Export all projects as a single ZIP file."""
-        if not current_user.is_admin:
+        if not _is_admin():
             abort(404)
         
-        projects = q.projects()
-        
-        # Create temporary directory for export
-        export_dir = Path(current_app.config["UPLOAD_FOLDER"]) / "exports" / f"all_projects_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        export_dir.mkdir(parents=True, exist_ok=True)
+        session = q.get_session()
+        slugs = [slug for (slug,) in session.query(db.Project.slug)]
+        export_info = {
+            'exported_at': datetime.now(),
+            'total_projects': len(slugs),
+            'version': '1.0'
+        }
+        entries = [("all_projects_data.json", self._iter_all_projects_json(export_info, slugs))]
+        return _zip_response(entries, "all_projects_export.zip")
+    
+    def _iter_all_projects_json(self, export_info: Dict[str, Any], slugs: list[str]):
+        """Yield the all-projects JSON document one project at a time.
         
-        try:
-            all_projects_data = {
-                'export_info': {
-                    'exported_at': datetime.now().isoformat(),
-                    'total_projects': len(projects),
-                    'version': '1.0'
-                },
-                'projects': []
-            }
-            
-            for project in projects:
-                project_data = self._export_project_data(project)
-                all_projects_data['projects'].append(project_data)
-            
-            # Save JSON data
-            json_file = export_dir / "all_projects_data.json"
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(all_projects_data, f, indent=2, ensure_ascii=False)
-            
-            # Create ZIP file
-            zip_path = export_dir.parent / "all_projects_export.zip"
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                zipf.write(json_file, "all_projects_data.json")
-            
-            # Clean up temporary directory
-            import shutil
-            shutil.rmtree(export_dir)
-            
-            return send_file(
-                zip_path,
-                as_attachment=True,
-                download_name="all_projects_export.zip",
-                mimetype="application/zip"
-            )
-            
-        except Exception as e:
-            # Clean up on error
-            import shutil
-            if export_dir.exists():
-                shutil.rmtree(export_dir)
-            flash(f"Export failed: {str(e)}")
-            return redirect(url_for('admin.index'))
+        This keeps only one project's data in memory at once, rather than
+        building the entire document before writing it.
+        """
+        session = q.get_session()
+        yield b'{"export_info":' + orjson.dumps(export_info) + b',"projects":['
+        is_first = True
+        for slug in slugs:
+            project = q.project_for_export(slug)
+            if project is None:
+                # The project was deleted after we read the slugs.
+                continue
+            if not is_first:
+                yield b','
+            is_first = False
+            yield orjson.dumps(self._export_project_data(project))
+            # Unload the project's pages, revisions, etc. so that they can be
+            # garbage-collected.
+            session.expire(project)
+        yield b']}'
     
     @expose('/import', methods=['GET', 'POST'])
     @login_required
     def import_project(self):
         """Import a project from a ZIP file."""
-        if not current_user.is_admin:
+        if not _is_admin():
             abort(404)
         
         if request.method == "POST":
-            if 'project_file' not in request.files:
-                flash("No file selected")
-                return redirect(request.url)
-            
-            file = request.files['project_file']
-            if file.filename == '':
-                flash("No file selected")
-                return redirect(request.url)
-            
-            if not file.filename.endswith('.zip'):
-                flash("Please upload a ZIP file")
-                return redirect(request.url)
-            
-            try:
-                # Save uploaded file temporarily
-                filename = secure_filename(file.filename)
-                temp_dir = Path(current_app.config["UPLOAD_FOLDER"]) / "imports"
-                temp_dir.mkdir(parents=True, exist_ok=True)
-                
-                temp_file = temp_dir / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{filename}"
-                file.save(temp_file)
-                
-                # Import project
-                session = q.get_session()
-                result = self._extract_and_import_project(temp_file, session)
-                session.commit()
-                
-                # Clean up
-                temp_file.unlink()
-                
-                flash(f"Successfully imported project: {result['metadata']['display_title']}")
-                return redirect(url_for("proofing.project.detail", slug=result['project'].slug))
-                
-            except Exception as e:
-                session.rollback()
-                flash(f"Import failed: {str(e)}")
-                return redirect(request.url)
+            return self._start_import('project_file')
         
         return render_template("admin/import.html")
     
@@ -219,78 +239,96 @@ class KalanjiyamIndexView(AdminIndexView):
     @login_required
     def import_all_projects(self):
         """Import all projects from a ZIP file."""
-        if not current_user.is_admin:
+        if not _is_admin():
             abort(404)
         
         if request.method == "POST":
-            if 'projects_file' not in request.files:
-                flash("No file selected")
-                return redirect(request.url)
-            
-            file = request.files['projects_file']
-            if file.filename == '':
-                flash("No file selected")
-                return redirect(request.url)
-            
-            if not file.filename.endswith('.zip'):
-                flash("Please upload a ZIP file")
-                return redirect(request.url)
-            
-            try:
-                # Save uploaded file temporarily
-                filename = secure_filename(file.filename)
-                temp_dir = Path(current_app.config["UPLOAD_FOLDER"]) / "imports"
-                temp_dir.mkdir(parents=True, exist_ok=True)
-                
-                temp_file = temp_dir / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{filename}"
-                file.save(temp_file)
-                
-                # Extract and read all projects data
-                import tempfile
-                import shutil
-                
-                with tempfile.TemporaryDirectory() as extract_dir:
-                    extract_path = Path(extract_dir)
-                    
-                    with zipfile.ZipFile(temp_file, 'r') as zipf:
-                        zipf.extractall(extract_path)
-                    
-                    json_file = extract_path / "all_projects_data.json"
-                    if not json_file.exists():
-                        raise ValueError("No all_projects_data.json found in ZIP file")
-                    
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        all_projects_data = json.load(f)
-                    
-                    # Import all projects
-                    session = q.get_session()
-                    imported_projects = []
-                    
-                    for project_data in all_projects_data['projects']:
-                        try:
-                            project = self._import_project_data(session, project_data)
-                            imported_projects.append(project.display_title)
-                        except Exception as e:
-                            flash(f"Failed to import project {project_data['metadata']['display_title']}: {str(e)}")
-                            continue
-                    
-                    session.commit()
-                    
-                    # Clean up
-                    temp_file.unlink()
-                    
-                    flash(f"Successfully imported {len(imported_projects)} projects")
-                    return redirect(url_for("proofing.index"))
-                    
-            except Exception as e:
-                session.rollback()
-                flash(f"Import failed: {str(e)}")
-                return redirect(request.url)
+            return self._start_import('projects_file')
         
         return render_template("admin/import_all.html")
     
+    @expose('/import/status/<task_id>')
+    @login_required
+    def import_status(self, task_id):
+        """AJAX summary of an import task."""
+        if not _is_admin():
+            abort(404)
+        
+        r = project_tasks.import_projects.AsyncResult(task_id)
+        info = r.info or {}
+        if isinstance(info, Exception):
+            current = total = percent = 0
+            slug = None
+            failures = []
+        else:
+            current = info.get("current", 0)
+            total = info.get("total", 0)
+            slug = info.get("slug", None)
+            failures = info.get("failures", [])
+            percent = 100 * current / total if total else 0
+        
+        if r.status == "SUCCESS":
+            # Show the new projects on the dashboard right away.
+            q.clear_project_summaries_cache()
+        
+        return render_template(
+            "admin/import-progress.html",
+            status=r.status,
+            current=current,
+            total=total,
+            percent=percent,
+            slug=slug,
+            failures=failures,
+        )
+    
+    def _start_import(self, field_name: str):
+        """Save an uploaded archive and import it in the background.
+        
+        Imports can insert many thousands of rows, so we run them on a Celery
+        worker rather than in the request.
+        """
+        if field_name not in request.files:
+            flash("No file selected")
+            return redirect(request.url)
+        
+        file = request.files[field_name]
+        if file.filename == '':
+            flash("No file selected")
+            return redirect(request.url)
+        
+        if not file.filename.endswith('.zip'):
+            flash("Please upload a ZIP file")
+            return redirect(request.url)
+        
+        # Save the upload where the worker can read it. The worker deletes it
+        # when it's done.
+        filename = secure_filename(file.filename)
+        temp_dir = Path(current_app.config["UPLOAD_FOLDER"]) / "imports"
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        
+        temp_file = temp_dir / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{filename}"
+        _save_upload(file, temp_file)
+        
+        task = project_tasks.import_projects.delay(
+            zip_path=str(temp_file),
+            app_environment=current_app.config["KALANJIYAM_ENVIRONMENT"],
+        )
+        return render_template(
+            "admin/import-post.html",
+            status=task.status,
+            current=0,
+            total=0,
+            percent=0,
+            slug=None,
+            failures=[],
+            task_id=task.id,
+        )
+    
     def _export_project_data(self, project: db.Project) -> Dict[str, Any]:
-        """Export all data for a single project."""
+        """Export all data for a single project.
+
+        Datetimes are left as-is, since orjson serializes them natively.
+        """
         session = q.get_session()
         
         # Export project metadata
@@ -307,8 +345,8 @@ class KalanjiyamIndexView(AdminIndexView):
                 'description': project.description,
                 'notes': project.notes,
                 'page_numbers': project.page_numbers,
-                'created_at': project.created_at.isoformat(),
-                'updated_at': project.updated_at.isoformat(),
+                'created_at': project.created_at,
+                'updated_at': project.updated_at,
                 'genre_id': project.genre_id,
                 'creator_username': project.creator.username if project.creator else None
             },
@@ -323,42 +361,94 @@ class KalanjiyamIndexView(AdminIndexView):
         }
         
         # Export pages
-        for page in project.pages:
-            page_data = {
+        project_data['pages'] = [
+            {
                 'slug': page.slug,
                 'order': page.order,
                 'version': page.version,
                 'ocr_bounding_boxes': page.ocr_bounding_boxes,
                 'status_name': page.status.name if page.status else None
             }
-            project_data['pages'].append(page_data)
-            
-            # Export revisions for this page
-            for revision in page.revisions:
-                revision_data = {
-                    'page_slug': page.slug,
-                    'author_username': revision.author.username if revision.author else None,
-                    'status_name': revision.status.name if revision.status else None,
-                    'created': revision.created.isoformat(),
-                    'summary': revision.summary,
-                    'content': revision.content
-                }
-                project_data['revisions'].append(revision_data)
-                
-                # Export translations for this revision
-                for translation in revision.translations:
-                    translation_data = {
-                        'revision_id': revision.id,
-                        'author_username': translation.author.username if translation.author else None,
-                        'content': translation.content,
-                        'source_language': translation.source_language,
-                        'target_language': translation.target_language,
-                        'translation_engine': translation.translation_engine,
-                        'status': translation.status,
-                        'created_at': translation.created_at.isoformat(),
-                        'updated_at': translation.updated_at.isoformat()
-                    }
-                    project_data['translations'].append(translation_data)
+            for page in project.pages
+        ]
+        
+        # Export revisions and translations. Each comes from one query that
+        # returns flat rows, rather than walking page.revisions and
+        # revision.translations object by object.
+        revision_rows = (
+            session.query(
+                db.Revision.id,
+                db.Page.slug,
+                db.User.username,
+                db.PageStatus.name,
+                db.Revision.created,
+                db.Revision.summary,
+                db.Revision.content,
+            )
+            .join(db.Page, db.Page.id == db.Revision.page_id)
+            .outerjoin(db.User, db.User.id == db.Revision.author_id)
+            .outerjoin(db.PageStatus, db.PageStatus.id == db.Revision.status_id)
+            .filter(db.Page.project_id == project.id)
+            .order_by(db.Page.order, db.Revision.created)
+        )
+        project_data['revisions'] = [
+            {
+                'revision_id': revision_id,
+                'page_slug': page_slug,
+                'author_username': author_username,
+                'status_name': status_name,
+                'created': created,
+                'summary': summary,
+                'content': content
+            }
+            for revision_id, page_slug, author_username, status_name, created, summary, content in revision_rows
+        ]
+        
+        translation_rows = (
+            session.query(
+                db.Page.slug,
+                db.Translation.revision_id,
+                db.User.username,
+                db.Translation.content,
+                db.Translation.source_language,
+                db.Translation.target_language,
+                db.Translation.translation_engine,
+                db.Translation.status,
+                db.Translation.created_at,
+                db.Translation.updated_at,
+            )
+            .join(db.Revision, db.Revision.id == db.Translation.revision_id)
+            .join(db.Page, db.Page.id == db.Revision.page_id)
+            .outerjoin(db.User, db.User.id == db.Translation.author_id)
+            .filter(db.Page.project_id == project.id)
+            .order_by(db.Page.order, db.Revision.created, db.Translation.id)
+        )
+        project_data['translations'] = [
+            {
+                'page_slug': page_slug,
+                'revision_id': revision_id,
+                'author_username': author_username,
+                'content': content,
+                'source_language': source_language,
+                'target_language': target_language,
+                'translation_engine': translation_engine,
+                'status': status,
+                'created_at': created_at,
+                'updated_at': updated_at
+            }
+            for (
+                page_slug,
+                revision_id,
+                author_username,
+                content,
+                source_language,
+                target_language,
+                translation_engine,
+                status,
+                created_at,
+                updated_at,
+            ) in translation_rows
+        ]
         
         # Export discussion data
         if project.board:
@@ -370,16 +460,16 @@ class KalanjiyamIndexView(AdminIndexView):
                 thread_data = {
                     'title': thread.title,
                     'author_username': thread.author.username if thread.author else None,
-                    'created_at': thread.created_at.isoformat(),
-                    'updated_at': thread.updated_at.isoformat(),
+                    'created_at': thread.created_at,
+                    'updated_at': thread.updated_at,
                     'posts': []
                 }
                 
                 for post in thread.posts:
                     post_data = {
                         'author_username': post.author.username if post.author else None,
-                        'created_at': post.created_at.isoformat(),
-                        'updated_at': post.updated_at.isoformat(),
+                        'created_at': post.created_at,
+                        'updated_at': post.updated_at,
                         'content': post.content
                     }
                     thread_data['posts'].append(post_data)
@@ -388,234 +478,6 @@ class KalanjiyamIndexView(AdminIndexView):
         
         return project_data
     
-    def _get_or_create_user(self, session, username: str) -> Optional[db.User]:
-        """Get existing user or create a placeholder user."""
-        if not username:
-            return None
-        
-        user = session.query(db.User).filter_by(username=username).first()
-        if user:
-            return user
-        
-        # Create placeholder user if doesn't exist
-        user = db.User(
-            username=username,
-            email=f"{username}@imported.local",
-            description="Imported user"
-        )
-        user.set_password("imported_user_password_change_me")
-        session.add(user)
-        session.flush()  # Get the ID
-        return user
-    
-    def _get_or_create_genre(self, session, genre_id: int) -> Optional[db.Genre]:
-        """Get existing genre or return None."""
-        if not genre_id:
-            return None
-        
-        return session.query(db.Genre).filter_by(id=genre_id).first()
-    
-    def _get_or_create_page_status(self, session, status_name: str) -> db.PageStatus:
-        """Get existing page status or create it."""
-        status = session.query(db.PageStatus).filter_by(name=status_name).first()
-        if status:
-            return status
-        
-        status = db.PageStatus(name=status_name)
-        session.add(status)
-        session.flush()
-        return status
-    
-    def _import_project_data(self, session, project_data: Dict[str, Any], user_mapping: Dict[str, int] = None) -> db.Project:
-        """Import a single project from exported data."""
-        if user_mapping is None:
-            user_mapping = {}
-        
-        metadata = project_data['metadata']
-        
-        # Check if project already exists
-        existing_project = session.query(db.Project).filter_by(slug=metadata['slug']).first()
-        if existing_project:
-            raise ValueError(f"Project with slug '{metadata['slug']}' already exists")
-        
-        # Get or create creator user
-        creator = None
-        if metadata.get('creator_username'):
-            creator = self._get_or_create_user(session, metadata['creator_username'])
-        
-        # Get genre
-        genre = None
-        if metadata.get('genre_id'):
-            genre = self._get_or_create_genre(session, metadata['genre_id'])
-        
-        # Create project
-        project = db.Project(
-            slug=metadata['slug'],
-            display_title=metadata['display_title'],
-            print_title=metadata['print_title'],
-            author=metadata['author'],
-            editor=metadata['editor'],
-            publisher=metadata['publisher'],
-            publication_year=metadata['publication_year'],
-            worldcat_link=metadata['worldcat_link'],
-            description=metadata['description'],
-            notes=metadata['notes'],
-            page_numbers=metadata['page_numbers'],
-            created_at=datetime.fromisoformat(metadata['created_at']),
-            updated_at=datetime.fromisoformat(metadata['updated_at']),
-            creator_id=creator.id if creator else None,
-            genre_id=genre.id if genre else None
-        )
-        
-        session.add(project)
-        session.flush()  # Get the project ID
-        
-        # Create discussion board
-        if project_data['discussion']['board']:
-            board = db.Board(title=project_data['discussion']['board']['title'])
-            session.add(board)
-            session.flush()
-            project.board_id = board.id
-            
-            # Import threads and posts
-            for thread_data in project_data['discussion']['threads']:
-                thread_author = self._get_or_create_user(session, thread_data['author_username'])
-                
-                thread = db.Thread(
-                    title=thread_data['title'],
-                    board_id=board.id,
-                    author_id=thread_author.id if thread_author else None,
-                    created_at=datetime.fromisoformat(thread_data['created_at']),
-                    updated_at=datetime.fromisoformat(thread_data['updated_at'])
-                )
-                session.add(thread)
-                session.flush()
-                
-                for post_data in thread_data['posts']:
-                    post_author = self._get_or_create_user(session, post_data['author_username'])
-                    
-                    post = db.Post(
-                        board_id=board.id,
-                        thread_id=thread.id,
-                        author_id=post_author.id if post_author else None,
-                        created_at=datetime.fromisoformat(post_data['created_at']),
-                        updated_at=datetime.fromisoformat(post_data['updated_at']),
-                        content=post_data['content']
-                    )
-                    session.add(post)
-        
-        # Create pages
-        page_mapping = {}  # Map page slugs to page objects
-        for page_data in project_data['pages']:
-            status = self._get_or_create_page_status(session, page_data['status_name'])
-            
-            page = db.Page(
-                project_id=project.id,
-                slug=page_data['slug'],
-                order=page_data['order'],
-                version=page_data['version'],
-                ocr_bounding_boxes=page_data['ocr_bounding_boxes'],
-                status_id=status.id
-            )
-            session.add(page)
-            session.flush()
-            page_mapping[page_data['slug']] = page
-        
-        # Create revisions
-        revision_mapping = {}  # Map revision IDs to revision objects
-        for revision_data in project_data['revisions']:
-            page = page_mapping.get(revision_data['page_slug'])
-            if not page:
-                continue
-            
-            author = self._get_or_create_user(session, revision_data['author_username'])
-            status = self._get_or_create_page_status(session, revision_data['status_name'])
-            
-            revision = db.Revision(
-                project_id=project.id,
-                page_id=page.id,
-                author_id=author.id if author else None,
-                status_id=status.id,
-                created=datetime.fromisoformat(revision_data['created']),
-                summary=revision_data['summary'],
-                content=revision_data['content']
-            )
-            session.add(revision)
-            session.flush()
-            revision_mapping[revision_data.get('revision_id')] = revision
-        
-        # Create translations
-        for translation_data in project_data['translations']:
-            author = self._get_or_create_user(session, translation_data['author_username'])
-            
-            translation = db.Translation(
-                page_id=page_mapping[translation_data['page_slug']].id if 'page_slug' in translation_data else None,
-                revision_id=revision_mapping.get(translation_data['revision_id']).id if translation_data.get('revision_id') in revision_mapping else None,
-                author_id=author.id if author else None,
-                content=translation_data['content'],
-                source_language=translation_data['source_language'],
-                target_language=translation_data['target_language'],
-                translation_engine=translation_data['translation_engine'],
-                status=translation_data['status'],
-                created_at=datetime.fromisoformat(translation_data['created_at']),
-                updated_at=datetime.fromisoformat(translation_data['updated_at'])
-            )
-            session.add(translation)
-        
-        return project
-    
-    def _extract_and_import_project(self, zip_file: Path, session) -> Dict[str, Any]:
-        """Extract ZIP file and import project data."""
-        import tempfile
-        import shutil
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Extract ZIP file
-            with zipfile.ZipFile(zip_file, 'r') as zipf:
-                zipf.extractall(temp_path)
-            
-            # Read project data
-            json_file = temp_path / "project_data.json"
-            if not json_file.exists():
-                raise ValueError("No project_data.json found in ZIP file")
-            
-            with open(json_file, 'r', encoding='utf-8') as f:
-                project_data = json.load(f)
-            
-            # Import project
-            project = self._import_project_data(session, project_data)
-            
-            # Copy files if they exist
-            files_dir = temp_path / "files"
-            if files_dir.exists():
-                project_files_dir = Path(current_app.config["UPLOAD_FOLDER"]) / "projects" / project.slug
-                project_files_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Copy PDF
-                pdf_source = files_dir / "source.pdf"
-                if pdf_source.exists():
-                    pdf_dest = project_files_dir / "pdf" / "source.pdf"
-                    pdf_dest.parent.mkdir(parents=True, exist_ok=True)
-                    pdf_dest.write_bytes(pdf_source.read_bytes())
-                
-                # Copy page images
-                pages_source = files_dir / "pages"
-                if pages_source.exists():
-                    pages_dest = project_files_dir / "pages"
-                    pages_dest.mkdir(parents=True, exist_ok=True)
-                    
-                    for image_file in pages_source.glob("*.jpg"):
-                        image_dest = pages_dest / image_file.name
-                        image_dest.write_bytes(image_file.read_bytes())
-            
-            return {
-                'project': project,
-                'metadata': project_data['metadata']
-            }
-
-
 class BaseView(sqla.ModelView):
     """Base view for models.
 
@@ -623,7 +485,7 @@ class BaseView(sqla.ModelView):
     """
 
     def is_accessible(self):
-        return current_user.is_admin
+        return _is_admin()
 
     def inaccessible_callback(self, name, **kw):
         abort(404)
@@ -633,7 +495,7 @@ class ModeratorBaseView(sqla.ModelView):
     """Base view for models that moderators are allowed to access."""
 
     def is_accessible(self):
-        return current_user.is_moderator
+        return _is_moderator()
 
     def inaccessible_callback(self, name, **kw):
         abort(404)
@@ -658,6 +520,12 @@ class ProjectView(BaseView):
     column_list = ["slug", "display_title", "creator"]
     form_excluded_columns = ["creator", "board", "pages", "created_at", "updated_at"]
 
+    def after_model_change(self, form, model, is_created):
+        q.clear_project_summaries_cache()
+
+    def after_model_delete(self, model):
+        q.clear_project_summaries_cache()
+
 
 class DictionaryView(BaseView):
     column_list = form_columns = ["slug", "title"]
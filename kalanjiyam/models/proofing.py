@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy import Text as Text_
 from sqlalchemy.orm import relationship
 
@@ -209,6 +209,11 @@ class Translation(Base):
     """
 
     __tablename__ = "proof_translations"
+    __table_args__ = (
+        #: Translations are usually looked up by page and revision together.
+        #: (`revision_id` on its own is already indexed by `foreign_key`.)
+        Index("ix_proof_translations_page_id_revision_id", "page_id", "revision_id"),
+    )
 
     #: Primary key.
     id = pk()
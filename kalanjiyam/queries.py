@@ -5,10 +5,18 @@ For simple or adhoc queries, you can just write them in their corresponding view
 """
 
 import functools
+import threading
 
+from cachetools import TTLCache
 from flask import current_app
-from sqlalchemy import create_engine
-from sqlalchemy.orm import load_only, scoped_session, selectinload, sessionmaker
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import (
+    joinedload,
+    load_only,
+    scoped_session,
+    selectinload,
+    sessionmaker,
+)
 
 import kalanjiyam.database as db
 
@@ -28,7 +36,12 @@ except ImportError:
 @functools.cache
 def get_engine():
     database_uri = current_app.config["SQLALCHEMY_DATABASE_URI"]
-    return create_engine(database_uri)
+    options = dict(current_app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {}))
+    if database_uri.startswith("sqlite"):
+        # SQLite uses its own pool classes, which don't accept QueuePool sizing.
+        options.pop("pool_size", None)
+        options.pop("max_overflow", None)
+    return create_engine(database_uri, **options)
 
 
 # functools.cache makes this return value a singleton.
@@ -152,11 +165,97 @@ def projects() -> list[db.Project]:
     return session.query(db.Project).all()
 
 
+def project_summaries() -> list:
+    """Return a summary row for each project, including its page count.
+
+    Each row has `slug`, `display_title`, `author`, `created_at`, and
+    `num_pages`. Counting in the database avoids loading every page.
+    """
+    session = get_session()
+    return (
+        session.query(
+            db.Project.slug,
+            db.Project.display_title,
+            db.Project.author,
+            db.Project.created_at,
+            func.count(db.Page.id).label("num_pages"),
+        )
+        .outerjoin(db.Page, db.Page.project_id == db.Project.id)
+        .group_by(db.Project.id)
+        .all()
+    )
+
+
+#: Project summaries for the admin dashboard. Admins tend to reload the
+#: dashboard repeatedly, and projects change rarely. Views that create, edit,
+#: or delete a project clear the cache; other changes (e.g. page counts) show
+#: up once the entry expires.
+_project_summaries_cache = TTLCache(maxsize=1, ttl=30)
+_project_summaries_lock = threading.Lock()
+
+
+def cached_project_summaries() -> list:
+    """Return `project_summaries()`, cached for a short time."""
+    with _project_summaries_lock:
+        summaries = _project_summaries_cache.get("all")
+    if summaries is None:
+        summaries = project_summaries()
+        with _project_summaries_lock:
+            _project_summaries_cache["all"] = summaries
+    return summaries
+
+
+def clear_project_summaries_cache():
+    """Clear the cached project summaries after a project is added or changed."""
+    with _project_summaries_lock:
+        _project_summaries_cache.clear()
+
+
 def project(slug: str) -> db.Project | None:
     session = get_session()
     return session.query(db.Project).filter(db.Project.slug == slug).first()
 
 
+def project_with_pages_and_revisions(slug: str) -> db.Project | None:
+    """Fetch a project along with all of its pages and their revisions.
+
+    Use this when the caller walks `project.pages` and `page.revisions`, which
+    would otherwise trigger one lazy query per page.
+    """
+    session = get_session()
+    return (
+        session.query(db.Project)
+        .options(selectinload(db.Project.pages).selectinload(db.Page.revisions))
+        .filter_by(slug=slug)
+        .one_or_none()
+    )
+
+
+def project_for_export(slug: str) -> db.Project | None:
+    """Fetch a project along with everything that we include in an export.
+
+    This loads pages, the discussion board, and their related objects in a
+    fixed number of queries. Revisions and translations are not loaded here,
+    since the export reads them as flat rows instead.
+    """
+    session = get_session()
+    return (
+        session.query(db.Project)
+        .options(
+            joinedload(db.Project.creator),
+            selectinload(db.Project.pages).joinedload(db.Page.status),
+            joinedload(db.Project.board)
+            .selectinload(db.Board.threads)
+            .options(
+                joinedload(db.Thread.author),
+                selectinload(db.Thread.posts).joinedload(db.Post.author),
+            ),
+        )
+        .filter_by(slug=slug)
+        .one_or_none()
+    )
+
+
 def thread(*, id: int) -> db.Thread | None:
     session = get_session()
     return session.query(db.Thread).filter_by(id=id).first()
@@ -0,0 +1,325 @@
+"""Diagnostic and cleanup tools for page translations.
+
+All subcommands share one app context (and hence one database engine), and
+the group is chained so that several checks can run in a single process:
+
+    python -m kalanjiyam.scripts.translation_tools check-all check-valid
+"""
+
+import sys
+from collections import defaultdict
+
+import click
+from sqlalchemy import func
+from sqlalchemy.orm import defer, load_only
+
+from config import create_config_only_app
+from kalanjiyam import database as db
+from kalanjiyam import queries as q
+
+#: The project that we inspect by default.
+DEFAULT_PROJECT_SLUG = "aryabhatiya-by-kripa-shankar-shukla"
+
+#: Rows to fetch, and report lines to buffer, at a time in `cleanup_failed`.
+CLEANUP_BATCH_SIZE = 500
+
+
+def _write_lines(lines: list[str]):
+    """Write buffered report lines to stdout with one call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+@click.group(chain=True)
+@click.option("--env", default="development", help="the config to load")
+@click.pass_context
+def cli(ctx, env):
+    app = create_config_only_app(env, one_shot=True)
+    ctx.with_resource(app.app_context())
+
+
+@cli.command()
+@click.option("--project", "slug", default=DEFAULT_PROJECT_SLUG)
+def check_coverage(slug):
+    """Report which pages of a project have translations."""
+    session = q.get_session()
+
+    project = q.project_with_pages_and_revisions(slug)
+    if not project:
+        raise click.ClickException("Project not found")
+
+    print(f"Project: {project.display_title}")
+    print(f"Total pages: {len(project.pages)}")
+
+    print("\nChecking translation coverage:")
+    print("-" * 50)
+
+    latest_rev_by_page = {
+        p.id: p.revisions[-1].id for p in project.pages if p.revisions
+    }
+    page_ids = latest_rev_by_page.keys()
+    latest_rev_ids = latest_rev_by_page.values()
+
+    # Fetch the set of pages that have at least one translation for their
+    # latest revision with a single SELECT DISTINCT.
+    translated_pages = {
+        page_id
+        for (page_id,) in session.query(db.Translation.page_id)
+        .filter(
+            db.Translation.page_id.in_(page_ids),
+            db.Translation.revision_id.in_(latest_rev_ids),
+        )
+        .distinct()
+    }
+    pages_with_revisions = len(latest_rev_by_page)
+    pages_with_translations = len(translated_pages)
+    pages_without_translations = pages_with_revisions - pages_with_translations
+
+    # Fetch translations for all pages in one query instead of one per page,
+    # then bucket them by (page_id, revision_id). We print only metadata, so
+    # skip the (potentially large) content column.
+    rows = (
+        session.query(db.Translation)
+        .options(
+            load_only(
+                db.Translation.id,
+                db.Translation.source_language,
+                db.Translation.target_language,
+                db.Translation.translation_engine,
+                db.Translation.page_id,
+                db.Translation.revision_id,
+            )
+        )
+        .filter(
+            db.Translation.page_id.in_(translated_pages),
+            db.Translation.revision_id.in_(latest_rev_ids),
+        )
+        .all()
+    )
+    by_page = defaultdict(list)
+    for t in rows:
+        by_page[(t.page_id, t.revision_id)].append(t)
+
+    # Buffer the per-page report and write it once instead of one print per line.
+    lines = []
+    for page in project.pages:
+        if page.revisions:
+            if page.id in translated_pages:
+                translations = by_page[(page.id, latest_rev_by_page[page.id])]
+                lines.append(
+                    f"Page {page.slug}: ✅ Has {len(translations)} translation(s)"
+                )
+                for t in translations:
+                    lines.append(
+                        f"  - {t.source_language}->{t.target_language} ({t.translation_engine})"
+                    )
+            else:
+                lines.append(f"Page {page.slug}: ❌ No translations")
+    _write_lines(lines)
+
+    print("\n" + "=" * 50)
+    print("SUMMARY:")
+    print(f"Pages with revisions: {pages_with_revisions}")
+    print(f"Pages with translations: {pages_with_translations}")
+    print(f"Pages without translations: {pages_without_translations}")
+    if pages_with_revisions:
+        percent = pages_with_translations / pages_with_revisions * 100
+        print(
+            f"Translation coverage: {pages_with_translations}/{pages_with_revisions} ({percent:.1f}%)"
+        )
+
+
+@cli.command()
+def check_all():
+    """Print the number of translations and a few samples."""
+    session = q.get_session()
+
+    total = session.query(func.count(db.Translation.id)).scalar()
+    print(f"Total translations: {total}")
+    samples = session.query(db.Translation).order_by(db.Translation.id).limit(5).all()
+
+    if samples:
+        for t in samples:
+            print(
+                f"Translation {t.id}: {t.source_language}->{t.target_language} for page {t.page_id}, revision {t.revision_id}"
+            )
+            print(f"  Content preview: {t.content[:100]}...")
+    else:
+        print("No translations found in database")
+
+
+@cli.command()
+def check_valid():
+    """Print translation counts by language pair and a few valid samples."""
+    session = q.get_session()
+
+    # Let the database count translations per language pair.
+    pair_counts = (
+        session.query(
+            db.Translation.source_language,
+            db.Translation.target_language,
+            func.count(db.Translation.id),
+        )
+        .group_by(db.Translation.source_language, db.Translation.target_language)
+        .all()
+    )
+    print(f"Total translations: {sum(count for _, _, count in pair_counts)}")
+
+    print("\nTranslations by language pair:")
+    for source_language, target_language, count in pair_counts:
+        print(f"  {source_language}->{target_language}: {count}")
+
+    # Show a few examples of valid translations
+    print("\nSample valid translations:")
+    sample_rows = (
+        session.query(db.Translation, db.Revision.content)
+        .join(db.Revision, db.Revision.id == db.Translation.revision_id)
+        .order_by(db.Translation.id)
+        .limit(5)
+    )
+    for translation, revision_content in sample_rows:
+        # Check if this is a valid translation (not identical to original)
+        if translation.content.strip() != revision_content.strip():
+            print(
+                f"  Translation {translation.id}: {translation.source_language}->{translation.target_language}"
+            )
+            print(
+                f"    Page: {translation.page_id}, Revision: {translation.revision_id}"
+            )
+            print(f"    Original preview: {revision_content[:50]}...")
+            print(f"    Translated preview: {translation.content[:50]}...")
+            print()
+
+
+@cli.command()
+@click.option(
+    "--all",
+    "delete_all",
+    is_flag=True,
+    help="delete every translation, not just failed ones",
+)
+def cleanup_failed(delete_all):
+    """Delete failed translations.
+
+    A translation has failed if its content is identical to the content of the
+    revision it was made from.
+    """
+    session = q.get_session()
+
+    # Stream all translations in batches, joined with the content of the
+    # revision they were made from. We compare every translation's content
+    # against its revision, so load both in the same query.
+    translations = (
+        session.query(db.Translation, db.Revision.content)
+        .join(db.Revision, db.Revision.id == db.Translation.revision_id)
+        .execution_options(stream_results=True)
+        .yield_per(CLEANUP_BATCH_SIZE)
+    )
+
+    failed_ids = []
+    # Buffer the per-row report and write it a batch at a time instead of one
+    # print per line. Writing per batch keeps memory bounded like `yield_per`.
+    lines = []
+    for translation, revision_content in translations:
+        if len(lines) >= CLEANUP_BATCH_SIZE:
+            _write_lines(lines)
+            lines = []
+        if revision_content is not None:
+            # Check if translation content is identical to original content (indicating failed translation)
+            if delete_all or translation.content.strip() == revision_content.strip():
+                lines.append(
+                    f"Found failed translation {translation.id}: {translation.source_language}->{translation.target_language}"
+                )
+                lines.append(
+                    f"  Page: {translation.page_id}, Revision: {translation.revision_id}"
+                )
+                lines.append(f"  Content preview: {translation.content[:100]}...")
+
+                failed_ids.append(translation.id)
+
+    _write_lines(lines)
+    print(
+        f"Total translations: {session.query(func.count(db.Translation.id)).scalar()}"
+    )
+    if failed_ids:
+        # End the read transaction so that each chunk below commits on its own.
+        session.commit()
+        # Delete with one bulk statement per chunk rather than one DELETE per
+        # row. Each chunk is its own transaction, which keeps the IN (...) list
+        # under DB parameter limits and means that a failure rolls back only
+        # the current chunk.
+        for i in range(0, len(failed_ids), 1000):
+            chunk = failed_ids[i : i + 1000]
+            with session.begin():
+                session.query(db.Translation).filter(
+                    db.Translation.id.in_(chunk)
+                ).delete(synchronize_session=False)
+        print(f"\nCleaned up {len(failed_ids)} failed translations")
+    else:
+        print("No failed translations found")
+
+    # Show remaining translations
+    remaining = session.query(func.count(db.Translation.id)).scalar()
+    print(f"Remaining translations: {remaining}")
+
+
+@cli.command()
+@click.option("--project", "slug", default=DEFAULT_PROJECT_SLUG)
+def debug(slug):
+    """Print translation details for the first page of a project."""
+    session = q.get_session()
+
+    project = q.project_with_pages_and_revisions(slug)
+    if not project:
+        print("Project not found")
+        return
+
+    print(f"Project: {project.display_title}")
+    if not project.pages:
+        print("No pages found for this project")
+        return
+
+    page = project.pages[0]
+    print(f"Page: {page.slug}")
+    print(f"Page ID: {page.id}")
+
+    if not page.revisions:
+        print("No revisions found for this page")
+        return
+
+    latest_revision = page.revisions[-1]
+    print(f"Latest revision ID: {latest_revision.id}")
+
+    # Check for translations
+    translation = (
+        session.query(db.Translation)
+        .filter_by(page_id=page.id, revision_id=latest_revision.id)
+        .first()
+    )
+
+    if translation:
+        print(f"Found translation: {translation.id}")
+        print(
+            f"Source: {translation.source_language} -> Target: {translation.target_language}"
+        )
+        print(f"Engine: {translation.translation_engine}")
+        print(f"Content preview: {translation.content[:200]}...")
+    else:
+        print("No translation found for this page/revision")
+
+        # Check if there are any translations for this page
+        all_translations = (
+            session.query(db.Translation)
+            .options(defer(db.Translation.content))
+            .filter_by(page_id=page.id)
+            .all()
+        )
+        print(f"Total translations for this page: {len(all_translations)}")
+        for t in all_translations:
+            print(
+                f"  Translation {t.id}: rev {t.revision_id}, {t.source_language}->{t.target_language}"
+            )
+
+
+if __name__ == "__main__":
+    cli()
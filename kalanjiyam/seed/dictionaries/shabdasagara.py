@@ -2,7 +2,7 @@
 """Add the Shabda-sagara dictionary to the database."""
 
 from kalanjiyam.seed.utils.cdsl_utils import create_from_scratch, iter_entries_as_strings
-from kalanjiyam.seed.utils.data_utils import create_db, fetch_bytes, unzip_and_read
+from kalanjiyam.seed.utils.data_utils import create_db, fetch_bytes, unzip_and_open
 from kalanjiyam.utils.dict_utils import standardize_key
 
 ZIP_URL = (
@@ -10,8 +10,8 @@ ZIP_URL = (
 )
 
 
-def shs_generator(xml_blob: str):
-    for key, value in iter_entries_as_strings(xml_blob):
+def shs_generator(xml_stream):
+    for key, value in iter_entries_as_strings(xml_stream):
         key = standardize_key(key)
         yield key, value
 
@@ -24,15 +24,15 @@ def run():
 
     print("Fetching Shabda-Sagara data from CDSL ...")
     zip_bytes = fetch_bytes(ZIP_URL)
-    xml_blob = unzip_and_read(zip_bytes, "xml/shs.xml")
 
     print("Adding items to database ...")
-    create_from_scratch(
-        engine,
-        slug="shabdasagara",
-        title=title,
-        generator=shs_generator(xml_blob),
-    )
+    with unzip_and_open(zip_bytes, "xml/shs.xml") as xml_stream:
+        create_from_scratch(
+            engine,
+            slug="shabdasagara",
+            title=title,
+            generator=shs_generator(xml_stream),
+        )
 
     print("Done.")
     return True
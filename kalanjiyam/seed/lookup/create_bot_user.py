@@ -1,6 +1,7 @@
 import logging
 import os
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from kalanjiyam import consts
@@ -27,8 +28,10 @@ def run():
     engine = create_db()
     logging.debug("Creating bot user ...")
     with Session(engine) as session:
-        user = session.query(db.User).filter_by(username=consts.BOT_USERNAME).first()
-        if not user:
+        user_id = session.scalar(
+            select(db.User.id).where(db.User.username == consts.BOT_USERNAME)
+        )
+        if not user_id:
             _create_bot_user(session)
     logging.debug("Done.")
 
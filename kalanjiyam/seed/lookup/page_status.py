@@ -1,11 +1,19 @@
 import logging
 
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 import kalanjiyam.database as db
 from kalanjiyam.enums import SitePageStatus
 from kalanjiyam.seed.utils.data_utils import create_db
 
+#: Dialect-specific `insert` constructs that support ON CONFLICT DO NOTHING.
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
 
 def get_default_id():
     """Used in the `add_page_statuses` migration."""
@@ -18,16 +26,27 @@ def run(engine=None):
     """Create page statuses iff they don't exist already."""
     engine = engine or create_db()
     logging.debug("Creating PageStatus rows ...")
+    upsert_insert = _UPSERT_INSERTS.get(engine.dialect.name)
     with Session(engine) as session:
-        statuses = session.query(db.PageStatus).all()
-        existing_names = {s.name for s in statuses}
-        new_names = {n.value for n in SitePageStatus if n not in existing_names}
-
-        if new_names:
-            for name in new_names:
-                status = db.PageStatus(name=name)
-                session.add(status)
-            session.commit()
+        if upsert_insert is not None:
+            # Let the database skip statuses that already exist, so that
+            # seeding is a single statement with no prior SELECT.
+            stmt = (
+                upsert_insert(db.PageStatus)
+                .values([{"name": n.value} for n in SitePageStatus])
+                .on_conflict_do_nothing(index_elements=["name"])
+            )
+            session.execute(stmt)
+        else:
+            existing_names = set(session.scalars(select(db.PageStatus.name)))
+            new_names = [
+                n.value for n in SitePageStatus if n.value not in existing_names
+            ]
+            if new_names:
+                session.execute(
+                    insert(db.PageStatus), [{"name": name} for name in new_names]
+                )
+        session.commit()
     logging.debug("Done.")
 
 
@@ -14,14 +14,26 @@ import kalanjiyam.database as db
 BATCH_SIZE = 10000
 
 
-def iter_entries_as_xml(blob: str):
-    """Iterate over CDSL-style dictionary XML."""
+def iter_entries_as_xml(source):
+    """Iterate over CDSL-style dictionary XML.
+
+    :param source: the XML payload as bytes, or a binary file object to stream
+        it from. Streaming avoids holding the full document in memory.
+    """
     tag_str = (
         "H1 H1A H1B H1C H1E H2 H2A H2B H2C H2E H3 H3A H3B H3C H3E H4 H4A H4B H4C H4E"
     )
     allowed_tags = set(tag_str.split())
 
-    for _, elem in ET.iterparse(io.BytesIO(blob), events=["end"]):
+    if isinstance(source, (bytes, str)):
+        source = io.BytesIO(source)
+
+    root = None
+    for event, elem in ET.iterparse(source, events=["start", "end"]):
+        if event == "start":
+            if root is None:
+                root = elem
+            continue
         if elem.tag not in allowed_tags:
             continue
 
@@ -33,11 +45,14 @@ def iter_entries_as_xml(blob: str):
                 break
         yield key, elem
 
+        # Drop the entry and any earlier (already cleared) entries from the
+        # tree so that memory use stays flat over the whole document.
         elem.clear()
+        root.clear()
 
 
-def iter_entries_as_strings(blob: str):
-    for key, elem in iter_entries_as_xml(blob):
+def iter_entries_as_strings(source):
+    for key, elem in iter_entries_as_xml(source):
         value = ET.tostring(elem, encoding="utf-8")
 
         assert key and value
@@ -84,12 +99,16 @@ def create_from_scratch(engine, slug: str, title: str, generator):
 
     entries = db.DictionaryEntry.__table__
     ins = entries.insert()
-    with engine.connect() as conn:
+    # Insert every batch in one transaction. Each `execute` call sends the
+    # whole batch as an executemany, and committing once at the end avoids a
+    # commit (and, on SQLite, an fsync) per batch.
+    with engine.begin() as conn:
         for i, batch in enumerate(batches(generator, BATCH_SIZE)):
-            items = []
-            for key, value in batch:
-                items.append(
-                    {"dictionary_id": dictionary.id, "key": key, "value": value}
-                )
-            conn.execute(ins, items)
-            logging.info(BATCH_SIZE * (i + 1))
+            conn.execute(
+                ins,
+                [
+                    {"dictionary_id": dictionary_id, "key": key, "value": value}
+                    for key, value in batch
+                ],
+            )
+            logging.info(BATCH_SIZE * i + len(batch))
@@ -2,6 +2,7 @@ import hashlib
 import io
 import os
 import zipfile
+from contextlib import contextmanager
 
 import requests
 from sqlalchemy import create_engine
@@ -75,6 +76,21 @@ def unzip_and_read(zip_bytes: bytes, filepath: str) -> str:
             return f.read()
 
 
+@contextmanager
+def unzip_and_open(zip_bytes: bytes, filepath: str):
+    """Open a ZIP archive and stream binary data from one of its files.
+
+    Unlike `unzip_and_read`, this decompresses the file as it is read, so the
+    full uncompressed file is never held in memory.
+
+    :param zip_bytes: the ZIP file payload
+    :param filepath: the filepath within the ZIP file that we should read
+    """
+    with zipfile.ZipFile(io.BytesIO(zip_bytes), "r") as ref:
+        with ref.open(filepath) as f:
+            yield f
+
+
 def create_db():
     """Create a SQLAlchemy database engine."""
     flask_env = os.environ.get("FLASK_ENV", "development")
@@ -25,6 +25,7 @@ except ImportError:
     pass
 
 from celery import Celery
+from celery.signals import worker_process_init
 
 # For context on why we use Redis for both the backend and the broker, see the
 # "Background tasks with Celery" doc.
@@ -59,3 +60,33 @@ app.conf.update(
     task_default_exchange='default',
     task_default_routing_key='default',
 )
+
+
+@worker_process_init.connect
+def _reset_engine_after_fork(**kwargs):
+    """Don't reuse database connections inherited from the parent process.
+
+    Tasks reuse one app and one engine per worker process (see
+    `create_config_only_app` and `queries.get_engine`), so we only need to
+    make sure that a forked worker starts with a clean engine.
+    """
+    from kalanjiyam.queries import get_engine
+
+    if get_engine.cache_info().currsize:
+        get_engine().dispose(close=False)
+
+
+@worker_process_init.connect
+def _warm_up_ocr_models(**kwargs):
+    """Load Surya's models when a worker starts, if we keep them loaded.
+
+    Loading (and compiling) the models takes far longer than Celery's
+    `worker_proc_alive_timeout`, so we load them on a background thread and
+    let the child report that it is up right away. A task that arrives first
+    waits for the same load. See `surya_ocr.warmup`.
+    """
+    import threading
+
+    from kalanjiyam.utils import surya_ocr
+
+    threading.Thread(target=surya_ocr.warmup, name="surya-warmup", daemon=True).start()
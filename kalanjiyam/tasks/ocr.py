@@ -9,7 +9,7 @@ from kalanjiyam import database as db
 from kalanjiyam import queries as q
 from kalanjiyam.enums import SitePageStatus
 from kalanjiyam.tasks import app
-from kalanjiyam.utils import google_ocr
+from kalanjiyam.utils import bbox_serde
 from kalanjiyam.utils.assets import get_page_image_filepath
 from kalanjiyam.utils.revisions import add_revision
 from config import create_config_only_app
@@ -63,24 +63,12 @@ def _run_ocr_for_page_inner(
         if page is None:
             raise ValueError(f'Page "{page_slug}" not found in project "{project_slug}".')
 
-        # Use the appropriate serialize function based on engine
-        if engine == 'google':
-            page.ocr_bounding_boxes = google_ocr.serialize_bounding_boxes(
-                ocr_response.bounding_boxes
-            )
-        elif engine == 'surya':
-            from kalanjiyam.utils.surya_ocr import serialize_bounding_boxes
-            page.ocr_bounding_boxes = serialize_bounding_boxes(
-                ocr_response.bounding_boxes
-            )
-        else:
-            from kalanjiyam.utils.tesseract_ocr import serialize_bounding_boxes
-            page.ocr_bounding_boxes = serialize_bounding_boxes(
-                ocr_response.bounding_boxes
-            )
+        page.ocr_bounding_boxes = bbox_serde.pack(ocr_response.bounding_boxes)
         
+        # `add_revision` commits this change along with the new revision.
+        # Committing here too would cost a round trip and expire `page`, which
+        # `add_revision` would then have to reload.
         session.add(page)
-        session.commit()
 
         summary = f"Run OCR ({engine}, {language})"
         try:
@@ -141,18 +129,25 @@ def run_ocr_for_project(
     """
     flask_app = create_config_only_app(app_env)
     with flask_app.app_context():
-        unedited_pages = [p for p in project.pages if p.version == 0]
-
-    if unedited_pages:
+        # Tasks need only the page slug, so don't load full `Page` objects.
+        session = q.get_session()
+        unedited_page_slugs = [
+            slug
+            for (slug,) in session.query(db.Page.slug)
+            .filter(db.Page.project_id == project.id, db.Page.version == 0)
+            .order_by(db.Page.order)
+        ]
+
+    if unedited_page_slugs:
         tasks = group(
             run_ocr_for_page.s(
                 app_env=app_env,
                 project_slug=project.slug,
-                page_slug=p.slug,
+                page_slug=page_slug,
                 engine=engine,
                 language=language,
             )
-            for p in unedited_pages
+            for page_slug in unedited_page_slugs
         )
         ret = tasks.apply_async()
         # Save the result so that we can poll for it later. If we don't do
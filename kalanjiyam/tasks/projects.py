@@ -1,6 +1,8 @@
 """Background tasks for proofing projects."""
 
 import logging
+import tempfile
+import zipfile
 from pathlib import Path
 
 # NOTE: `fitz` is the internal package name for PyMuPDF. PyPI hosts another
@@ -13,6 +15,7 @@ from kalanjiyam import database as db
 from kalanjiyam import queries as q
 from kalanjiyam.tasks import app
 from kalanjiyam.tasks.utils import CeleryTaskStatus, TaskStatus
+from kalanjiyam.utils import project_import
 from config import create_config_only_app
 
 
@@ -145,3 +148,123 @@ def create_project(
         creator_id=creator_id,
         task_status=task_status,
     )
+
+
+def import_projects_inner(
+    *,
+    zip_path: str,
+    app_environment: str,
+    task_status: TaskStatus,
+):
+    """Import the projects in an export archive and delete the archive.
+
+    A single-project archive is imported as a whole or not at all. For an
+    all-projects archive, projects that fail to import (for example, because
+    their slug is taken) are skipped.
+
+    :param zip_path: local path to the uploaded archive.
+    :param app_environment: the app environment, e.g. `"development"`.
+    :param task_status: tracks progress on the task.
+    """
+    logging.info(f"Received import task for path {zip_path}.")
+
+    app = create_config_only_app(app_environment)
+    try:
+        with app.app_context(), tempfile.TemporaryDirectory() as temp_dir:
+            extract_dir = Path(temp_dir)
+            buffering = project_import.ARCHIVE_BUFFER_SIZE
+            with open(zip_path, "rb", buffering=buffering) as f:
+                with zipfile.ZipFile(f) as zipf:
+                    zipf.extractall(extract_dir)
+
+            session = q.get_session()
+            project_file = extract_dir / project_import.PROJECT_DATA_FILE
+            all_projects_file = extract_dir / project_import.ALL_PROJECTS_DATA_FILE
+            if project_file.exists():
+                task_status.progress(0, 1)
+                project_data = project_import.read_project_data(project_file)
+                slug = project_data["metadata"]["slug"]
+                try:
+                    project_import.import_project_data(session, project_data)
+                    session.commit()
+                except Exception:
+                    session.rollback()
+                    raise
+
+                # Copy files only once the project is saved, so that a failed
+                # import leaves no orphaned files behind.
+                files_dir = extract_dir / "files"
+                if files_dir.exists():
+                    upload_folder = Path(app.config["UPLOAD_FOLDER"])
+                    project_dir = upload_folder / "projects" / slug
+                    project_import.copy_project_files(files_dir, project_dir)
+
+                task_status.success(1, slug)
+
+            elif all_projects_file.exists():
+                all_projects_data = project_import.read_project_data(all_projects_file)
+                projects_data = all_projects_data["projects"]
+                total = len(projects_data)
+
+                # Check for existing projects with one query up front.
+                incoming_slugs = [p["metadata"]["slug"] for p in projects_data]
+                existing_slugs = {
+                    slug
+                    for (slug,) in session.query(db.Project.slug).filter(
+                        db.Project.slug.in_(incoming_slugs)
+                    )
+                }
+
+                num_imported = 0
+                failures = []
+                for i, project_data in enumerate(projects_data):
+                    task_status.progress(i, total)
+                    slug = project_data["metadata"]["slug"]
+                    # Use a savepoint so that a failed project leaves nothing
+                    # behind.
+                    savepoint = session.begin_nested()
+                    try:
+                        project_import.import_project_data(
+                            session, project_data, existing_slugs=existing_slugs
+                        )
+                        savepoint.commit()
+                        # Only now is the slug taken. If the project had
+                        # failed, a later entry could still use the slug.
+                        existing_slugs.add(slug)
+                        num_imported += 1
+                    except Exception as e:
+                        savepoint.rollback()
+                        logging.warning(f"Failed to import project {slug}: {e}")
+                        failures.append({"slug": slug, "error": str(e)})
+                    # Everything so far has been flushed, so drop it from the
+                    # identity map. Otherwise the session holds every object
+                    # from every project until the final commit.
+                    session.expunge_all()
+
+                try:
+                    session.commit()
+                except Exception:
+                    session.rollback()
+                    raise
+                logging.info(f"Imported {num_imported} of {total} projects.")
+                task_status.success(num_imported, None, failures)
+
+            else:
+                raise ValueError("No project data found in ZIP file")
+    finally:
+        Path(zip_path).unlink(missing_ok=True)
+
+
+@app.task(bind=True)
+def import_projects(self, *, zip_path: str, app_environment: str):
+    """Import the projects in an export archive.
+
+    For argument details, see `import_projects_inner`.
+    """
+    task_status = CeleryTaskStatus(self)
+    import_projects_inner(
+        zip_path=zip_path,
+        app_environment=app_environment,
+        task_status=task_status,
+    )
+    return task_status.result
@@ -8,7 +8,7 @@ from kalanjiyam import consts
 from kalanjiyam import database as db
 from kalanjiyam import queries as q
 from kalanjiyam.tasks import app
-from kalanjiyam.utils.translation_engine import translate_text, segment_text_for_translation
+from kalanjiyam.utils.translation_engine import translate_texts_batch, segment_text_for_translation
 from config import create_config_only_app
 
 LOG = logging.getLogger(__name__)
@@ -42,10 +42,16 @@ def _run_translation_for_page_inner(
 
         # Get the revision to translate
         if revision_id is None:
-            # Use the latest revision
-            if not page.revisions:
+            # Use the latest revision. Fetch just that one, rather than every
+            # revision of the page.
+            revision = (
+                session.query(db.Revision)
+                .filter_by(page_id=page.id)
+                .order_by(db.Revision.created.desc(), db.Revision.id.desc())
+                .first()
+            )
+            if revision is None:
                 raise ValueError(f'No revisions found for page "{page_slug}".')
-            revision = page.revisions[-1]  # Latest revision
         else:
             revision = session.query(db.Revision).filter_by(id=revision_id).first()
             if not revision or revision.page_id != page.id:
@@ -61,32 +67,30 @@ def _run_translation_for_page_inner(
         ).first()
 
         if existing_translation:
-            LOG.info(f"Translation already exists for {project_slug}/{page_slug} ({source_lang}->{target_lang})")
+            LOG.info("Translation already exists for %s/%s (%s->%s)", project_slug, page_slug, source_lang, target_lang)
             return existing_translation.id
 
         # Segment text for translation
         text_segments = segment_text_for_translation(revision.content, max_length=1000)
         
-        # Translate each segment
-        translated_segments = []
+        # Translate all non-empty segments with one batched engine call, then
+        # scatter the results back so that blank segments keep their place.
+        translated_segments = list(text_segments)
+        non_empty = [(i, s) for i, s in enumerate(text_segments) if s.strip()]
         translation_failed = False
-        
-        for segment in text_segments:
-            if segment.strip():
-                try:
-                    translation_response = translate_text(
-                        segment, 
-                        source_lang, 
-                        target_lang, 
-                        engine
-                    )
-                    translated_segments.append(translation_response.translated_text)
-                except Exception as e:
-                    LOG.error(f"Translation failed for segment: {e}")
-                    translation_failed = True
-                    break  # Stop translation if any segment fails
-            else:
-                translated_segments.append(segment)
+
+        try:
+            responses = translate_texts_batch(
+                [s for _, s in non_empty],
+                source_lang,
+                target_lang,
+                engine
+            )
+            for (i, _), response in zip(non_empty, responses):
+                translated_segments[i] = response.translated_text
+        except Exception as e:
+            LOG.error("Translation failed for page segments: %s", e)
+            translation_failed = True
 
         # Only create translation record if translation was successful
         if not translation_failed:
@@ -106,12 +110,16 @@ def _run_translation_for_page_inner(
             )
             
             session.add(translation)
+            # Read the new ID before committing. After the commit, accessing
+            # `translation.id` would refresh the whole row with another SELECT.
+            session.flush()
+            translation_id = translation.id
             session.commit()
             
-            LOG.info(f"Translation completed for {project_slug}/{page_slug} ({source_lang}->{target_lang})")
-            return translation.id
+            LOG.info("Translation completed for %s/%s (%s->%s)", project_slug, page_slug, source_lang, target_lang)
+            return translation_id
         else:
-            LOG.warning(f"Translation failed for {project_slug}/{page_slug} ({source_lang}->{target_lang}) - no translation record created")
+            LOG.warning("Translation failed for %s/%s (%s->%s) - no translation record created", project_slug, page_slug, source_lang, target_lang)
             return None
 
 
@@ -139,7 +147,7 @@ def run_translation_for_page(
             revision_id,
         )
     except Exception as e:
-        LOG.error(f"Translation task failed for {project_slug}/{page_slug}: {e}")
+        LOG.error("Translation task failed for %s/%s: %s", project_slug, page_slug, e)
         raise
 
 
@@ -164,12 +172,50 @@ def run_translation_for_project(
     :param target_lang: Target language code
     :param engine: Translation engine to use
     :param revision_id: Specific revision ID to translate (optional)
-    :return: the Celery result, or ``None`` if no tasks were run.
+    :return: the Celery result, or ``None`` if no pages need translation.
     """
     flask_app = create_config_only_app(app_env)
     with flask_app.app_context():
-        # Get pages that have revisions
-        pages_with_revisions = [p for p in project.pages if p.revisions]
+        session = q.get_session()
+        # Tasks need only the page slug, so don't load full `Page` objects.
+        pages = (
+            session.query(db.Page.id, db.Page.slug)
+            .filter(db.Page.project_id == project.id)
+            .order_by(db.Page.order)
+            .all()
+        )
+        page_ids = [p.id for p in pages]
+
+        # Find each page's latest revision with one column-only query rather
+        # than loading every page's revisions.
+        latest_revision_ids = {}
+        for page_id, rev_id in (
+            session.query(db.Revision.page_id, db.Revision.id)
+            .filter(db.Revision.page_id.in_(page_ids))
+            .order_by(db.Revision.created, db.Revision.id)
+        ):
+            latest_revision_ids[page_id] = rev_id
+
+        # Skip pages whose latest revision already has this translation. Each
+        # page task would otherwise run its own existence check just to
+        # return early.
+        existing = set()
+        if revision_id is None:
+            existing = set(
+                session.query(db.Translation.page_id, db.Translation.revision_id)
+                .filter(
+                    db.Translation.page_id.in_(page_ids),
+                    db.Translation.source_language == source_lang,
+                    db.Translation.target_language == target_lang,
+                    db.Translation.translation_engine == engine,
+                )
+            )
+        pages_with_revisions = [
+            p
+            for p in pages
+            if p.id in latest_revision_ids
+            and (p.id, latest_revision_ids[p.id]) not in existing
+        ]
 
     if pages_with_revisions:
         tasks = group(
@@ -226,22 +272,31 @@ def run_translation_for_revision(
         )
 
 
+#: Timeout for stored translation tasks, in seconds.
+TRANSLATION_TASK_TTL = 86400
+
+
+def translation_task_index_key(task_id) -> str:
+    """Return the Redis key that maps a task ID to its `translation_task:*` key.
+
+    This lets us find a task's key without scanning every key. Each entry is
+    its own key so that it expires along with the task it points to.
+    """
+    return f"translation_task_id:{task_id}"
+
+
 def _clear_translation_task_from_redis(task_id):
     """Clear translation task from Redis when it completes or fails."""
     try:
         import redis
         import os
-        import json
         
         redis_client = redis.Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
         
-        # Find the task key by scanning Redis keys
-        for key in redis_client.scan_iter(match="translation_task:*"):
-            task_info = redis_client.get(key)
-            if task_info:
-                task_data = json.loads(task_info)
-                if task_data.get('task_id') == task_id:
-                    redis_client.delete(key)
-                    break
+        # Look up the task key in the index, then delete both with one command.
+        index_key = translation_task_index_key(task_id)
+        key = redis_client.get(index_key)
+        if key:
+            redis_client.delete(key, index_key)
     except Exception as e:
-        LOG.warning(f"Error clearing translation task from Redis: {e}") 
\ No newline at end of file
+        LOG.warning("Error clearing translation task from Redis: %s", e)
@@ -18,9 +18,12 @@ class TaskStatus:
         """
         raise NotImplementedError
 
-    def success(self, num_pages: int, slug: str):
+    def success(self, num_pages: int, slug: str, failures: list | None = None):
         """Mark the task as a success.
 
+        :param failures: optional list of `{"slug": ..., "error": ...}` dicts
+            for items that were skipped.
+
         # FIXME(arun): make this API more generic.
         """
         raise NotImplementedError
@@ -35,6 +38,10 @@ class CeleryTaskStatus(TaskStatus):
 
     def __init__(self, task):
         self.task = task
+        #: The meta from `success`, if any. Celery overwrites the task's meta
+        #: with its return value, so tasks that need the meta to survive
+        #: should return this.
+        self.result = None
 
     def progress(self, current: int, total: int):
         """Update the task's progress.
@@ -47,12 +54,15 @@ class CeleryTaskStatus(TaskStatus):
             state="PROGRESS", meta={"current": current, "total": total}
         )
 
-    def success(self, num_pages: int, slug: str):
+    def success(self, num_pages: int, slug: str, failures: list | None = None):
         """Mark the task as a success."""
-        self.task.update_state(
-            state=states.SUCCESS,
-            meta={"current": num_pages, "total": num_pages, "slug": slug},
-        )
+        self.result = {
+            "current": num_pages,
+            "total": num_pages,
+            "slug": slug,
+            "failures": failures or [],
+        }
+        self.task.update_state(state=states.SUCCESS, meta=self.result)
 
     def failure(self, message: str):
         """Mark the task as failed."""
@@ -65,8 +75,10 @@ class LocalTaskStatus(TaskStatus):
     def progress(self, current: int, total: int):
         logging.info(f"{current} / {total} complete")
 
-    def success(self, num_pages: int, slug: str):
+    def success(self, num_pages: int, slug: str, failures: list | None = None):
         logging.info(f"Succeeded. Project is at {slug}.")
+        for failure in failures or []:
+            logging.info(f"Skipped {failure['slug']}: {failure['error']}")
 
     def failure(self, message: str):
         logging.info(f"Failed. ({message})")
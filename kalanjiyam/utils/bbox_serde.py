@@ -0,0 +1,39 @@
+"""Serialization for the OCR bounding boxes stored on each page.
+
+We store boxes as a compact JSON array of `[x1, y1, x2, y2, text]` rows.
+`orjson` packs and unpacks these in C, and the result stays plain text so that
+it round-trips through project export archives unchanged.
+
+Older pages may hold one of two legacy formats, which `unpack` still reads:
+
+- TSV with one `x1 y1 x2 y2 text` row per line (Google and Tesseract OCR)
+- a JSON array of `{"x1": ..., "text": ...}` objects (Surya OCR)
+"""
+
+import orjson
+
+#: A bounding box stored as a 5-tuple (x1, y1, x2, y2, text).
+Box = tuple[int, int, int, int, str]
+
+
+def pack(boxes: list[Box]) -> str:
+    """Serialize a list of bounding boxes."""
+    return orjson.dumps(boxes).decode()
+
+
+def unpack(blob: str | None) -> list[Box]:
+    """Deserialize bounding boxes written by `pack` or a legacy format."""
+    if not blob:
+        return []
+
+    if blob.startswith("["):
+        rows = orjson.loads(blob)
+        if rows and isinstance(rows[0], dict):
+            return [(r["x1"], r["y1"], r["x2"], r["y2"], r["text"]) for r in rows]
+        return [tuple(r) for r in rows]
+
+    boxes = []
+    for line in blob.splitlines():
+        x1, y1, x2, y2, text = line.split("\t", 4)
+        boxes.append((int(x1), int(y1), int(x2), int(y2), text))
+    return boxes
@@ -6,13 +6,26 @@
 # Return format: https://cloud.google.com/vision/docs/reference/rest/v1/images/annotate#TextAnnotation
 # Billing: https://console.cloud.google.com/billing/
 
+import functools
+import io
 import logging
+import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 
+from cachetools import LRUCache
 from google.cloud import vision
 from google.cloud.vision_v1 import AnnotateImageResponse
 
+# If available, crop selections with libvips. It decodes only the rows that it
+# needs and streams them, rather than holding the full page in memory. (A
+# missing libvips shared library raises OSError.)
+try:
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
+
 
 @dataclass
 class OcrResponse:
@@ -22,32 +35,44 @@ class OcrResponse:
     bounding_boxes: list[tuple[int, int, int, int, str]]
 
 
+#: Single-character substitutions for `post_process`.
+_POST_PROCESS_TABLE = str.maketrans(
+    {
+        # Danda
+        "|": "।",
+        # Remove curly quotes
+        "‘": "'",
+        "’": "'",
+        "“": '"',
+        "”": '"',
+    }
+)
+
+
 def post_process(text: str) -> str:
     """Post process OCR text."""
-    return (
-        text
-        # Danda and double danda
-        .replace("||", "॥")
-        .replace("|", "।")
-        .replace("।।", "॥")
-        # Remove curly quotes
-        .replace("‘", "'")
-        .replace("’", "'")
-        .replace("“", '"')
-        .replace("”", '"')
-    )
+    # Double danda must be handled before the single-character pass, and
+    # again afterward for dandas that were already Devanagari.
+    return text.replace("||", "॥").translate(_POST_PROCESS_TABLE).replace("।।", "॥")
 
 
 def prepare_image(file_path: Path):
     """Read an image into a protocol buffer for the OCR request."""
     with open(file_path, "rb") as file_path:
         content = file_path.read()
+    return prepare_image_bytes(content)
+
+
+def prepare_image_bytes(content: bytes):
+    """Wrap encoded image bytes in a protocol buffer for the OCR request."""
     return vision.Image(content=content)
 
 
 def serialize_bounding_boxes(boxes: list[tuple[int, int, int, int, str]]) -> str:
     """Serialize a list of bounding boxes as a TSV."""
-    return "\n".join("\t".join(str(x) for x in row) for row in boxes)
+    return "\n".join(
+        f"{x1}\t{y1}\t{x2}\t{y2}\t{text}" for x1, y1, x2, y2, text in boxes
+    )
 
 
 def debug_dump_response(response):
@@ -56,93 +81,212 @@ def debug_dump_response(response):
         f.write(AnnotateImageResponse.to_json(response))
 
 
-def run(file_path: Path, language: str = 'sa') -> OcrResponse:
-    """Run Google OCR over the given image.
+#: Text to emit after a symbol, keyed by its detected break type.
+_BREAK_SUFFIXES = {
+    # BreakType.SPACE, BreakType.SURE_SPACE: end of word.
+    1: " ",
+    2: " ",
+    # BreakType.EOL_SURE_SPACE: end of line.
+    3: "\n",
+    # BreakType.HYPHEN: hyphenated end-of-line.
+    4: "-\n",
+    # BreakType.LINE_BREAK: clean end of region.
+    5: "\n\n",
+}
 
-    :param file_path: path to the image we'll process with OCR.
-    :param language: language code for OCR (default: 'sa' for Sanskrit).
-    :return: an OCR response containing the image's text content and
-        bounding boxes.
-    """
-    logging.debug(f"Starting full text annotation: {file_path} with language {language}")
-
-    client = vision.ImageAnnotatorClient()
-    image = prepare_image(file_path)
-
-    # Set language hints based on the language parameter
-    language_hints = []
-    if language == 'sa':
-        language_hints = ['sa']  # Sanskrit
-    elif language == 'hi':
-        language_hints = ['hi']  # Hindi
-    elif language == 'te':
-        language_hints = ['te']  # Telugu
-    elif language == 'mr':
-        language_hints = ['mr']  # Marathi
-    elif language == 'bn':
-        language_hints = ['bn']  # Bengali
-    elif language == 'gu':
-        language_hints = ['gu']  # Gujarati
-    elif language == 'kn':
-        language_hints = ['kn']  # Kannada
-    elif language == 'ml':
-        language_hints = ['ml']  # Malayalam
-    elif language == 'ta':
-        language_hints = ['ta']  # Tamil
-    elif language == 'pa':
-        language_hints = ['pa']  # Punjabi
-    elif language == 'or':
-        language_hints = ['or']  # Odia
-    elif language == 'ur':
-        language_hints = ['ur']  # Urdu
-    else:
-        language_hints = ['en']  # Default to English
 
-    context = vision.ImageContext(language_hints=language_hints)
-    response = client.document_text_detection(image=image, image_context=context)
-    document = response.full_text_annotation
+#: OCR language hints, keyed by our language code.
+_LANGUAGE_HINTS = {
+    "sa": ["sa"],  # Sanskrit
+    "hi": ["hi"],  # Hindi
+    "te": ["te"],  # Telugu
+    "mr": ["mr"],  # Marathi
+    "bn": ["bn"],  # Bengali
+    "gu": ["gu"],  # Gujarati
+    "kn": ["kn"],  # Kannada
+    "ml": ["ml"],  # Malayalam
+    "ta": ["ta"],  # Tamil
+    "pa": ["pa"],  # Punjabi
+    "or": ["or"],  # Odia
+    "ur": ["ur"],  # Urdu
+}
+#: Language hints for unknown language codes.
+_DEFAULT_LANGUAGE_HINTS = ["en"]
+
 
+def parse_document(document) -> OcrResponse:
+    """Extract text and word-level bounding boxes from an OCR document.
+
+    We visit each word's vertices and symbols exactly once. Dense pages have
+    thousands of symbols, and attribute access on the response's protobuf
+    messages is slow, so this loop binds what it can to local names.
+
+    :param document: the response's `full_text_annotation`.
+    """
     buf = []
     bounding_boxes = []
+    buf_append = buf.append
+    boxes_append = bounding_boxes.append
+    break_suffixes = _BREAK_SUFFIXES
     for page in document.pages:
         for block in page.blocks:
             for p in block.paragraphs:
                 for w in p.words:
                     vertices = w.bounding_box.vertices
-                    xs = [v.x for v in vertices]
-                    ys = [v.y for v in vertices]
-                    word = "".join(s.text for s in w.symbols)
-                    bounding_boxes.append((min(xs), min(ys), max(xs), max(ys), word))
+                    v = vertices[0]
+                    x1 = x2 = v.x
+                    y1 = y2 = v.y
+                    for v in vertices[1:]:
+                        x, y = v.x, v.y
+                        if x < x1:
+                            x1 = x
+                        elif x > x2:
+                            x2 = x
+                        if y < y1:
+                            y1 = y
+                        elif y > y2:
+                            y2 = y
 
+                    # Add text to `buf` a word (or, after a break, a word
+                    # fragment) at a time rather than a symbol at a time.
+                    word = []
+                    word_append = word.append
+                    start = 0
                     for s in w.symbols:
-                        buf.append(s.text)
-                        break_type = s.property.detected_break.type
-
-                        # BreakType.SPACE
-                        # BreakType.SURE_SPACE
-                        # End of word.
-                        if break_type in (1, 2):
-                            buf.append(" ")
-
-                        # BreakType.EOL_SURE_SPACE
-                        # End of line.
-                        if break_type == 3:
-                            buf.append("\n")
-
-                        # BreakType.HYPHEN:
-                        # Hyphenated end-of-line.
-                        elif break_type == 4:
-                            buf.append("-\n")
-
-                        # BreakType.LINE_BREAK
-                        # Clean end of region.
-                        elif break_type == 5:
-                            buf.append("\n\n")
+                        word_append(s.text)
+                        suffix = break_suffixes.get(s.property.detected_break.type)
+                        if suffix:
+                            buf_append("".join(word[start:] if start else word))
+                            buf_append(suffix)
+                            start = len(word)
+                    word_text = "".join(word)
+                    if start < len(word):
+                        buf_append("".join(word[start:]) if start else word_text)
+                    boxes_append((x1, y1, x2, y2, word_text))
 
     text_content = post_process("".join(buf))
     return OcrResponse(text_content=text_content, bounding_boxes=bounding_boxes)
 
 
+def run(file_path: Path, language: str = 'sa') -> OcrResponse:
+    """Run Google OCR over the given image.
+
+    :param file_path: path to the image we'll process with OCR.
+    :param language: language code for OCR (default: 'sa' for Sanskrit).
+    :return: an OCR response containing the image's text content and
+        bounding boxes.
+    """
+    logging.debug("Starting full text annotation: %s with language %s", file_path, language)
+    return _annotate(prepare_image(file_path), language)
+
+
+def run_from_bytes(data: bytes, language: str = 'sa') -> OcrResponse:
+    """Run Google OCR over an encoded image that is already in memory.
+
+    :param data: the encoded image, e.g. PNG or JPEG bytes.
+    :param language: language code for OCR (default: 'sa' for Sanskrit).
+    :return: an OCR response containing the image's text content and
+        bounding boxes.
+    """
+    return _annotate(prepare_image_bytes(data), language)
+
+
+@functools.cache
+def _client():
+    """Return this process's OCR client.
+
+    Creating a client sets up credentials and a gRPC channel, so we create one
+    lazily (after any worker fork) and reuse it for every request.
+    """
+    return vision.ImageAnnotatorClient()
+
+
+def _annotate(image, language: str) -> OcrResponse:
+    """Run Google OCR over an image protocol buffer.
+
+    :param image: the image, as returned by `prepare_image` or
+        `prepare_image_bytes`.
+    :param language: language code for OCR.
+    """
+    client = _client()
+
+    language_hints = _LANGUAGE_HINTS.get(language, _DEFAULT_LANGUAGE_HINTS)
+    context = vision.ImageContext(language_hints=language_hints)
+    response = client.document_text_detection(image=image, image_context=context)
+    return parse_document(response.full_text_annotation)
+
+
+#: The most images that Google accepts in one `batch_annotate_images` request.
+MAX_BATCH_SIZE = 16
+
+
+def run_batch(images: list[bytes], language: str = 'sa') -> list[OcrResponse]:
+    """Run Google OCR over several in-memory images with few requests.
+
+    We send up to `MAX_BATCH_SIZE` images per request instead of making one
+    request per image.
+
+    :param images: the encoded images, e.g. PNG or JPEG bytes.
+    :param language: language code for OCR (default: 'sa' for Sanskrit).
+    :return: one OCR response per image, in order.
+    """
+    client = _client()
+    feature = vision.Feature(type_=vision.Feature.Type.DOCUMENT_TEXT_DETECTION)
+    language_hints = _LANGUAGE_HINTS.get(language, _DEFAULT_LANGUAGE_HINTS)
+    context = vision.ImageContext(language_hints=language_hints)
+
+    results = []
+    for i in range(0, len(images), MAX_BATCH_SIZE):
+        requests = [
+            vision.AnnotateImageRequest(
+                image=prepare_image_bytes(data),
+                features=[feature],
+                image_context=context,
+            )
+            for data in images[i : i + MAX_BATCH_SIZE]
+        ]
+        response = client.batch_annotate_images(requests=requests)
+        for r in response.responses:
+            if r.error.message:
+                raise ValueError(f"Google OCR failed: {r.error.message}")
+            results.append(parse_document(r.full_text_annotation))
+    return results
+
+
+#: Recently decoded page images, keyed by path and modification time, so that
+#: several selections on one page share a single decode. A decoded page can
+#: take tens of MB, so we keep only a couple.
+_decoded_images = LRUCache(maxsize=2)
+_decoded_images_lock = threading.Lock()
+
+
+def _open_decoded_image(file_path: Path):
+    """Open and fully decode an image, reusing a recent decode if we can."""
+    from PIL import Image
+
+    key = (str(file_path), os.stat(file_path).st_mtime_ns)
+    with _decoded_images_lock:
+        image = _decoded_images.get(key)
+    if image is None:
+        image = Image.open(file_path)
+        image.load()
+        with _decoded_images_lock:
+            _decoded_images[key] = image
+    return image
+
+
+def _crop_with_vips(file_path: Path, left: int, top: int, width: int, height: int) -> bytes | None:
+    """Crop an image with libvips and encode the crop as PNG.
+
+    Returns ``None`` if the selection extends past the image, which libvips
+    can't crop. Pillow pads such selections instead.
+    """
+    image = pyvips.Image.new_from_file(str(file_path), access="sequential")
+    if left < 0 or top < 0 or left + width > image.width or top + height > image.height:
+        return None
+    return image.crop(left, top, width, height).pngsave_buffer()
+
+
 def run_with_selection(file_path: Path, selection: dict, language: str = 'sa') -> OcrResponse:
     """Run Google OCR on a specific selection of the image.
 
@@ -150,24 +294,31 @@ def run_with_selection(file_path: Path, selection: dict, language: str = 'sa') -
     :param selection: dictionary with 'left', 'top', 'width', 'height' keys.
     :param language: language code for OCR (default: 'sa' for Sanskrit).
     :return: an OCR response containing the image's text content and
-        bounding boxes.
+        bounding boxes. Bounding boxes are in page coordinates.
     """
-    logging.debug(f"Starting Google OCR on selection: {file_path} with language {language}")
+    logging.debug("Starting Google OCR on selection: %s with language %s", file_path, language)
     
     # Google OCR doesn't have built-in selection support, so we'll crop the image
-    from PIL import Image
-    image = Image.open(file_path)
     left, top, width, height = selection['left'], selection['top'], selection['width'], selection['height']
+    if pyvips is not None:
+        data = _crop_with_vips(file_path, left, top, width, height)
+        if data is not None:
+            return _to_page_coordinates(run_from_bytes(data, language=language), left, top)
+
+    image = _open_decoded_image(file_path)
     selection_image = image.crop((left, top, left + width, top + height))
     
-    # Save the cropped image temporarily
-    import tempfile
-    with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp_file:
-        selection_image.save(tmp_file.name, 'JPEG')
-        tmp_path = Path(tmp_file.name)
-    
-    try:
-        return run(tmp_path, language=language)
-    finally:
-        # Clean up temporary file
-        tmp_path.unlink(missing_ok=True)
+    # Encode the crop in memory and send the bytes directly. PNG is lossless,
+    # so the OCR sees exactly the pixels of the original image.
+    buf = io.BytesIO()
+    selection_image.save(buf, format="PNG")
+    return _to_page_coordinates(run_from_bytes(buf.getvalue(), language=language), left, top)
+
+
+def _to_page_coordinates(response: OcrResponse, left: int, top: int) -> OcrResponse:
+    """Shift a selection's bounding boxes by the selection's origin."""
+    bounding_boxes = [
+        (x1 + left, y1 + top, x2 + left, y2 + top, text)
+        for x1, y1, x2, y2, text in response.bounding_boxes
+    ]
+    return OcrResponse(text_content=response.text_content, bounding_boxes=bounding_boxes)
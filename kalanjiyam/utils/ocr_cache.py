@@ -0,0 +1,212 @@
+"""A persistent, content-addressed cache of OCR results.
+
+OCR calls are slow (seconds for Surya, a network round trip for Google), and
+users often re-run OCR on a page image that hasn't changed. So we store each
+`OcrResponse` on disk, keyed by a hash of the image bytes and of the OCR
+parameters, and return the stored response when we see the same request again.
+
+Entries are small JSON files under `KALANJIYAM_OCR_CACHE_DIR` (default:
+`~/.cache/kalanjiyam/ocr`). Deleting the directory clears the cache, and
+entries older than `MAX_AGE` are pruned as new ones are written. Each
+process also keeps its most recent entries in memory, since proofreaders tend
+to OCR the same selection many times in a row, and it runs concurrent
+requests for the same key only once.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable
+
+import orjson
+from cachetools import LRUCache
+
+from kalanjiyam.utils.google_ocr import OcrResponse
+
+# If available, hash images with BLAKE3. It is several times faster than
+# SHA-256 and hashes large files on several threads without holding the GIL.
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+LOG = logging.getLogger(__name__)
+
+#: How many bytes to read at a time when hashing an image.
+HASH_CHUNK_SIZE = 64 * 1024
+
+#: Recently used responses, keyed by cache key. Responses are small (text and
+#: boxes), so 512 of them cost at most a few MB.
+_memory_cache = LRUCache(maxsize=512)
+_memory_cache_lock = threading.Lock()
+
+#: Entries older than this many seconds are deleted. Keys hash the image and
+#: the parameters, so old entries are never wrong; this only bounds the size of
+#: the cache on disk.
+MAX_AGE = 30 * 24 * 60 * 60
+
+#: Prune old entries once per this many writes in a process.
+PRUNE_INTERVAL = 256
+_writes_since_prune = 0
+_prune_lock = threading.Lock()
+
+#: Futures for the OCR runs in progress, keyed by cache key.
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def get_cache_dir() -> Path:
+    """Return the directory that holds cached OCR responses."""
+    cache_dir = os.environ.get("KALANJIYAM_OCR_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+    return Path.home() / ".cache" / "kalanjiyam" / "ocr"
+
+
+def cache_key(file_path: Path, **params) -> str:
+    """Create a cache key for running OCR over `file_path` with `params`.
+
+    :param file_path: the image to OCR. We hash its contents, not its path,
+        so a replaced image gets a new key.
+    :param params: everything else that affects the OCR output, e.g. the
+        engine name, language, and selection. Values must be JSON-compatible.
+
+    Keys depend on whether `blake3` is installed, so processes that share a
+    cache directory should share an environment too.
+    """
+    return cache_keys(file_path, params)[0]
+
+
+def cache_keys(file_path: Path, *param_sets: dict) -> list[str]:
+    """Create a `cache_key` for each of `param_sets`, reading the image once."""
+    if blake3 is not None:
+        h = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        h.update_mmap(file_path)
+    else:
+        h = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                h.update(chunk)
+
+    keys = []
+    for params in param_sets:
+        params_h = h.copy()
+        params_h.update(orjson.dumps(params, option=orjson.OPT_SORT_KEYS))
+        keys.append(params_h.hexdigest())
+    return keys
+
+
+def get(key: str) -> OcrResponse | None:
+    """Return the cached response for `key`, or ``None`` on a miss."""
+    with _memory_cache_lock:
+        response = _memory_cache.get(key)
+    if response is not None:
+        return response
+
+    path = get_cache_dir() / f"{key}.json"
+    try:
+        data = orjson.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, orjson.JSONDecodeError) as e:
+        LOG.warning("Could not read OCR cache entry %s: %s", path, e)
+        return None
+    response = OcrResponse(
+        text_content=data["text_content"],
+        bounding_boxes=[tuple(box) for box in data["bounding_boxes"]],
+    )
+    with _memory_cache_lock:
+        _memory_cache[key] = response
+    return response
+
+
+def put(key: str, response: OcrResponse):
+    """Store `response` under `key`.
+
+    We write to a temporary file and rename it into place so that concurrent
+    readers never see a partial entry. Failures are logged, not raised: the
+    cache is an optimization, and OCR has already succeeded.
+    """
+    with _memory_cache_lock:
+        _memory_cache[key] = response
+
+    cache_dir = get_cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError as e:
+        LOG.warning("Could not write OCR cache entry %s: %s", key, e)
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(response))
+        os.replace(tmp_path, cache_dir / f"{key}.json")
+    except OSError as e:
+        LOG.warning("Could not write OCR cache entry %s: %s", key, e)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        return
+
+    global _writes_since_prune
+    with _prune_lock:
+        _writes_since_prune += 1
+        should_prune = _writes_since_prune >= PRUNE_INTERVAL
+        if should_prune:
+            _writes_since_prune = 0
+    if should_prune:
+        prune()
+
+
+def prune(max_age: float = MAX_AGE):
+    """Delete entries (and leftover temporary files) older than `max_age` seconds."""
+    cutoff = time.time() - max_age
+    try:
+        entries = os.scandir(get_cache_dir())
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                # Another process may have replaced or removed the entry.
+                pass
+
+
+def get_or_run(key: str, run: Callable[[], OcrResponse]) -> OcrResponse:
+    """Return the cached response for `key`, calling `run` on a miss.
+
+    If another thread is already running OCR for `key`, we wait for its
+    result instead of calling `run` again.
+    """
+    response = get(key)
+    if response is not None:
+        return response
+
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = _inflight[key] = Future()
+    if not is_leader:
+        return future.result()
+
+    try:
+        response = run()
+        put(key, response)
+        future.set_result(response)
+        return response
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
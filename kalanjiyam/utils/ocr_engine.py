@@ -1,16 +1,28 @@
 """Unified OCR engine interface for proofing projects."""
 
+import importlib.util
+import json
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict, Any
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
 
-from kalanjiyam.utils import google_ocr, tesseract_ocr, surya_ocr
+from google.api_core import exceptions as google_exceptions
+
+from kalanjiyam.utils import google_ocr, ocr_cache, tesseract_ocr, surya_ocr
 
 
 # Use the OcrResponse from google_ocr as the common interface
 OcrResponse = google_ocr.OcrResponse
 
+#: Whether Surya is installed. We check once, without importing it, since
+#: importing Surya pulls in torch and its models.
+_SURYA_AVAILABLE = importlib.util.find_spec('surya') is not None
+
 
 class OcrEngine(ABC):
     """Abstract base class for OCR engines."""
@@ -25,15 +37,44 @@ class OcrEngine(ABC):
         """Run OCR on a specific selection of the image."""
         pass
     
-    @abstractmethod
-    def get_supported_languages(self) -> List[str]:
+    #: Supported language codes, in display order.
+    SUPPORTED_LANGUAGES: ClassVar[Tuple[str, ...]] = ()
+    
+    @staticmethod
+    def post_process(text: str) -> str:
+        """Clean up raw OCR text the same way this engine's `run` does."""
+        return text
+    
+    @classmethod
+    def get_supported_languages(cls) -> List[str]:
         """Get list of supported language codes."""
-        pass
+        return list(cls.SUPPORTED_LANGUAGES)
+    
+    def run_batch(self, file_paths: List[Path], **kwargs) -> List[OcrResponse]:
+        """Run OCR on several image files, returning one response per file.
+        
+        The default implementation calls `run` once per file. Engines that
+        can process several images per call should override it.
+        """
+        return [self.run(file_path, **kwargs) for file_path in file_paths]
+    
+    def run_with_selections(self, file_path: Path, selections: List[Dict[str, int]], **kwargs) -> List[OcrResponse]:
+        """Run OCR on several selections of one image, returning one response per selection.
+        
+        The default implementation calls `run_with_selection` once per
+        selection. Engines that can process several images per call should
+        override it.
+        """
+        return [self.run_with_selection(file_path, selection, **kwargs) for selection in selections]
 
 
 class GoogleOcrEngine(OcrEngine):
     """Google Cloud Vision OCR engine."""
     
+    # Google Cloud Vision supports many languages, but we'll focus on the most relevant ones
+    SUPPORTED_LANGUAGES = ('sa', 'en', 'hi', 'te', 'mr', 'bn', 'gu', 'kn', 'ml', 'ta', 'pa', 'or', 'ur')
+    post_process = staticmethod(google_ocr.post_process)
+    
     def run(self, file_path: Path, **kwargs) -> OcrResponse:
         """Run Google OCR on the given image file."""
         language = kwargs.get('language', 'sa')  # Default to Sanskrit
@@ -44,15 +85,21 @@ class GoogleOcrEngine(OcrEngine):
         language = kwargs.get('language', 'sa')  # Default to Sanskrit
         return google_ocr.run_with_selection(file_path, selection, language=language)
     
-    def get_supported_languages(self) -> List[str]:
-        """Get supported language codes for Google OCR."""
-        # Google Cloud Vision supports many languages, but we'll focus on the most relevant ones
-        return ['sa', 'en', 'hi', 'te', 'mr', 'bn', 'gu', 'kn', 'ml', 'ta', 'pa', 'or', 'ur']
+    def run_batch(self, file_paths: List[Path], **kwargs) -> List[OcrResponse]:
+        """Run Google OCR on several image files with batched requests."""
+        language = kwargs.get('language', 'sa')  # Default to Sanskrit
+        images = [Path(file_path).read_bytes() for file_path in file_paths]
+        return google_ocr.run_batch(images, language=language)
+
 
 
 class TesseractOcrEngine(OcrEngine):
     """Tesseract OCR engine."""
     
+    # Tesseract language codes (these need to be installed)
+    SUPPORTED_LANGUAGES = ('san', 'eng', 'hin', 'tel', 'mar', 'ben', 'guj', 'kan', 'mal', 'tam', 'pan', 'ori', 'urd')
+    post_process = staticmethod(tesseract_ocr.post_process)
+    
     def run(self, file_path: Path, **kwargs) -> OcrResponse:
         """Run Tesseract OCR on the given image file."""
         language = kwargs.get('language', 'san')  # Default to Sanskrit
@@ -63,15 +110,20 @@ class TesseractOcrEngine(OcrEngine):
         language = kwargs.get('language', 'san')  # Default to Sanskrit
         return tesseract_ocr.run_with_selection(file_path, selection, language=language)
     
-    def get_supported_languages(self) -> List[str]:
-        """Get supported language codes for Tesseract OCR."""
-        # Tesseract language codes (these need to be installed)
-        return ['san', 'eng', 'hin', 'tel', 'mar', 'ben', 'guj', 'kan', 'mal', 'tam', 'pan', 'ori', 'urd']
+    def run_batch(self, file_paths: List[Path], **kwargs) -> List[OcrResponse]:
+        """Run Tesseract OCR on several image files in parallel."""
+        language = kwargs.get('language', 'san')  # Default to Sanskrit
+        return tesseract_ocr.run_batch(file_paths, language=language)
+
 
 
 class SuryaOcrEngine(OcrEngine):
     """Surya OCR engine."""
     
+    # Surya supports 90+ languages, using similar codes to Google OCR
+    SUPPORTED_LANGUAGES = ('sa', 'en', 'hi', 'te', 'mr', 'bn', 'gu', 'kn', 'ml', 'ta', 'pa', 'or', 'ur', 'ar', 'fa', 'th', 'ko', 'ja', 'zh', 'ru', 'es', 'fr', 'de', 'it', 'pt', 'nl', 'pl', 'tr', 'vi', 'id', 'ms')
+    post_process = staticmethod(surya_ocr.post_process)
+    
     def __init__(self, gpu_config: Optional[Dict[str, Any]] = None):
         """Initialize Surya OCR engine and check availability."""
         self.gpu_config = gpu_config
@@ -79,12 +131,9 @@ class SuryaOcrEngine(OcrEngine):
     
     def _check_availability(self):
         """Check if Surya OCR is available."""
-        try:
-            import surya
-        except ImportError as e:
+        if not _SURYA_AVAILABLE:
             import sys
-            logging.error(f"Surya OCR import failed. Python executable: {sys.executable}")
-            logging.error(f"Import error: {e}")
+            logging.error(f"Surya OCR is not installed. Python executable: {sys.executable}")
             raise RuntimeError(
                 f"Surya OCR is not installed in the current Python environment.\n"
                 f"Python executable: {sys.executable}\n"
@@ -105,25 +154,46 @@ class SuryaOcrEngine(OcrEngine):
         additional_languages = kwargs.get('additional_languages', None)
         gpu_config = kwargs.get('gpu_config', self.gpu_config)
         return surya_ocr.run_with_selection(file_path, selection, language=language, additional_languages=additional_languages, gpu_config=gpu_config)
+
+    def run_with_selections(self, file_path: Path, selections: List[Dict[str, int]], **kwargs) -> List[OcrResponse]:
+        """Run Surya OCR on several selections of one image, batching them through the model."""
+        language = kwargs.get('language', 'sa')  # Default to Sanskrit
+        additional_languages = kwargs.get('additional_languages', None)
+        gpu_config = kwargs.get('gpu_config', self.gpu_config)
+        return surya_ocr.run_with_selections(file_path, selections, language=language, additional_languages=additional_languages, gpu_config=gpu_config)
     
-    def get_supported_languages(self) -> List[str]:
-        """Get supported language codes for Surya OCR."""
-        # Surya supports 90+ languages, using similar codes to Google OCR
-        return ['sa', 'en', 'hi', 'te', 'mr', 'bn', 'gu', 'kn', 'ml', 'ta', 'pa', 'or', 'ur', 'ar', 'fa', 'th', 'ko', 'ja', 'zh', 'ru', 'es', 'fr', 'de', 'it', 'pt', 'nl', 'pl', 'tr', 'vi', 'id', 'ms']
+    def run_batch(self, file_paths: List[Path], **kwargs) -> List[OcrResponse]:
+        """Run Surya OCR on several image files, batching them through the model."""
+        language = kwargs.get('language', 'sa')  # Default to Sanskrit
+        additional_languages = kwargs.get('additional_languages', None)
+        gpu_config = kwargs.get('gpu_config', self.gpu_config)
+        return surya_ocr.run_batch(file_paths, language=language, additional_languages=additional_languages, gpu_config=gpu_config)
+
 
 
 class OcrEngineFactory:
-    """Factory for creating OCR engines."""
+    """Factory for creating OCR engines.
+    
+    Engines are created once per process and then reused. Creating an engine
+    can be expensive (e.g. Surya checks its installation and loads models),
+    and engines keep no per-request state.
+    """
     
-    _engines = {
+    _engines = MappingProxyType({
         'google': GoogleOcrEngine,
         'tesseract': TesseractOcrEngine,
         'surya': SuryaOcrEngine,
-    }
+    })
+    #: The engine names, in display order.
+    ENGINE_NAMES = tuple(_engines)
+    
+    #: Engine instances, keyed by engine name and GPU configuration.
+    _instances: Dict[Tuple[str, str], OcrEngine] = {}
+    _instances_lock = threading.Lock()
     
     @classmethod
     def create(cls, engine_name: str, gpu_config: Optional[Dict[str, Any]] = None) -> OcrEngine:
-        """Create an OCR engine instance.
+        """Create an OCR engine instance, or return the one we already made.
         
         :param engine_name: Name of the engine ('google', 'tesseract', or 'surya')
         :param gpu_config: Optional GPU configuration for Surya OCR
@@ -132,21 +202,38 @@ class OcrEngineFactory:
         :raises: RuntimeError if Surya OCR is not installed (when engine_name is 'surya')
         """
         if engine_name not in cls._engines:
-            raise ValueError(f"Unsupported OCR engine: {engine_name}. Supported engines: {list(cls._engines.keys())}")
+            raise ValueError(f"Unsupported OCR engine: {engine_name}. Supported engines: {list(cls.ENGINE_NAMES)}")
+        
+        use_gpu_config = engine_name == 'surya' and gpu_config
+        key = (engine_name, json.dumps(gpu_config, sort_keys=True, default=str) if use_gpu_config else '')
+        engine = cls._instances.get(key)
+        if engine is not None:
+            return engine
         
-        try:
-            if engine_name == 'surya' and gpu_config:
-                return cls._engines[engine_name](gpu_config=gpu_config)
-            else:
-                return cls._engines[engine_name]()
-        except RuntimeError as e:
-            # Re-raise RuntimeError (e.g., Surya not installed) with clear message
-            raise RuntimeError(str(e))
+        with cls._instances_lock:
+            engine = cls._instances.get(key)
+            if engine is None:
+                try:
+                    if use_gpu_config:
+                        engine = cls._engines[engine_name](gpu_config=gpu_config)
+                    else:
+                        engine = cls._engines[engine_name]()
+                except RuntimeError as e:
+                    # Re-raise RuntimeError (e.g., Surya not installed) with clear message
+                    raise RuntimeError(str(e)) from e
+                cls._instances[key] = engine
+        return engine
+    
+    @classmethod
+    def reset(cls):
+        """Forget all engine instances. Intended for tests."""
+        with cls._instances_lock:
+            cls._instances.clear()
     
     @classmethod
     def get_supported_engines(cls) -> List[str]:
         """Get list of supported OCR engines."""
-        return list(cls._engines.keys())
+        return list(cls.ENGINE_NAMES)
     
     @classmethod
     def get_supported_languages(cls, engine_name: str) -> List[str]:
@@ -154,18 +241,211 @@ class OcrEngineFactory:
         if engine_name not in cls._engines:
             raise ValueError(f"Unsupported OCR engine: {engine_name}")
         
-        engine = cls._engines[engine_name]()
-        return engine.get_supported_languages()
+        # Read the class attribute so that we don't create an engine.
+        return cls._engines[engine_name].get_supported_languages()
 
 
-def run_ocr(file_path: Path, engine_name: str = 'google', gpu_config: Optional[Dict[str, Any]] = None, **kwargs) -> OcrResponse:
+def run_ocr(file_path: Path, engine_name: str = 'google', gpu_config: Optional[Dict[str, Any]] = None, no_cache: bool = False, **kwargs) -> OcrResponse:
     """Run OCR on the given image file using the specified engine.
     
+    Results are cached on disk by image content and OCR parameters (see
+    `ocr_cache`), so re-running OCR on an unchanged image is nearly free.
+    
     :param file_path: path to the image we'll process with OCR.
     :param engine_name: name of the OCR engine to use ('google', 'tesseract', or 'surya').
     :param gpu_config: optional GPU configuration for Surya OCR
+    :param no_cache: if true, always run the engine and don't store its result.
     :param kwargs: additional arguments to pass to the OCR engine.
     :return: an OCR response containing the image's text content and bounding boxes.
     """
-    engine = OcrEngineFactory.create(engine_name, gpu_config=gpu_config)
-    return engine.run(file_path, **kwargs) 
\ No newline at end of file
+    def _run():
+        engine = OcrEngineFactory.create(engine_name, gpu_config=gpu_config)
+        return engine.run(file_path, **kwargs)
+
+    if no_cache:
+        return _run()
+    key = ocr_cache.cache_key(file_path, engine=engine_name, **kwargs)
+    return ocr_cache.get_or_run(key, _run)
+
+
+def run_ocr_with_selection(file_path: Path, selection: Dict[str, int], engine_name: str = 'google', gpu_config: Optional[Dict[str, Any]] = None, no_cache: bool = False, **kwargs) -> OcrResponse:
+    """Run OCR on a selection of the given image file using the specified engine.
+    
+    Results are cached as in `run_ocr`. If the whole page is already in the
+    cache, we answer from its bounding boxes without running the engine.
+    
+    :param file_path: path to the image we'll process with OCR.
+    :param selection: dictionary with 'left', 'top', 'width', 'height' keys.
+    :param engine_name: name of the OCR engine to use ('google', 'tesseract', or 'surya').
+    :param gpu_config: optional GPU configuration for Surya OCR
+    :param no_cache: if true, always run the engine and don't store its result.
+    :param kwargs: additional arguments to pass to the OCR engine.
+    :return: an OCR response containing the selection's text content and bounding boxes.
+    """
+    def _run():
+        engine = OcrEngineFactory.create(engine_name, gpu_config=gpu_config)
+        return engine.run_with_selection(file_path, selection, **kwargs)
+
+    if no_cache:
+        return _run()
+    page_key, key = ocr_cache.cache_keys(
+        file_path,
+        dict(engine=engine_name, **kwargs),
+        dict(engine=engine_name, selection=selection, **kwargs),
+    )
+    response = ocr_cache.get(key)
+    if response is not None:
+        return response
+    
+    # If we've already OCR'd the whole page, read the selection from its
+    # bounding boxes instead of calling the engine again.
+    page_response = ocr_cache.get(page_key)
+    if page_response is not None:
+        # Read `post_process` from the class so that we don't create an engine.
+        post_process = OcrEngineFactory._engines[engine_name].post_process
+        response = _select_from_page(page_response, selection, post_process)
+        if response is not None:
+            return response
+    return ocr_cache.get_or_run(key, _run)
+
+
+def _select_from_page(page_response: OcrResponse, selection: Dict[str, int], post_process: Callable[[str], str]) -> Optional[OcrResponse]:
+    """Build a selection's OCR response from the OCR response for its page.
+    
+    We keep the boxes whose centers lie in the selection, in the engine's
+    reading order, and start a new line whenever a box's center falls outside
+    the vertical extent of the box before it. Boxes stay in page coordinates,
+    as they are in the responses from the engines' `run_with_selection`.
+    
+    :param post_process: the engine's `post_process`. Box texts are raw OCR
+        output, so we clean up each line of the selection's text with it.
+    :param selection: either 'left', 'top', 'width', 'height' keys (as for
+        Google and Tesseract) or 'x1', 'y1', 'x2', 'y2' keys (as for Surya).
+    :return: the response, or ``None`` if no boxes lie in the selection (for
+        example, if the page OCR missed the selected text) or if we don't
+        recognize the selection's format.
+    """
+    bounds = _selection_bounds(selection)
+    if bounds is None:
+        return None
+    left, top, right, bottom = bounds
+    boxes = [
+        box for box in page_response.bounding_boxes
+        if left <= (box[0] + box[2]) / 2 < right and top <= (box[1] + box[3]) / 2 < bottom
+    ]
+    if not boxes:
+        return None
+    
+    lines = [[boxes[0][4]]]
+    for prev, box in zip(boxes, boxes[1:]):
+        if prev[1] <= (box[1] + box[3]) / 2 <= prev[3]:
+            lines[-1].append(box[4])
+        else:
+            lines.append([box[4]])
+    text_content = "\n".join(post_process(" ".join(words)) for words in lines)
+    return OcrResponse(text_content=text_content, bounding_boxes=boxes)
+
+
+def _selection_bounds(selection: Dict[str, int]) -> Optional[Tuple[int, int, int, int]]:
+    """Return a selection's (left, top, right, bottom), or ``None`` if its keys are unknown."""
+    if all(k in selection for k in ('left', 'top', 'width', 'height')):
+        left, top = selection['left'], selection['top']
+        return left, top, left + selection['width'], top + selection['height']
+    if all(k in selection for k in ('x1', 'y1', 'x2', 'y2')):
+        return selection['x1'], selection['y1'], selection['x2'], selection['y2']
+    return None
+
+
+def run_ocr_batch(file_paths: List[Path], engine_name: str = 'google', gpu_config: Optional[Dict[str, Any]] = None, no_cache: bool = False, **kwargs) -> List[OcrResponse]:
+    """Run OCR on several image files using the specified engine.
+    
+    Cached results are reused as in `run_ocr`, and only the remaining files
+    are sent to the engine, in one `run_batch` call.
+    
+    :param file_paths: paths to the images we'll process with OCR.
+    :param engine_name: name of the OCR engine to use ('google', 'tesseract', or 'surya').
+    :param gpu_config: optional GPU configuration for Surya OCR
+    :param no_cache: if true, always run the engine and don't store its results.
+    :param kwargs: additional arguments to pass to the OCR engine.
+    :return: one OCR response per image, in order.
+    """
+    if no_cache:
+        engine = OcrEngineFactory.create(engine_name, gpu_config=gpu_config)
+        return engine.run_batch(file_paths, **kwargs)
+
+    keys = [ocr_cache.cache_key(p, engine=engine_name, **kwargs) for p in file_paths]
+    results = [ocr_cache.get(key) for key in keys]
+    misses = [i for i, result in enumerate(results) if result is None]
+    if misses:
+        engine = OcrEngineFactory.create(engine_name, gpu_config=gpu_config)
+        responses = engine.run_batch([file_paths[i] for i in misses], **kwargs)
+        for i, response in zip(misses, responses):
+            ocr_cache.put(keys[i], response)
+            results[i] = response
+    return results
+
+
+#: Errors from the Google API that are worth retrying: rate limits (429),
+#: server errors, and timeouts.
+_RETRYABLE_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.InternalServerError,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+)
+#: The most times we try a single image.
+MAX_OCR_ATTEMPTS = 3
+
+
+class _RateLimiter:
+    """Space out calls so that at most `rate` start per second, across threads."""
+    
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate else 0.0
+        self.next_start = 0.0
+        self.lock = threading.Lock()
+    
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_start)
+            self.next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def run_ocr_many(file_paths: List[Path], engine_name: str = 'google', concurrency: int = 8, rate: float = 10, gpu_config: Optional[Dict[str, Any]] = None, **kwargs) -> List[OcrResponse]:
+    """Run OCR on several image files concurrently.
+    
+    Each file goes through `run_ocr` (and hence the cache) on a thread pool.
+    Calls are rate-limited, and calls that fail with a transient Google API
+    error are retried with exponential backoff (1s, 2s, ... up to 30s).
+    
+    Concurrency helps most for network-bound engines like Google. For Surya,
+    which runs models on a local GPU, pass ``concurrency=1``.
+    
+    :param file_paths: paths to the images we'll process with OCR.
+    :param engine_name: name of the OCR engine to use ('google', 'tesseract', or 'surya').
+    :param concurrency: the most OCR calls to run at once.
+    :param rate: the most OCR calls to start per second.
+    :param gpu_config: optional GPU configuration for Surya OCR
+    :param kwargs: additional arguments to pass to `run_ocr`.
+    :return: one OCR response per image, in order.
+    """
+    limiter = _RateLimiter(rate)
+    
+    def _run(file_path):
+        delay = 1.0
+        for attempt in range(1, MAX_OCR_ATTEMPTS + 1):
+            limiter.wait()
+            try:
+                return run_ocr(file_path, engine_name=engine_name, gpu_config=gpu_config, **kwargs)
+            except _RETRYABLE_ERRORS as e:
+                if attempt == MAX_OCR_ATTEMPTS:
+                    raise
+                logging.warning("OCR failed for %s (attempt %d), retrying in %.0fs: %s", file_path, attempt, delay, e)
+                time.sleep(delay)
+                delay = min(delay * 2, 30.0)
+    
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        return list(executor.map(_run, file_paths))
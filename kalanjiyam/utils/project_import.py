@@ -0,0 +1,294 @@
+"""Import projects from the archives created by the admin export.
+
+An export archive contains either `project_data.json` (and optionally the
+project's PDF and page images under `files/`) or `all_projects_data.json`.
+"""
+
+import json
+import logging
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from werkzeug.security import generate_password_hash
+
+import kalanjiyam.database as db
+
+#: Buffer size for writing archives to disk and reading them back.
+ARCHIVE_BUFFER_SIZE = 1024 * 1024
+
+#: Data file for a single-project archive.
+PROJECT_DATA_FILE = "project_data.json"
+#: Data file for an all-projects archive.
+ALL_PROJECTS_DATA_FILE = "all_projects_data.json"
+
+
+def _get_or_create_users(session, usernames: set) -> dict[str, db.User]:
+    """Map usernames to users, creating placeholder users as needed.
+
+    We look up all users with one query and insert the missing ones in
+    bulk rather than querying (and flushing) once per row.
+    """
+    usernames = {u for u in usernames if u}
+    if not usernames:
+        return {}
+
+    users = {
+        u.username: u
+        for u in session.query(db.User).filter(db.User.username.in_(usernames))
+    }
+    missing = usernames - users.keys()
+    if missing:
+        # All placeholder users share a password, so hash it just once.
+        password_hash = generate_password_hash("imported_user_password_change_me")
+        session.bulk_save_objects(
+            [
+                db.User(
+                    username=username,
+                    email=f"{username}@imported.local",
+                    description="Imported user",
+                    password_hash=password_hash,
+                )
+                for username in missing
+            ]
+        )
+        # Refetch to get the new IDs.
+        for u in session.query(db.User).filter(db.User.username.in_(missing)):
+            users[u.username] = u
+    return users
+
+
+def _user_id(users: dict[str, db.User], username: str | None) -> int | None:
+    """Get the ID of a user returned by `_get_or_create_users`."""
+    user = users.get(username)
+    return user.id if user else None
+
+
+def _get_genre(session, genre_id: int) -> db.Genre | None:
+    """Get an existing genre or return None."""
+    if not genre_id:
+        return None
+
+    return session.query(db.Genre).filter_by(id=genre_id).first()
+
+
+def _get_or_create_page_statuses(session, names: set) -> dict[str, db.PageStatus]:
+    """Map status names to page statuses, creating any that don't exist."""
+    names = {n for n in names if n}
+    if not names:
+        return {}
+
+    statuses = {
+        s.name: s
+        for s in session.query(db.PageStatus).filter(db.PageStatus.name.in_(names))
+    }
+    missing = names - statuses.keys()
+    if missing:
+        session.bulk_save_objects([db.PageStatus(name=name) for name in missing])
+        for s in session.query(db.PageStatus).filter(db.PageStatus.name.in_(missing)):
+            statuses[s.name] = s
+    return statuses
+
+
+def import_project_data(
+    session, project_data: dict[str, Any], existing_slugs: set | None = None
+) -> db.Project:
+    """Import a single project from exported data.
+
+    The caller is responsible for committing the session.
+
+    If `existing_slugs` is given, we check it instead of querying for an
+    existing project. The caller should add the slug to it once the project
+    is committed.
+    """
+    metadata = project_data["metadata"]
+
+    # Check if project already exists
+    if existing_slugs is None:
+        exists = (
+            session.query(db.Project.id).filter_by(slug=metadata["slug"]).first()
+            is not None
+        )
+    else:
+        exists = metadata["slug"] in existing_slugs
+    if exists:
+        raise ValueError(f"Project with slug '{metadata['slug']}' already exists")
+
+    # Look up (or create) every user and page status that the project
+    # refers to up front.
+    threads_data = project_data["discussion"]["threads"]
+    usernames = {metadata.get("creator_username")}
+    usernames.update(t["author_username"] for t in threads_data)
+    usernames.update(p["author_username"] for t in threads_data for p in t["posts"])
+    usernames.update(r["author_username"] for r in project_data["revisions"])
+    usernames.update(t["author_username"] for t in project_data["translations"])
+    users = _get_or_create_users(session, usernames)
+
+    status_names = {p["status_name"] for p in project_data["pages"]}
+    status_names.update(r["status_name"] for r in project_data["revisions"])
+    statuses = _get_or_create_page_statuses(session, status_names)
+
+    creator = users.get(metadata.get("creator_username"))
+
+    # Get genre
+    genre = None
+    if metadata.get("genre_id"):
+        genre = _get_genre(session, metadata["genre_id"])
+
+    # Create the discussion board and the project. Every project needs a board.
+    # Setting `project.board` lets a single flush insert both in order.
+    board_data = project_data["discussion"]["board"]
+    board_title = (
+        board_data["title"] if board_data else f"{metadata['slug']} discussion board"
+    )
+    board = db.Board(title=board_title)
+
+    # Create project
+    project = db.Project(
+        slug=metadata["slug"],
+        display_title=metadata["display_title"],
+        print_title=metadata["print_title"],
+        author=metadata["author"],
+        editor=metadata["editor"],
+        publisher=metadata["publisher"],
+        publication_year=metadata["publication_year"],
+        worldcat_link=metadata["worldcat_link"],
+        description=metadata["description"],
+        notes=metadata["notes"],
+        page_numbers=metadata["page_numbers"],
+        created_at=datetime.fromisoformat(metadata["created_at"]),
+        updated_at=datetime.fromisoformat(metadata["updated_at"]),
+        creator_id=creator.id if creator else None,
+        genre_id=genre.id if genre else None,
+        board=board,
+    )
+
+    session.add_all([board, project])
+    session.flush()
+
+    # Import threads and posts. The rows below are inserted with
+    # bulk_insert_mappings, which skips the unit of work; we never read
+    # these objects back in this transaction. `return_defaults` fills in
+    # the new IDs that we need for foreign keys.
+    thread_rows = [
+        {
+            "title": thread_data["title"],
+            "board_id": board.id,
+            "author_id": _user_id(users, thread_data["author_username"]),
+            "created_at": datetime.fromisoformat(thread_data["created_at"]),
+            "updated_at": datetime.fromisoformat(thread_data["updated_at"]),
+        }
+        for thread_data in threads_data
+    ]
+    session.bulk_insert_mappings(db.Thread, thread_rows, return_defaults=True)
+
+    post_rows = [
+        {
+            "board_id": board.id,
+            "thread_id": thread_row["id"],
+            "author_id": _user_id(users, post_data["author_username"]),
+            "created_at": datetime.fromisoformat(post_data["created_at"]),
+            "updated_at": datetime.fromisoformat(post_data["updated_at"]),
+            "content": post_data["content"],
+        }
+        for thread_data, thread_row in zip(threads_data, thread_rows)
+        for post_data in thread_data["posts"]
+    ]
+    session.bulk_insert_mappings(db.Post, post_rows)
+
+    # Create pages
+    page_rows = [
+        {
+            "project_id": project.id,
+            "slug": page_data["slug"],
+            "order": page_data["order"],
+            "version": page_data["version"],
+            "ocr_bounding_boxes": page_data["ocr_bounding_boxes"],
+            "status_id": statuses[page_data["status_name"]].id,
+        }
+        for page_data in project_data["pages"]
+    ]
+    session.bulk_insert_mappings(db.Page, page_rows, return_defaults=True)
+    page_ids = {
+        row["slug"]: row["id"] for row in page_rows
+    }  # Map page slugs to page IDs
+
+    # Create revisions
+    revisions_data = [
+        r for r in project_data["revisions"] if r["page_slug"] in page_ids
+    ]
+    revision_rows = [
+        {
+            "project_id": project.id,
+            "page_id": page_ids[revision_data["page_slug"]],
+            "author_id": _user_id(users, revision_data["author_username"]),
+            "status_id": statuses[revision_data["status_name"]].id,
+            "created": datetime.fromisoformat(revision_data["created"]),
+            "summary": revision_data["summary"],
+            "content": revision_data["content"],
+        }
+        for revision_data in revisions_data
+    ]
+    session.bulk_insert_mappings(db.Revision, revision_rows, return_defaults=True)
+    # Map exported revision IDs to new revision IDs
+    revision_ids = {
+        revision_data["revision_id"]: row["id"]
+        for revision_data, row in zip(revisions_data, revision_rows)
+        if revision_data.get("revision_id") is not None
+    }
+
+    # Create translations. Older archives don't record a translation's page
+    # slug or the exported revision IDs, and a translation without its page
+    # and revision can't be stored, so skip those.
+    translations_data = [
+        t
+        for t in project_data["translations"]
+        if t.get("page_slug") in page_ids and t.get("revision_id") in revision_ids
+    ]
+    num_skipped = len(project_data["translations"]) - len(translations_data)
+    if num_skipped:
+        logging.warning(
+            f"Skipped {num_skipped} translations without a known page and "
+            f"revision in project {metadata['slug']}."
+        )
+    translation_rows = [
+        {
+            "page_id": page_ids[translation_data["page_slug"]],
+            "revision_id": revision_ids[translation_data["revision_id"]],
+            "author_id": _user_id(users, translation_data["author_username"]),
+            "content": translation_data["content"],
+            "source_language": translation_data["source_language"],
+            "target_language": translation_data["target_language"],
+            "translation_engine": translation_data["translation_engine"],
+            "status": translation_data["status"],
+            "created_at": datetime.fromisoformat(translation_data["created_at"]),
+            "updated_at": datetime.fromisoformat(translation_data["updated_at"]),
+        }
+        for translation_data in translations_data
+    ]
+    session.bulk_insert_mappings(db.Translation, translation_rows)
+
+    return project
+
+
+def copy_project_files(files_dir: Path, project_dir: Path):
+    """Copy an extracted archive's PDF and page images into `project_dir`."""
+    pdf_source = files_dir / "source.pdf"
+    if pdf_source.exists():
+        pdf_dest = project_dir / "pdf" / "source.pdf"
+        pdf_dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(pdf_source, pdf_dest)
+
+    pages_source = files_dir / "pages"
+    if pages_source.exists():
+        pages_dest = project_dir / "pages"
+        pages_dest.mkdir(parents=True, exist_ok=True)
+        for image_file in pages_source.glob("*.jpg"):
+            shutil.copyfile(image_file, pages_dest / image_file.name)
+
+
+def read_project_data(path: Path) -> Any:
+    """Read a data file from an extracted archive."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
@@ -6,9 +6,17 @@ You can customize these settings based on your hardware and requirements.
 """
 
 import os
+import re
+import sys
+import threading
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 import logging
 
+#: Device names that we accept: 'auto', 'cpu', 'cuda:<n>', or a bare GPU ID,
+#: which is short for 'cuda:<n>'.
+_DEVICE_RE = re.compile(r'^(?:auto|cpu|cuda:\d+|(?P<gpu_id>\d+))$')
+
 
 def get_default_gpu_config() -> Dict[str, Any]:
     """
@@ -46,9 +54,9 @@ def get_gpu_config_from_env() -> Dict[str, Any]:
     if os.environ.get('SURYA_GPU_DEVICE'):
         device = os.environ['SURYA_GPU_DEVICE']
         # Handle numeric GPU IDs (e.g., "2" -> "cuda:2")
-        if device.isdigit():
-            config['device'] = f'cuda:{device}'
-        else:
+        try:
+            config['device'] = normalize_device(device)
+        except ValueError:
             config['device'] = device
     
     if os.environ.get('SURYA_GPU_MEMORY_FRACTION'):
@@ -105,34 +113,44 @@ def get_cpu_config() -> Dict[str, Any]:
     }
 
 
+def normalize_device(device: str) -> str:
+    """
+    Normalize a device name, e.g. '2' -> 'cuda:2'.
+    
+    Args:
+        device: 'auto', 'cpu', 'cuda:<n>', or a bare GPU ID like '2'
+    
+    Returns:
+        The canonical device name
+    
+    Raises:
+        ValueError: if `device` is not a device name we understand
+    """
+    match = _DEVICE_RE.match(device)
+    if not match:
+        raise ValueError(f"Invalid device: {device!r}")
+    gpu_id = match.group('gpu_id')
+    return f'cuda:{gpu_id}' if gpu_id is not None else device
+
+
 def validate_gpu_config(config: Dict[str, Any]) -> bool:
     """
     Validate GPU configuration.
     
+    This does not modify `config`. Use `normalize_device` to canonicalize
+    the device name.
+    
     Args:
         config: GPU configuration dictionary
     
     Returns:
         True if configuration is valid, False otherwise
     """
-    # Check device
-    device = config['device']
-    if device not in ['auto', 'cpu'] and not device.startswith('cuda:'):
-        # Handle numeric GPU IDs
-        if device.isdigit():
-            config['device'] = f'cuda:{device}'
-        else:
-            return False
-    
-    # Check memory fraction
-    if not 0.0 <= config['memory_fraction'] <= 1.0:
-        return False
-    
-    # Check max memory
-    if config['max_memory_mb'] < 0:
-        return False
-    
-    return True
+    return (
+        _DEVICE_RE.match(config['device']) is not None
+        and 0.0 <= config['memory_fraction'] <= 1.0
+        and config['max_memory_mb'] >= 0
+    )
 
 
 def print_gpu_config(config: Dict[str, Any]) -> None:
@@ -142,23 +160,46 @@ def print_gpu_config(config: Dict[str, Any]) -> None:
     Args:
         config: GPU configuration dictionary
     """
-    print("Surya OCR GPU Configuration:")
-    print(f"  Device: {config['device']}")
-    print(f"  Memory Fraction: {config['memory_fraction']}")
-    print(f"  Max Memory: {config['max_memory_mb']} MB" if config['max_memory_mb'] > 0 else "  Max Memory: No limit")
-    print(f"  Allow Growth: {config['allow_growth']}")
+    lines = [
+        "Surya OCR GPU Configuration:",
+        f"  Device: {config['device']}",
+        f"  Memory Fraction: {config['memory_fraction']}",
+        f"  Max Memory: {config['max_memory_mb']} MB" if config['max_memory_mb'] > 0 else "  Max Memory: No limit",
+        f"  Allow Growth: {config['allow_growth']}",
+    ]
     
     if 'multi_gpu' in config and config['multi_gpu']:
-        print(f"  Multi-GPU: Yes (GPUs: {config['gpu_ids']})")
+        lines.append(f"  Multi-GPU: Yes (GPUs: {config['gpu_ids']})")
+    
+    # Write the whole report at once.
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+#: Whether `setup_gpu_environment` has already run in this process.
+_GPU_CONFIGURED = False
+_gpu_configured_lock = threading.Lock()
 
 
 def setup_gpu_environment(config: Dict[str, Any]) -> None:
     """
-    Setup GPU environment variables for Surya OCR.
+    Setup the GPU environment for Surya OCR, once per process.
+    
+    CUDA reads `CUDA_VISIBLE_DEVICES` only when it initializes, so changing
+    the device after the first OCR call has no effect. We therefore apply the
+    first configuration we see and ignore later calls.
+    
+    Surya runs on PyTorch, which grows its memory pool on demand, so
+    `allow_growth` needs no setup here.
     
     Args:
         config: GPU configuration dictionary
     """
+    global _GPU_CONFIGURED
+    with _gpu_configured_lock:
+        if _GPU_CONFIGURED:
+            return
+        _GPU_CONFIGURED = True
+    
     # Set device
     if config['device'].startswith('cuda'):
         # Extract GPU ID and set CUDA_VISIBLE_DEVICES
@@ -173,13 +214,14 @@ def setup_gpu_environment(config: Dict[str, Any]) -> None:
             os.environ['TORCH_DEVICE'] = 'cuda:0'
             logging.info("Set CUDA_VISIBLE_DEVICES=0, TORCH_DEVICE=cuda:0")
         
-        # Set memory management
-        if config['allow_growth']:
-            os.environ['TF_FORCE_GPU_ALLOW_GROWTH'] = 'true'
-        
         # Set memory fraction if specified
         if config['memory_fraction'] < 1.0:
-            os.environ['TF_GPU_MEMORY_FRACTION'] = str(config['memory_fraction'])
+            try:
+                import torch
+                if torch.cuda.is_available():
+                    torch.cuda.set_per_process_memory_fraction(config['memory_fraction'], device=0)
+            except ImportError:
+                pass
         
         logging.info(f"GPU configured: {config['device']}, memory fraction: {config['memory_fraction']}")
     else:
@@ -187,8 +229,8 @@ def setup_gpu_environment(config: Dict[str, Any]) -> None:
         logging.info("Using CPU for Surya OCR")
 
 
-# Example configurations
-EXAMPLE_CONFIGS = {
+# Example configurations. Callers should copy a config before changing it.
+EXAMPLE_CONFIGS = MappingProxyType({
     'conservative': {
         'device': 'cuda:0',
         'memory_fraction': 0.5,  # Use only 50% of GPU memory
@@ -209,4 +251,4 @@ EXAMPLE_CONFIGS = {
     },
     'multi_gpu_2': get_multi_gpu_config([0, 1], 0.6),
     'multi_gpu_4': get_multi_gpu_config([0, 1, 2, 3], 0.5),
-}
+})
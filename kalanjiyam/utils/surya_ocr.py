@@ -1,12 +1,14 @@
 """Surya OCR utilities for proofing projects."""
+import contextlib
 import logging
 import subprocess
 import tempfile
 import json
 import os
 import gc
+import threading
 from pathlib import Path
-from typing import List, Tuple, Dict, Any, Optional
+from typing import List, Tuple, Dict, Any, Optional, Union
 from PIL import Image
 
 from kalanjiyam.utils import google_ocr
@@ -51,6 +53,135 @@ def get_gpu_config() -> Dict[str, Any]:
 from kalanjiyam.utils.surya_gpu_config import setup_gpu_environment
 
 
+def _should_cache_predictors() -> bool:
+    """Whether to keep Surya's models loaded between OCR calls.
+
+    By default we load the models for each call and free them afterward so
+    that idle workers hold no GPU memory. Set `SURYA_CACHE_PREDICTORS=true` to
+    load them once per worker instead, which is much faster when the worker
+    has memory to spare.
+    """
+    return os.environ.get('SURYA_CACHE_PREDICTORS', 'false').lower() == 'true'
+
+
+def _use_fp16() -> bool:
+    """Whether to run Surya's models in half precision on the GPU.
+
+    Half precision roughly halves the models' GPU memory and speeds up
+    inference on GPUs with tensor cores, at a small risk to accuracy. Set
+    `SURYA_FP16=true` to enable it. It has no effect on CPU.
+    """
+    return os.environ.get('SURYA_FP16', 'false').lower() == 'true'
+
+
+def _create_predictors(gpu_config: Dict[str, Any]):
+    """Create the (detection, recognition) predictors for `gpu_config`'s device."""
+    from surya.detection import DetectionPredictor
+    from surya.foundation import FoundationPredictor
+    from surya.recognition import RecognitionPredictor
+
+    foundation_predictor = FoundationPredictor()
+    det_predictor = DetectionPredictor()
+    rec_predictor = RecognitionPredictor(foundation_predictor)
+    # Use the same condition as `_inference_context`, so that we never run
+    # half-precision weights without autocast (e.g. on a CPU-only config on a
+    # machine that has a GPU).
+    if _use_fp16() and gpu_config['device'].startswith('cuda'):
+        _convert_to_fp16(foundation_predictor, det_predictor, rec_predictor)
+    if _use_compile():
+        _compile_models(foundation_predictor, det_predictor, rec_predictor)
+    return det_predictor, rec_predictor
+
+
+def _use_compile() -> bool:
+    """Whether to compile Surya's models with `torch.compile`.
+
+    Compiling fuses kernels and cuts Python overhead in Surya's step-by-step
+    decoder, but the first call pays for the compilation. So we compile only
+    when we also keep the models loaded. Set `SURYA_COMPILE=true` (together
+    with `SURYA_CACHE_PREDICTORS=true`) to enable it.
+    """
+    return (
+        os.environ.get('SURYA_COMPILE', 'false').lower() == 'true'
+        and _should_cache_predictors()
+    )
+
+
+def _compile_models(*predictors):
+    """Compile the predictors' models, if this version of torch can."""
+    import torch
+
+    if not hasattr(torch, 'compile'):
+        logging.warning("SURYA_COMPILE is set, but this version of torch has no torch.compile")
+        return
+    for predictor in predictors:
+        model = getattr(predictor, 'model', None)
+        if model is not None:
+            predictor.model = torch.compile(model, mode='reduce-overhead', fullgraph=False)
+
+
+def _convert_to_fp16(*predictors):
+    """Convert the predictors' models to half precision."""
+    for predictor in predictors:
+        model = getattr(predictor, 'model', None)
+        if model is not None:
+            predictor.model = model.half()
+
+
+def _inference_context(gpu_config: Dict[str, Any]):
+    """Return a context for running the predictors, e.g. with FP16 autocast."""
+    if _use_fp16() and gpu_config['device'].startswith('cuda'):
+        import torch
+        return torch.autocast(device_type='cuda', dtype=torch.float16)
+    return contextlib.nullcontext()
+
+
+#: This process's (detection, recognition) predictors, if we cache them.
+_predictors = None
+_predictors_lock = threading.Lock()
+
+
+def _get_predictors(gpu_config: Dict[str, Any]):
+    """Return this process's predictors, creating them on first use.
+
+    A process uses one GPU configuration, so we create them for the first
+    `gpu_config` that we see.
+    """
+    global _predictors
+    if _predictors is None:
+        with _predictors_lock:
+            if _predictors is None:
+                _predictors = _create_predictors(gpu_config)
+    return _predictors
+
+
+def warmup() -> None:
+    """Load Surya's models now if we keep them loaded between calls.
+    
+    Call this when a worker starts so that its first OCR request doesn't wait
+    for the models to load (or, with `SURYA_COMPILE`, to compile). It does
+    nothing unless `SURYA_CACHE_PREDICTORS` is set.
+    """
+    if not _should_cache_predictors():
+        return
+    try:
+        _get_predictors(get_gpu_config())
+        if _use_compile():
+            # Compilation happens on the first call, so make that call now.
+            _run_image(Image.new('RGB', (512, 64), 'white'))
+    except ImportError as e:
+        logging.warning(f"Could not load Surya OCR models: {e}")
+    except Exception as e:
+        logging.warning(f"Surya OCR warmup failed: {e}")
+
+
+#: Tesseract's codes for the languages we OCR, for the Tesseract fallback.
+_TESSERACT_LANGUAGES = {
+    'sa': 'san', 'en': 'eng', 'hi': 'hin', 'te': 'tel', 'mr': 'mar', 'bn': 'ben', 'gu': 'guj',
+    'kn': 'kan', 'ml': 'mal', 'ta': 'tam', 'pa': 'pan', 'or': 'ori', 'ur': 'urd',
+}
+
+
 def post_process(text: str) -> str:
     """Post-process OCR text."""
     if not text:
@@ -70,12 +201,12 @@ def serialize_bounding_boxes(boxes: List[Tuple[int, int, int, int, str]]) -> str
     } for box in boxes])
 
 
-def run(file_path: Path, language: str = 'sa', additional_languages: Optional[List[str]] = None, gpu_config: Optional[Dict[str, Any]] = None) -> OcrResponse:
+def run(file_path: Union[Path, Image.Image], language: str = 'sa', additional_languages: Optional[List[str]] = None, gpu_config: Optional[Dict[str, Any]] = None) -> OcrResponse:
     """
-    Run Surya OCR on the given image file.
+    Run Surya OCR on the given image file, or on an image already in memory.
     
     Args:
-        file_path: Path to the image file
+        file_path: Path to the image file, or a PIL image
         language: Primary language code (e.g., 'sa', 'en', 'hi')
         additional_languages: Optional list of additional language codes for bilingual/multilingual OCR
         gpu_config: Optional GPU configuration dictionary
@@ -83,6 +214,20 @@ def run(file_path: Path, language: str = 'sa', additional_languages: Optional[Li
     Returns:
         OcrResponse with text content and bounding boxes
     """
+    if isinstance(file_path, Image.Image):
+        image = file_path.convert('RGB')
+        
+        def fallback():
+            # Tesseract reads from a path, so only this rare path writes the
+            # image to disk. The directory is removed even if OCR fails.
+            from kalanjiyam.utils import tesseract_ocr
+            with tempfile.TemporaryDirectory() as temp_dir:
+                temp_path = Path(temp_dir) / 'image.png'
+                image.save(temp_path)
+                return tesseract_ocr.run(temp_path, language=_TESSERACT_LANGUAGES.get(language, language))
+        
+        return _run_image_or_fallback(image, gpu_config, fallback)
+    
     logging.debug(f"Starting Surya OCR: {file_path} with language {language}")
     
     if not file_path.exists():
@@ -97,89 +242,18 @@ def run(file_path: Path, language: str = 'sa', additional_languages: Optional[Li
     
     logging.info(f"Processing image file: {file_path}, size: {file_size} bytes")
     
-    # Get and setup GPU configuration
-    if gpu_config is None:
-        gpu_config = get_gpu_config()
-    setup_gpu_environment(gpu_config)
-    
-    # Set conservative environment variables for Surya OCR
-    os.environ.setdefault('COMPILE_DETECTOR', 'false')  # Disable compilation to save memory
-    os.environ.setdefault('COMPILE_LAYOUT', 'false')    # Disable compilation to save memory
-    os.environ.setdefault('COMPILE_TABLE_REC', 'false') # Disable compilation to save memory
+    def fallback():
+        from kalanjiyam.utils import tesseract_ocr
+        return tesseract_ocr.run(file_path, language=_TESSERACT_LANGUAGES.get(language, language))
     
+    with Image.open(file_path) as image:
+        return _run_image_or_fallback(image.convert('RGB'), gpu_config, fallback)
+
+
+def _run_image_or_fallback(image: Image.Image, gpu_config: Optional[Dict[str, Any]], fallback) -> OcrResponse:
+    """Run Surya OCR on `image`, calling `fallback` (Tesseract) if Surya fails."""
     try:
-        # Import Surya modules
-        from surya.common.surya.schema import TaskNames
-        from surya.detection import DetectionPredictor
-        from surya.foundation import FoundationPredictor
-        from surya.recognition import RecognitionPredictor
-        
-        # Load image with memory optimization
-        image = Image.open(file_path)
-        image = image.convert('RGB')
-        
-        # Resize large images to prevent memory issues (max 2048px on longest side)
-        max_size = int(os.environ.get('SURYA_MAX_IMAGE_SIZE', '2048'))
-        if max(image.size) > max_size:
-            ratio = max_size / max(image.size)
-            new_size = tuple(int(dim * ratio) for dim in image.size)
-            image = image.resize(new_size, Image.Resampling.LANCZOS)
-            logging.info(f"Resized image from {image.size} to {new_size} to save memory")
-        
-        # Initialize predictors with conservative settings
-        foundation_predictor = FoundationPredictor()
-        det_predictor = DetectionPredictor()
-        rec_predictor = RecognitionPredictor(foundation_predictor)
-        
-        # Run OCR with the new API and conservative settings
-        logging.info(f"Running Surya OCR with automatic language detection on {gpu_config['device']}")
-        predictions_by_image = rec_predictor(
-            [image],
-            task_names=[TaskNames.ocr_with_boxes],
-            det_predictor=det_predictor,
-            highres_images=[image],
-            math_mode=os.environ.get('SURYA_MATH_MODE', 'false').lower() == 'true',  # Configurable math recognition
-        )
-        
-        # Extract text and bounding boxes from the first image result
-        if not predictions_by_image:
-            raise RuntimeError("No OCR results generated")
-        
-        prediction = predictions_by_image[0]
-        text_content = ""
-        bounding_boxes = []
-        
-        # Extract text lines and their bounding boxes
-        for line in prediction.text_lines:
-            line_text = post_process(line.text)
-            if line_text:
-                text_content += line_text + "\n"
-                
-                # Extract bounding box coordinates (already in x1, y1, x2, y2 format)
-                if hasattr(line, 'bbox') and line.bbox:
-                    bbox = line.bbox
-                    if len(bbox) >= 4:
-                        # bbox is already in [x1, y1, x2, y2] format
-                        x1, y1, x2, y2 = bbox[0], bbox[1], bbox[2], bbox[3]
-                        bounding_boxes.append((x1, y1, x2, y2, line_text))
-        
-        text_content = text_content.strip()
-        logging.info(f"Surya OCR completed successfully. Extracted {len(bounding_boxes)} text lines")
-        
-        # Clean up memory
-        del predictions_by_image, prediction, foundation_predictor, det_predictor, rec_predictor
-        gc.collect()
-        
-        # Clear GPU cache if using CUDA
-        if gpu_config['device'].startswith('cuda'):
-            try:
-                import torch
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
-                    logging.debug("Cleared GPU cache")
-            except ImportError:
-                pass
-        
+        return _run_image(image, gpu_config)
     except ImportError as e:
         import sys
         raise RuntimeError(
@@ -195,24 +269,163 @@ def run(file_path: Path, language: str = 'sa', additional_languages: Optional[Li
         
         # Fallback to Tesseract OCR
         try:
-            from kalanjiyam.utils import tesseract_ocr
-            return tesseract_ocr.run(file_path, language=language)
+            return fallback()
         except Exception as fallback_error:
             logging.error(f"Tesseract fallback also failed: {fallback_error}")
             raise RuntimeError(f"Surya OCR failed: {e}. Fallback to Tesseract also failed: {fallback_error}")
+
+
+def _run_image(image: Image.Image, gpu_config: Optional[Dict[str, Any]] = None) -> OcrResponse:
+    """Run Surya OCR on an RGB image that is already in memory."""
+    return _run_images([image], gpu_config)[0]
+
+
+def _run_images(images: List[Image.Image], gpu_config: Optional[Dict[str, Any]] = None) -> List[OcrResponse]:
+    """Run Surya OCR on several RGB images with a single predictor call.
+    
+    Surya batches its inputs internally, so one call over many images keeps
+    the GPU much busier than one call per image.
+    """
+    # Get and setup GPU configuration
+    if gpu_config is None:
+        gpu_config = get_gpu_config()
+    setup_gpu_environment(gpu_config)
+    
+    # Set conservative environment variables for Surya OCR
+    os.environ.setdefault('COMPILE_DETECTOR', 'false')  # Disable compilation to save memory
+    os.environ.setdefault('COMPILE_LAYOUT', 'false')    # Disable compilation to save memory
+    os.environ.setdefault('COMPILE_TABLE_REC', 'false') # Disable compilation to save memory
+    
+    # Import Surya modules
+    from surya.common.surya.schema import TaskNames
+    
+    # Resize large images to prevent memory issues (max 2048px on longest side)
+    max_size = int(os.environ.get('SURYA_MAX_IMAGE_SIZE', '2048'))
+    images = [_shrink(image, max_size) for image in images]
+    
+    # Initialize predictors with conservative settings
+    if _should_cache_predictors():
+        det_predictor, rec_predictor = _get_predictors(gpu_config)
+    else:
+        det_predictor, rec_predictor = _create_predictors(gpu_config)
+    
+    # Run OCR with the new API and conservative settings
+    logging.info(f"Running Surya OCR on {len(images)} image(s) with automatic language detection on {gpu_config['device']}")
+    with _inference_context(gpu_config):
+        predictions_by_image = rec_predictor(
+            images,
+            task_names=[TaskNames.ocr_with_boxes] * len(images),
+            det_predictor=det_predictor,
+            highres_images=images,
+            math_mode=os.environ.get('SURYA_MATH_MODE', 'false').lower() == 'true',  # Configurable math recognition
+        )
+    
+    if len(predictions_by_image) != len(images):
+        raise RuntimeError("No OCR results generated")
+    
+    responses = [_parse_prediction(prediction) for prediction in predictions_by_image]
+    logging.info(f"Surya OCR completed successfully on {len(responses)} image(s)")
+    
+    # Clean up memory
+    del predictions_by_image, det_predictor, rec_predictor
+    gc.collect()
+    
+    # Clear GPU cache if using CUDA
+    if gpu_config['device'].startswith('cuda'):
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+                logging.debug("Cleared GPU cache")
+        except ImportError:
+            pass
+    
+    return responses
+
+
+def _shrink(image: Image.Image, max_size: int) -> Image.Image:
+    """Scale `image` down so that its longest side is at most `max_size`."""
+    if max(image.size) <= max_size:
+        return image
+    ratio = max_size / max(image.size)
+    new_size = tuple(int(dim * ratio) for dim in image.size)
+    logging.info(f"Resized image from {image.size} to {new_size} to save memory")
+    return image.resize(new_size, Image.Resampling.LANCZOS)
+
+
+def _parse_prediction(prediction) -> OcrResponse:
+    """Extract text and line-level bounding boxes from one Surya result."""
+    text_content = ""
+    bounding_boxes = []
+    
+    # Extract text lines and their bounding boxes
+    for line in prediction.text_lines:
+        line_text = post_process(line.text)
+        if line_text:
+            text_content += line_text + "\n"
+            
+            # Extract bounding box coordinates (already in x1, y1, x2, y2 format)
+            if hasattr(line, 'bbox') and line.bbox:
+                bbox = line.bbox
+                if len(bbox) >= 4:
+                    # bbox is already in [x1, y1, x2, y2] format
+                    x1, y1, x2, y2 = bbox[0], bbox[1], bbox[2], bbox[3]
+                    bounding_boxes.append((x1, y1, x2, y2, line_text))
+    
+    return OcrResponse(text_content=text_content.strip(), bounding_boxes=bounding_boxes)
+
+
+#: The most images we decode and send to Surya at once. Decoded pages are
+#: large, so bigger batches trade memory for little extra throughput.
+MAX_BATCH_SIZE = 8
+
+
+def run_batch(file_paths: List[Path], language: str = 'sa', additional_languages: Optional[List[str]] = None, gpu_config: Optional[Dict[str, Any]] = None) -> List[OcrResponse]:
+    """
+    Run Surya OCR on several image files, batching them through the model.
     
-    return OcrResponse(text_content=text_content, bounding_boxes=bounding_boxes)
+    Args:
+        file_paths: Paths to the image files
+        language: Primary language code
+        additional_languages: Optional list of additional language codes
+        gpu_config: Optional GPU configuration dictionary
+    
+    Returns:
+        One OcrResponse per file, in order
+    """
+    results = []
+    for i in range(0, len(file_paths), MAX_BATCH_SIZE):
+        chunk = file_paths[i:i + MAX_BATCH_SIZE]
+        try:
+            images = []
+            for file_path in chunk:
+                with Image.open(file_path) as image:
+                    images.append(image.convert('RGB'))
+            results.extend(_run_images(images, gpu_config))
+        except Exception as e:
+            # Retry one file at a time so that one bad image doesn't fail the
+            # whole batch, and so that each file gets the usual fallback.
+            logging.warning(f"Batched Surya OCR failed, running files one at a time: {e}")
+            results.extend(
+                run(file_path, language=language, additional_languages=additional_languages, gpu_config=gpu_config)
+                for file_path in chunk
+            )
+    return results
 
 
-def run_with_selection(file_path: Path, selection: dict, language: str = 'sa', additional_languages: Optional[List[str]] = None) -> OcrResponse:
+def run_with_selection(file_path: Path, selection: dict, language: str = 'sa', additional_languages: Optional[List[str]] = None, gpu_config: Optional[Dict[str, Any]] = None) -> OcrResponse:
     """
     Run Surya OCR on a specific selection of the image.
     
+    The cropped selection is passed to Surya in memory, so no temporary file
+    is written unless we fall back to Tesseract.
+    
     Args:
         file_path: Path to the image file
         selection: Dictionary with 'x1', 'y1', 'x2', 'y2' coordinates
         language: Primary language code
         additional_languages: Optional list of additional language codes
+        gpu_config: Optional GPU configuration dictionary
     
     Returns:
         OcrResponse with text content and bounding boxes
@@ -223,50 +436,79 @@ def run_with_selection(file_path: Path, selection: dict, language: str = 'sa', a
         raise RuntimeError(f"File does not exist: {file_path}")
     
     try:
-        # Load image and crop to selection
-        image = Image.open(file_path)
-        image = image.convert('RGB')
+        # Load image and crop to selection area
+        with Image.open(file_path) as image:
+            x1 = selection.get('x1', 0)
+            y1 = selection.get('y1', 0)
+            x2 = selection.get('x2', image.width)
+            y2 = selection.get('y2', image.height)
+            cropped_image = image.crop((x1, y1, x2, y2))
         
-        # Crop to selection area
-        x1 = selection.get('x1', 0)
-        y1 = selection.get('y1', 0)
-        x2 = selection.get('x2', image.width)
-        y2 = selection.get('y2', image.height)
-        
-        cropped_image = image.crop((x1, y1, x2, y2))
-        
-        # Save cropped image to temporary file
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-            cropped_image.save(temp_file.name)
-            temp_path = Path(temp_file.name)
-        
-        try:
-            # Run OCR on cropped image
-            result = run(temp_path, language=language, additional_languages=additional_languages)
-            
-            # Adjust bounding box coordinates back to original image
-            adjusted_boxes = []
-            for box in result.bounding_boxes:
-                adjusted_boxes.append((
-                    box[0] + x1,  # x1
-                    box[1] + y1,  # y1
-                    box[2] + x1,  # x2
-                    box[3] + y1,  # y2
-                    box[4]        # text
-                ))
-            
-            return OcrResponse(text_content=result.text_content, bounding_boxes=adjusted_boxes)
-            
-        finally:
-            # Clean up temporary file
-            if temp_path.exists():
-                temp_path.unlink()
+        result = run(cropped_image, language=language, additional_languages=additional_languages, gpu_config=gpu_config)
+        return _to_page_coordinates(result, x1, y1)
                 
     except Exception as e:
         logging.error(f"Surya OCR with selection failed: {e}")
         raise RuntimeError(f"Surya OCR with selection failed: {e}")
 
 
+def run_with_selections(file_path: Path, selections: List[dict], language: str = 'sa', additional_languages: Optional[List[str]] = None, gpu_config: Optional[Dict[str, Any]] = None) -> List[OcrResponse]:
+    """
+    Run Surya OCR on several selections of one image with a single predictor call.
+    
+    Args:
+        file_path: Path to the image file
+        selections: Dictionaries with 'x1', 'y1', 'x2', 'y2' coordinates
+        language: Primary language code
+        additional_languages: Optional list of additional language codes
+        gpu_config: Optional GPU configuration dictionary
+    
+    Returns:
+        One OcrResponse per selection, in order
+    """
+    logging.debug(f"Starting Surya OCR with {len(selections)} selections: {file_path}")
+    
+    if not file_path.exists():
+        raise RuntimeError(f"File does not exist: {file_path}")
+    
+    # Load the image once and crop every selection in memory
+    origins = []
+    crops = []
+    with Image.open(file_path) as image:
+        for selection in selections:
+            x1 = selection.get('x1', 0)
+            y1 = selection.get('y1', 0)
+            x2 = selection.get('x2', image.width)
+            y2 = selection.get('y2', image.height)
+            origins.append((x1, y1))
+            crops.append(image.crop((x1, y1, x2, y2)).convert('RGB'))
+    
+    try:
+        results = _run_images(crops, gpu_config)
+    except Exception as e:
+        # Retry one selection at a time so that each gets the usual fallback.
+        logging.warning(f"Batched Surya OCR failed, running selections one at a time: {e}")
+        return [
+            run_with_selection(file_path, selection, language=language, additional_languages=additional_languages, gpu_config=gpu_config)
+            for selection in selections
+        ]
+    return [_to_page_coordinates(result, x1, y1) for result, (x1, y1) in zip(results, origins)]
+
+
+def _to_page_coordinates(result: OcrResponse, x1: int, y1: int) -> OcrResponse:
+    """Shift a selection's bounding boxes by the selection's origin."""
+    adjusted_boxes = []
+    for box in result.bounding_boxes:
+        adjusted_boxes.append((
+            box[0] + x1,  # x1
+            box[1] + y1,  # y1
+            box[2] + x1,  # x2
+            box[3] + y1,  # y2
+            box[4]        # text
+        ))
+    return OcrResponse(text_content=result.text_content, bounding_boxes=adjusted_boxes)
+
+
 def get_supported_languages() -> List[str]:
     """Get supported language codes for Surya OCR."""
     # Surya supports 90+ languages automatically
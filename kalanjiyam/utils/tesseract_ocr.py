@@ -1,6 +1,9 @@
 """Tesseract OCR utilities for proofing projects."""
 
 import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 
@@ -13,20 +16,29 @@ from kalanjiyam.utils import google_ocr
 OcrResponse = google_ocr.OcrResponse
 
 
+#: Substitutions for `post_process`.
+_POST_PROCESS_MAP = {
+    # Danda and double danda. Any two adjacent dandas become a double danda.
+    "||": "॥",
+    "।।": "॥",
+    "|।": "॥",
+    "।|": "॥",
+    "|": "।",
+    # Remove curly quotes
+    "\u2018": "'",
+    "\u2019": "'",
+    "\u201c": '"',
+    "\u201d": '"',
+}
+#: Matches any key of `_POST_PROCESS_MAP`, preferring the longest.
+_POST_PROCESS_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(_POST_PROCESS_MAP, key=len, reverse=True))
+)
+
+
 def post_process(text: str) -> str:
-    """Post process OCR text."""
-    return (
-        text
-        # Danda and double danda
-        .replace("||", "॥")
-        .replace("|", "।")
-        .replace("।।", "॥")
-        # Remove curly quotes
-        .replace("'", "'")
-        .replace("'", "'")
-        .replace(""", '"')
-        .replace(""", '"')
-    )
+    """Post process OCR text in a single pass."""
+    return _POST_PROCESS_RE.sub(lambda m: _POST_PROCESS_MAP[m.group(0)], text)
 
 
 def serialize_bounding_boxes(boxes: List[Tuple[int, int, int, int, str]]) -> str:
@@ -44,37 +56,54 @@ def run(file_path: Path, language: str = 'san') -> OcrResponse:
     """
     logging.debug(f"Starting Tesseract OCR: {file_path} with language {language}")
 
-    # Open the image
-    image = Image.open(file_path)
-    
-    # Get text content
-    text_content = pytesseract.image_to_string(image, lang=language)
-    text_content = post_process(text_content)
+    # Open the image, and close it as soon as we're done with it
+    with Image.open(file_path) as image:
+        # Get text content
+        text_content = pytesseract.image_to_string(image, lang=language)
+        text_content = post_process(text_content)
     
-    # Get bounding boxes for words
-    bounding_boxes = []
-    try:
-        # Get word-level bounding boxes
-        data = pytesseract.image_to_data(image, lang=language, output_type=pytesseract.Output.DICT)
+        # Get bounding boxes for words
+        bounding_boxes = []
+        try:
+            # Get word-level bounding boxes
+            data = pytesseract.image_to_data(image, lang=language, output_type=pytesseract.Output.DICT)
         
-        for i, text in enumerate(data['text']):
-            if text.strip():  # Only process non-empty text
-                x = data['left'][i]
-                y = data['top'][i]
-                width = data['width'][i]
-                height = data['height'][i]
+            for i, text in enumerate(data['text']):
+                if text.strip():  # Only process non-empty text
+                    x = data['left'][i]
+                    y = data['top'][i]
+                    width = data['width'][i]
+                    height = data['height'][i]
                 
-                # Convert to (x1, y1, x2, y2, text) format
-                x1, y1 = x, y
-                x2, y2 = x + width, y + height
-                bounding_boxes.append((x1, y1, x2, y2, text))
-    except Exception as e:
-        logging.warning(f"Failed to get bounding boxes from Tesseract: {e}")
-        # If bounding boxes fail, we still have the text content
+                    # Convert to (x1, y1, x2, y2, text) format
+                    x1, y1 = x, y
+                    x2, y2 = x + width, y + height
+                    bounding_boxes.append((x1, y1, x2, y2, text))
+        except Exception as e:
+            logging.warning(f"Failed to get bounding boxes from Tesseract: {e}")
+            # If bounding boxes fail, we still have the text content
     
     return OcrResponse(text_content=text_content, bounding_boxes=bounding_boxes)
 
 
+def run_batch(file_paths: List[Path], language: str = 'san') -> List[OcrResponse]:
+    """Run Tesseract OCR over several images in parallel.
+
+    Tesseract is CPU-bound and single-threaded, and pytesseract runs it in a
+    subprocess, so a thread per core is enough to use every core.
+
+    :param file_paths: paths to the images we'll process with OCR.
+    :param language: language code for Tesseract (default: 'san' for Sanskrit).
+    :return: one OCR response per image, in order.
+    """
+    if len(file_paths) <= 1:
+        return [run(file_path, language=language) for file_path in file_paths]
+
+    max_workers = min(len(file_paths), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda file_path: run(file_path, language=language), file_paths))
+
+
 def run_with_selection(file_path: Path, selection: dict, language: str = 'san') -> OcrResponse:
     """Run Tesseract OCR on a specific selection of the image.
 
@@ -86,15 +115,14 @@ def run_with_selection(file_path: Path, selection: dict, language: str = 'san')
     """
     logging.debug(f"Starting Tesseract OCR on selection: {file_path} with language {language}")
     
-    # Open the image
-    image = Image.open(file_path)
-    
-    # Crop the image to the selection
+    # Open the image and crop it to the selection
     left, top, width, height = selection['left'], selection['top'], selection['width'], selection['height']
-    selection_image = image.crop((left, top, left + width, top + height))
+    with Image.open(file_path) as image:
+        selection_image = image.crop((left, top, left + width, top + height))
     
     # Get text content from the selection
-    text_content = pytesseract.image_to_string(selection_image, lang=language)
+    with selection_image:
+        text_content = pytesseract.image_to_string(selection_image, lang=language)
     text_content = post_process(text_content)
     
     # For selections, we don't have detailed bounding boxes, so return empty list
@@ -3,9 +3,15 @@
 import logging
 import re
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 from pathlib import Path
+from types import MappingProxyType
+
+#: The maximum number of concurrent requests that `translate_batch` makes for
+#: engines without a batch endpoint.
+MAX_TRANSLATION_THREADS = 8
 
 # Translation response data structure
 @dataclass
@@ -36,10 +42,56 @@ class TranslationEngine(ABC):
         """Get list of supported language codes."""
         pass
 
+    def translate_batch(self, texts: List[str], source_lang: str, target_lang: str, **kwargs) -> List[TranslationResponse]:
+        """Translate several texts, returning one response per text.
+
+        The default implementation calls `translate` once per text, with the
+        calls spread over a small thread pool so that their network round
+        trips overlap. Engines whose backends accept several texts per request
+        should override it.
+        """
+        if len(texts) <= 1:
+            return [self.translate(text, source_lang, target_lang, **kwargs) for text in texts]
+
+        def _translate(text):
+            return self.translate(text, source_lang, target_lang, **kwargs)
+
+        max_workers = min(MAX_TRANSLATION_THREADS, len(texts))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_translate, texts))
+
 
 class GoogleTranslateEngine(TranslationEngine):
     """Google Translate engine implementation."""
-    
+
+    # Map language codes to Google Translate format
+    # Note: Sanskrit ('sa') is not supported by Google Translate
+    _LANGUAGE_MAP = {
+        'sa': 'hi',  # Sanskrit -> Hindi (closest available)
+        'hi': 'hi',  # Hindi
+        'te': 'te',  # Telugu
+        'mr': 'mr',  # Marathi
+        'bn': 'bn',  # Bengali
+        'gu': 'gu',  # Gujarati
+        'kn': 'kn',  # Kannada
+        'ml': 'ml',  # Malayalam
+        'ta': 'ta',  # Tamil
+        'pa': 'pa',  # Punjabi
+        'or': 'or',  # Odia
+        'ur': 'ur',  # Urdu
+        'en': 'en',  # English
+        'fr': 'fr',  # French
+        'de': 'de',  # German
+        'es': 'es',  # Spanish
+        'ja': 'ja',  # Japanese
+        'ko': 'ko',  # Korean
+        'zh': 'zh',  # Chinese
+        'ru': 'ru',  # Russian
+        'ar': 'ar',  # Arabic
+        'fa': 'fa',  # Persian
+        'th': 'th',  # Thai
+    }
+
     def __init__(self):
         try:
             from googletrans import Translator
@@ -51,43 +103,7 @@ class GoogleTranslateEngine(TranslationEngine):
     def translate(self, text: str, source_lang: str, target_lang: str, **kwargs) -> TranslationResponse:
         """Translate text using Google Translate."""
         try:
-            # Map language codes to Google Translate format
-            # Note: Sanskrit ('sa') is not supported by Google Translate
-            language_map = {
-                'sa': 'hi',  # Sanskrit -> Hindi (closest available)
-                'hi': 'hi',  # Hindi
-                'te': 'te',  # Telugu
-                'mr': 'mr',  # Marathi
-                'bn': 'bn',  # Bengali
-                'gu': 'gu',  # Gujarati
-                'kn': 'kn',  # Kannada
-                'ml': 'ml',  # Malayalam
-                'ta': 'ta',  # Tamil
-                'pa': 'pa',  # Punjabi
-                'or': 'or',  # Odia
-                'ur': 'ur',  # Urdu
-                'en': 'en',  # English
-                'fr': 'fr',  # French
-                'de': 'de',  # German
-                'es': 'es',  # Spanish
-                'ja': 'ja',  # Japanese
-                'ko': 'ko',  # Korean
-                'zh': 'zh',  # Chinese
-                'ru': 'ru',  # Russian
-                'ar': 'ar',  # Arabic
-                'fa': 'fa',  # Persian
-                'th': 'th',  # Thai
-            }
-            
-            # Use mapped language codes or original if not in map
-            mapped_source = language_map.get(source_lang, source_lang)
-            mapped_target = language_map.get(target_lang, target_lang)
-            
-            # Warn if Sanskrit is being used (not supported by Google Translate)
-            if source_lang == 'sa':
-                logging.warning(f"Sanskrit ('sa') is not supported by Google Translate. Using Hindi ('hi') as fallback.")
-            
-            logging.info(f"Translating from {source_lang} ({mapped_source}) to {target_lang} ({mapped_target})")
+            mapped_source, mapped_target = self._map_languages(source_lang, target_lang)
             
             # Clean and segment text
             segments = self._segment_text(text)
@@ -123,6 +139,19 @@ class GoogleTranslateEngine(TranslationEngine):
         except Exception as e:
             logging.error(f"Google Translate failed: {e}")
             raise
+
+    def _map_languages(self, source_lang: str, target_lang: str) -> tuple[str, str]:
+        """Map language codes to Google Translate codes, warning on fallbacks."""
+        # Use mapped language codes or original if not in map
+        mapped_source = self._LANGUAGE_MAP.get(source_lang, source_lang)
+        mapped_target = self._LANGUAGE_MAP.get(target_lang, target_lang)
+
+        # Warn if Sanskrit is being used (not supported by Google Translate)
+        if source_lang == 'sa':
+            logging.warning(f"Sanskrit ('sa') is not supported by Google Translate. Using Hindi ('hi') as fallback.")
+
+        logging.info(f"Translating from {source_lang} ({mapped_source}) to {target_lang} ({mapped_target})")
+        return mapped_source, mapped_target
     
     def get_supported_languages(self) -> List[str]:
         """Get supported language codes."""
@@ -204,10 +233,12 @@ class OpenAITranslateEngine(TranslationEngine):
 class TranslationEngineFactory:
     """Factory for creating translation engines."""
     
-    _engines = {
+    _engines = MappingProxyType({
         'google': GoogleTranslateEngine,
         'openai': OpenAITranslateEngine,
-    }
+    })
+    #: The engine names, in display order.
+    ENGINE_NAMES = tuple(_engines)
     
     @classmethod
     def create(cls, engine_name: str, **kwargs) -> TranslationEngine:
@@ -219,7 +250,7 @@ class TranslationEngineFactory:
         :raises: ValueError if engine name is not supported
         """
         if engine_name not in cls._engines:
-            raise ValueError(f"Unsupported translation engine: {engine_name}. Supported engines: {list(cls._engines.keys())}")
+            raise ValueError(f"Unsupported translation engine: {engine_name}. Supported engines: {list(cls.ENGINE_NAMES)}")
         
         engine_class = cls._engines[engine_name]
         
@@ -235,7 +266,7 @@ class TranslationEngineFactory:
     @classmethod
     def get_supported_engines(cls) -> List[str]:
         """Get list of supported translation engines."""
-        return list(cls._engines.keys())
+        return list(cls.ENGINE_NAMES)
 
 
 def translate_text(text: str, source_lang: str, target_lang: str, engine_name: str = 'google', **kwargs) -> TranslationResponse:
@@ -265,6 +296,35 @@ def translate_text(text: str, source_lang: str, target_lang: str, engine_name: s
         raise
 
 
+def translate_texts_batch(texts: List[str], source_lang: str, target_lang: str, engine_name: str = 'google', **kwargs) -> List[TranslationResponse]:
+    """Translate several texts with as few engine requests as possible.
+    
+    :param texts: Texts to translate. None of them may be empty.
+    :param source_lang: Source language code
+    :param target_lang: Target language code
+    :param engine_name: Translation engine to use
+    :param kwargs: Additional arguments for the engine
+    :return: One translation response per text, in order
+    """
+    try:
+        if any(not text or not text.strip() for text in texts):
+            raise ValueError("Text to translate cannot be empty")
+        
+        if not source_lang or not target_lang:
+            raise ValueError("Source and target language codes are required")
+        
+        if not texts:
+            return []
+        
+        logging.info(f"Starting batch translation of {len(texts)} text(s): {source_lang} -> {target_lang} using {engine_name}")
+        
+        engine = TranslationEngineFactory.create(engine_name, **kwargs)
+        return engine.translate_batch(texts, source_lang, target_lang, **kwargs)
+    except Exception as e:
+        logging.error(f"Batch translation failed: {e}")
+        raise
+
+
 def segment_text_for_translation(text: str, max_length: int = 1000) -> List[str]:
     """Segment text into chunks suitable for translation.
     
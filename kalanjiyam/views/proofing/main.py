@@ -229,6 +229,9 @@ def create_project_status(task_id):
         slug = info.get("slug", None)
         percent = 100 * current / total
 
+    if r.status == "SUCCESS":
+        q.clear_project_summaries_cache()
+
     return render_template(
         "include/task-progress.html",
         status=r.status,
@@ -360,7 +360,7 @@ def ocr(project_slug, page_slug):
     
     # Validate engine
     from kalanjiyam.utils.ocr_engine import OcrEngineFactory
-    if engine not in OcrEngineFactory.get_supported_engines():
+    if engine not in OcrEngineFactory.ENGINE_NAMES:
         abort(400, description=f"Unsupported OCR engine: {engine}")
 
     image_path = get_page_image_filepath(project_slug, page_slug)
@@ -394,7 +394,7 @@ def translate(project_slug, page_slug):
     
     # Validate engine
     from kalanjiyam.utils.translation_engine import TranslationEngineFactory
-    if engine not in TranslationEngineFactory.get_supported_engines():
+    if engine not in TranslationEngineFactory.ENGINE_NAMES:
         abort(400, description=f"Unsupported translation engine: {engine}")
 
     # Get the revision to translate
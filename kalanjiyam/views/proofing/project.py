@@ -250,6 +250,7 @@ def edit(slug):
         session = q.get_session()
         form.populate_obj(project_)
         session.commit()
+        q.clear_project_summaries_cache()
 
         flash(_l("Saved changes."), "success")
         return redirect(url_for("proofing.project.summary", slug=slug))
@@ -732,7 +733,7 @@ def batch_ocr(slug):
         
         # Validate engine
         from kalanjiyam.utils.ocr_engine import OcrEngineFactory
-        if engine not in OcrEngineFactory.get_supported_engines():
+        if engine not in OcrEngineFactory.ENGINE_NAMES:
             flash(_l("Unsupported OCR engine selected."))
             return render_template(
                 "proofing/projects/batch-ocr.html",
@@ -868,6 +869,14 @@ def batch_ocr_status(task_id):
     )
 
 
+def _delete_translation_task(task_key, task_id):
+    """Delete a stored translation task and its entry in the task index."""
+    if task_id:
+        redis_client.delete(task_key, translation_tasks.translation_task_index_key(task_id))
+    else:
+        redis_client.delete(task_key)
+
+
 @bp.route("/<slug>/batch-translate", methods=["GET", "POST"])
 @p2_required
 def batch_translate(slug):
@@ -880,6 +889,7 @@ def batch_translate(slug):
     task_info = redis_client.get(task_key)
     
     if task_info:
+        task_id = None
         try:
             task_data = json.loads(task_info)
             task_id = task_data.get('task_id')
@@ -912,14 +922,14 @@ def batch_translate(slug):
                     )
                 else:
                     # Task is complete, remove from Redis
-                    redis_client.delete(task_key)
+                    _delete_translation_task(task_key, task_id)
             else:
                 # Task not found or no results, remove from Redis
-                redis_client.delete(task_key)
+                _delete_translation_task(task_key, task_id)
         except Exception as e:
             LOG.warning(f"Error checking translation task for {slug}: {e}")
             # Task not found or error, remove from Redis
-            redis_client.delete(task_key)
+            _delete_translation_task(task_key, task_id)
 
     if request.method == "POST":
         # Get translation parameters from form
@@ -929,7 +939,7 @@ def batch_translate(slug):
         
         # Validate engine
         from kalanjiyam.utils.translation_engine import TranslationEngineFactory
-        if engine not in TranslationEngineFactory.get_supported_engines():
+        if engine not in TranslationEngineFactory.ENGINE_NAMES:
             flash(_l("Unsupported translation engine selected."))
             return render_template(
                 "proofing/projects/batch-translate.html",
@@ -953,7 +963,11 @@ def batch_translate(slug):
                 'started_at': datetime.utcnow().isoformat(),
                 'project_slug': slug
             }
-            redis_client.setex(task_key, 86400, json.dumps(task_info))
+            ttl = translation_tasks.TRANSLATION_TASK_TTL
+            pipe = redis_client.pipeline()
+            pipe.setex(task_key, ttl, json.dumps(task_info))
+            pipe.setex(translation_tasks.translation_task_index_key(task.id), ttl, task_key)
+            pipe.execute()
             
             return render_template(
                 "proofing/projects/batch-translate.html",
@@ -968,7 +982,7 @@ def batch_translate(slug):
                 failed_tasks=0,
             )
         else:
-            flash(_l("No pages with revisions found in this project."))
+            flash(_l("No pages in this project need translation."))
 
     return render_template(
         "proofing/projects/batch-translate.html",
@@ -1052,6 +1066,7 @@ def admin(slug):
             session = q.get_session()
             session.delete(project_)
             session.commit()
+            q.clear_project_summaries_cache()
 
             flash(f"Deleted project {slug}")
             return redirect(url_for("proofing.index"))
@@ -4,7 +4,7 @@ from config import create_config_only_app
 from kalanjiyam import database as db
 from kalanjiyam import queries as q
 
-app = create_config_only_app('development')
+app = create_config_only_app('development', one_shot=True)
 
 with app.app_context():
     session = q.get_session()
@@ -0,0 +1,37 @@
+"""Index translations by (page_id, revision_id)
+
+Revision ID: 5c1e9a7f3b20
+Revises: 46107c48081d
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "5c1e9a7f3b20"
+down_revision = "46107c48081d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # On Postgres, build the index without locking the table for writes.
+    # CONCURRENTLY can't run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_proof_translations_page_id_revision_id",
+            "proof_translations",
+            ["page_id", "revision_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_proof_translations_page_id_revision_id",
+            table_name="proof_translations",
+            postgresql_concurrently=True,
+        )
@@ -6,4 +6,4 @@ NOTE: run this script in the production environment.
 from config import create_config_only_app
 
 # Fails if config is malformed.
-app = create_config_only_app("production")
+app = create_config_only_app("production", one_shot=True)
@@ -21,6 +21,7 @@ from kalanjiyam.utils.surya_gpu_config import (
     get_multi_gpu_config,
     get_cpu_config,
     validate_gpu_config,
+    normalize_device,
     print_gpu_config,
     EXAMPLE_CONFIGS
 )
@@ -172,6 +173,7 @@ def main():
         if not validate_gpu_config(config):
             print("Error: Invalid GPU configuration")
             return 1
+        config['device'] = normalize_device(config['device'])
         
         # Test the configuration
         result = test_gpu_config(config, test_image_path)
@@ -0,0 +1,89 @@
+import pytest
+from click.testing import CliRunner
+
+import kalanjiyam.database as db
+import kalanjiyam.queries as q
+from kalanjiyam.scripts.translation_tools import cli
+
+
+@pytest.fixture()
+def translations(flask_app):
+    """Add a failed and a valid translation of the test project's page."""
+    with flask_app.app_context():
+        session = q.get_session()
+        page = q.project("test-project").pages[0]
+        revision = page.revisions[-1]
+        rows = {}
+        for name, content in [("failed", revision.content), ("valid", "Bar")]:
+            rows[name] = db.Translation(
+                page_id=page.id,
+                revision_id=revision.id,
+                author_id=revision.author_id,
+                content=content,
+                source_language="sa",
+                target_language="de",
+                translation_engine="google",
+                status="completed",
+            )
+        session.add_all(rows.values())
+        session.commit()
+        ids = {name: t.id for name, t in rows.items()}
+
+    yield ids
+
+    with flask_app.app_context():
+        session = q.get_session()
+        session.query(db.Translation).filter(
+            db.Translation.id.in_(ids.values())
+        ).delete(synchronize_session=False)
+        session.commit()
+
+
+def _invoke(*args):
+    result = CliRunner().invoke(cli, ["--env", "testing", *args])
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+def _remaining(flask_app, ids) -> set:
+    with flask_app.app_context():
+        session = q.get_session()
+        return {
+            id
+            for (id,) in session.query(db.Translation.id).filter(
+                db.Translation.id.in_(ids.values())
+            )
+        }
+
+
+def test_cleanup_failed(flask_app, translations):
+    output = _invoke("cleanup-failed")
+    assert f"Found failed translation {translations['failed']}:" in output
+    assert f"Found failed translation {translations['valid']}:" not in output
+    assert _remaining(flask_app, translations) == {translations["valid"]}
+
+
+def test_cleanup_failed__all(flask_app, translations):
+    _invoke("cleanup-failed", "--all")
+    assert _remaining(flask_app, translations) == set()
+
+
+def test_check_coverage(translations):
+    output = _invoke("check-coverage", "--project", "test-project")
+    assert "Page 1: ✅ Has 2 translation(s)" in output
+    assert "Translation coverage: 1/1 (100.0%)" in output
+
+
+def test_check_coverage__unknown_project():
+    result = CliRunner().invoke(
+        cli, ["--env", "testing", "check-coverage", "--project", "unknown"]
+    )
+    assert result.exit_code != 0
+    assert "Project not found" in result.output
+
+
+def test_check_valid(translations):
+    output = _invoke("check-valid")
+    assert "sa->de: 2" in output
+    assert f"Translation {translations['valid']}: sa->de" in output
+    assert f"Translation {translations['failed']}: sa->de" not in output
@@ -0,0 +1,19 @@
+import pytest
+
+
+class FakeGroup:
+    """Stands in for `celery.group` so that tests can inspect the signatures."""
+
+    def __init__(self, signatures):
+        self.signatures = list(signatures)
+
+    def apply_async(self):
+        return self
+
+    def save(self):
+        pass
+
+
+@pytest.fixture()
+def fake_group():
+    return FakeGroup
@@ -0,0 +1,13 @@
+import kalanjiyam.queries as q
+import kalanjiyam.tasks.ocr as ocr_tasks
+
+
+def test_run_ocr_for_project(flask_app, monkeypatch, fake_group):
+    monkeypatch.setattr(ocr_tasks, "group", fake_group)
+    app_env = flask_app.config["KALANJIYAM_ENVIRONMENT"]
+
+    with flask_app.app_context():
+        project = q.project("test-project")
+        result = ocr_tasks.run_ocr_for_project(app_env, project, engine="google")
+        assert [s.kwargs["page_slug"] for s in result.signatures] == ["1"]
+        assert result.signatures[0].kwargs["engine"] == "google"
@@ -1,7 +1,12 @@
+import io
+import json
 import tempfile
+import zipfile
+from unittest.mock import Mock
 
 import fitz
 
+import kalanjiyam.database as db
 import kalanjiyam.queries as q
 import kalanjiyam.tasks.projects as projects
 import kalanjiyam.tasks.utils
@@ -37,3 +42,155 @@ def test_create_project_inner(flask_app):
         project = q.project("cool-project")
         assert project
         assert len(project.pages) == 10
+
+
+def _export(client, url: str, name: str) -> dict:
+    resp = client.get(url)
+    with zipfile.ZipFile(io.BytesIO(resp.data)) as zipf:
+        return json.loads(zipf.read(name))
+
+
+def _write_archive(path, name: str, data: dict) -> str:
+    with zipfile.ZipFile(path, "w") as zipf:
+        zipf.writestr(name, json.dumps(data))
+    return str(path)
+
+
+def test_import_projects_inner__round_trip(flask_app, admin_client, tmp_path):
+    data = _export(
+        admin_client, "/admin/export/project/test-project", "project_data.json"
+    )
+    data["metadata"]["slug"] = "test-project-imported"
+    data["translations"] = [
+        {
+            "page_slug": "1",
+            "revision_id": data["revisions"][0]["revision_id"],
+            "author_username": "u-admin",
+            "content": "Bar",
+            "source_language": "sa",
+            "target_language": "en",
+            "translation_engine": "google",
+            "status": "completed",
+            "created_at": "2024-01-01T00:00:00",
+            "updated_at": "2024-01-01T00:00:00",
+        }
+    ]
+    zip_path = _write_archive(tmp_path / "export.zip", "project_data.json", data)
+
+    with flask_app.app_context():
+        projects.import_projects_inner(
+            zip_path=zip_path,
+            app_environment=flask_app.config["KALANJIYAM_ENVIRONMENT"],
+            task_status=kalanjiyam.tasks.utils.LocalTaskStatus(),
+        )
+
+        project = q.project("test-project-imported")
+        assert [p.slug for p in project.pages] == ["1"]
+        assert [r.content for r in project.pages[0].revisions] == ["Foo"]
+        [translation] = project.pages[0].revisions[0].translations
+        assert translation.content == "Bar"
+        assert translation.page_id == project.pages[0].id
+    assert not (tmp_path / "export.zip").exists()
+
+    exported = _export(
+        admin_client,
+        "/admin/export/project/test-project-imported",
+        "project_data.json",
+    )
+    assert [r["content"] for r in exported["revisions"]] == ["Foo"]
+    [exported_translation] = exported["translations"]
+    assert exported_translation["content"] == "Bar"
+    assert exported_translation["page_slug"] == "1"
+    assert exported_translation["author_username"] == "u-admin"
+
+
+def test_import_projects_inner__old_format(flask_app, admin_client, tmp_path):
+    data = _export(
+        admin_client, "/admin/export/project/test-project", "project_data.json"
+    )
+    data["metadata"]["slug"] = "test-project-imported-old"
+    # Older archives don't have revision IDs or translation page slugs.
+    for revision in data["revisions"]:
+        del revision["revision_id"]
+    data["translations"] = [
+        {
+            "revision_id": None,
+            "author_username": "u-admin",
+            "content": "Bar",
+            "source_language": "sa",
+            "target_language": "en",
+            "translation_engine": "google",
+            "status": "completed",
+            "created_at": "2024-01-01T00:00:00",
+            "updated_at": "2024-01-01T00:00:00",
+        }
+    ]
+    zip_path = _write_archive(tmp_path / "export.zip", "project_data.json", data)
+
+    with flask_app.app_context():
+        projects.import_projects_inner(
+            zip_path=zip_path,
+            app_environment=flask_app.config["KALANJIYAM_ENVIRONMENT"],
+            task_status=kalanjiyam.tasks.utils.LocalTaskStatus(),
+        )
+
+        project = q.project("test-project-imported-old")
+        assert [r.content for r in project.pages[0].revisions] == ["Foo"]
+        assert project.pages[0].revisions[0].translations == []
+
+
+def test_import_projects_inner__skips_existing(flask_app, admin_client, tmp_path):
+    data = _export(admin_client, "/admin/export/all-projects", "all_projects_data.json")
+    [existing] = [
+        p for p in data["projects"] if p["metadata"]["slug"] == "test-project"
+    ]
+    new = json.loads(json.dumps(existing))
+    new["metadata"]["slug"] = "test-project-imported-all"
+    zip_path = _write_archive(
+        tmp_path / "export.zip",
+        "all_projects_data.json",
+        {"projects": [existing, new]},
+    )
+
+    task_status = Mock(spec=kalanjiyam.tasks.utils.TaskStatus)
+    with flask_app.app_context():
+        projects.import_projects_inner(
+            zip_path=zip_path,
+            app_environment=flask_app.config["KALANJIYAM_ENVIRONMENT"],
+            task_status=task_status,
+        )
+
+        session = q.get_session()
+        assert session.query(db.Project).filter_by(slug="test-project").count() == 1
+        assert q.project("test-project-imported-all")
+
+    num_imported, slug, failures = task_status.success.call_args.args
+    assert (num_imported, slug) == (1, None)
+    assert [f["slug"] for f in failures] == ["test-project"]
+
+
+def test_import_projects_inner__retries_slug_after_failure(
+    flask_app, admin_client, tmp_path
+):
+    data = _export(
+        admin_client, "/admin/export/project/test-project", "project_data.json"
+    )
+    data["metadata"]["slug"] = "test-project-second-try"
+    broken = json.loads(json.dumps(data))
+    del broken["metadata"]["display_title"]
+    zip_path = _write_archive(
+        tmp_path / "export.zip", "all_projects_data.json", {"projects": [broken, data]}
+    )
+
+    task_status = Mock(spec=kalanjiyam.tasks.utils.TaskStatus)
+    with flask_app.app_context():
+        projects.import_projects_inner(
+            zip_path=zip_path,
+            app_environment=flask_app.config["KALANJIYAM_ENVIRONMENT"],
+            task_status=task_status,
+        )
+        assert q.project("test-project-second-try")
+
+    num_imported, _, failures = task_status.success.call_args.args
+    assert num_imported == 1
+    assert [f["slug"] for f in failures] == ["test-project-second-try"]
@@ -0,0 +1,43 @@
+import kalanjiyam.database as db
+import kalanjiyam.queries as q
+import kalanjiyam.tasks.translation as translation_tasks
+
+
+def test_run_translation_for_project__skips_translated_pages(
+    flask_app, monkeypatch, fake_group
+):
+    monkeypatch.setattr(translation_tasks, "group", fake_group)
+    app_env = flask_app.config["KALANJIYAM_ENVIRONMENT"]
+
+    with flask_app.app_context():
+        project = q.project("test-project")
+        result = translation_tasks.run_translation_for_project(app_env, project)
+        assert [s.kwargs["page_slug"] for s in result.signatures] == ["1"]
+
+        session = q.get_session()
+        page = project.pages[0]
+        translation = db.Translation(
+            page_id=page.id,
+            revision_id=page.revisions[-1].id,
+            author_id=page.revisions[-1].author_id,
+            content="translated",
+            source_language="sa",
+            target_language="en",
+            translation_engine="google",
+            status="completed",
+        )
+        session.add(translation)
+        session.commit()
+        try:
+            project = q.project("test-project")
+            assert (
+                translation_tasks.run_translation_for_project(app_env, project) is None
+            )
+            # A different target language still needs translation.
+            result = translation_tasks.run_translation_for_project(
+                app_env, project, target_lang="hi"
+            )
+            assert len(result.signatures) == 1
+        finally:
+            session.delete(translation)
+            session.commit()
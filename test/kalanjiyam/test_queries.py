@@ -0,0 +1,34 @@
+import kalanjiyam.queries as q
+
+
+def test_project_with_pages_and_revisions(flask_app):
+    with flask_app.app_context():
+        project = q.project_with_pages_and_revisions("test-project")
+        assert project.display_title == "Test Project"
+        assert [p.slug for p in project.pages] == ["1"]
+        assert [r.content for r in project.pages[0].revisions] == ["Foo"]
+
+
+def test_project_with_pages_and_revisions__missing(flask_app):
+    with flask_app.app_context():
+        assert q.project_with_pages_and_revisions("unknown") is None
+
+
+def test_project_for_export(flask_app):
+    with flask_app.app_context():
+        project = q.project_for_export("test-project")
+        assert project.board.title == "board"
+        assert [p.slug for p in project.pages] == ["1"]
+        assert project.pages[0].status.name == "reviewed-0"
+
+
+def test_project_for_export__missing(flask_app):
+    with flask_app.app_context():
+        assert q.project_for_export("unknown") is None
+
+
+def test_project_summaries(flask_app):
+    with flask_app.app_context():
+        summaries = {s.slug: s for s in q.project_summaries()}
+        assert summaries["test-project"].num_pages == 1
+        assert summaries["test-project"].display_title == "Test Project"
@@ -0,0 +1,30 @@
+from kalanjiyam.utils import bbox_serde
+
+
+def test_pack_and_unpack():
+    boxes = [
+        (0, 0, 100, 20, "word"),
+        (120, 25, 300, 45, "अन्यत्\t"),
+    ]
+    blob = bbox_serde.pack(boxes)
+    assert blob == '[[0,0,100,20,"word"],[120,25,300,45,"अन्यत्\\t"]]'
+    assert bbox_serde.unpack(blob) == boxes
+
+
+def test_unpack__empty():
+    assert bbox_serde.unpack(None) == []
+    assert bbox_serde.unpack("") == []
+    assert bbox_serde.unpack(bbox_serde.pack([])) == []
+
+
+def test_unpack__legacy_tsv():
+    blob = "0\t0\t100\t20\tword\n120\t25\t300\t45\tanother"
+    assert bbox_serde.unpack(blob) == [
+        (0, 0, 100, 20, "word"),
+        (120, 25, 300, 45, "another"),
+    ]
+
+
+def test_unpack__legacy_json_objects():
+    blob = '[{"x1": 0, "y1": 0, "x2": 100, "y2": 20, "text": "word"}]'
+    assert bbox_serde.unpack(blob) == [(0, 0, 100, 20, "word")]
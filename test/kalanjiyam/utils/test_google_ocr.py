@@ -1,6 +1,8 @@
 import tempfile
 from pathlib import Path
 
+from google.cloud import vision
+
 from kalanjiyam.utils import google_ocr
 
 
@@ -30,6 +32,11 @@ def test_prepare_image():
     assert res.content == b"fake image data"
 
 
+def test_prepare_image_bytes():
+    res = google_ocr.prepare_image_bytes(b"fake image data")
+    assert res.content == b"fake image data"
+
+
 def test_serialize_bounding_boxes():
     boxes = [
         (0, 0, 100, 20, "word"),
@@ -37,3 +44,125 @@ def test_serialize_bounding_boxes():
     ]
     blob = "0\t0\t100\t20\tword\n120\t25\t300\t45\tanother"
     assert google_ocr.serialize_bounding_boxes(boxes) == blob
+
+
+def _word(text, vertices, break_type=0):
+    symbols = [{"text": c} for c in text]
+    symbols[-1]["property"] = {"detected_break": {"type_": break_type}}
+    return {
+        "bounding_box": {"vertices": [{"x": x, "y": y} for x, y in vertices]},
+        "symbols": symbols,
+    }
+
+
+def test_parse_document():
+    document = vision.TextAnnotation(
+        pages=[
+            {
+                "blocks": [
+                    {
+                        "paragraphs": [
+                            {
+                                "words": [
+                                    _word(
+                                        "ab", [(10, 5), (30, 5), (30, 20), (10, 20)], 1
+                                    ),
+                                    _word(
+                                        "cd", [(40, 6), (60, 4), (61, 21), (39, 19)], 4
+                                    ),
+                                    _word(
+                                        "ef", [(0, 30), (20, 30), (20, 45), (0, 45)], 5
+                                    ),
+                                ]
+                            }
+                        ]
+                    }
+                ]
+            }
+        ]
+    )
+    res = google_ocr.parse_document(document)
+    assert res.text_content == "ab cd-\nef\n\n"
+    assert res.bounding_boxes == [
+        (10, 5, 30, 20, "ab"),
+        (39, 4, 61, 21, "cd"),
+        (0, 30, 20, 45, "ef"),
+    ]
+
+
+def test_run_batch(monkeypatch):
+    calls = []
+
+    class FakeClient:
+        def batch_annotate_images(self, requests):
+            calls.append(requests)
+            document = vision.TextAnnotation(
+                pages=[
+                    {
+                        "blocks": [
+                            {
+                                "paragraphs": [
+                                    {
+                                        "words": [
+                                            _word("ab", [(0, 0), (1, 1)], 5),
+                                        ]
+                                    }
+                                ]
+                            }
+                        ]
+                    }
+                ]
+            )
+            return vision.BatchAnnotateImagesResponse(
+                responses=[
+                    vision.AnnotateImageResponse(full_text_annotation=document)
+                    for _ in requests
+                ]
+            )
+
+    monkeypatch.setattr(google_ocr, "_client", FakeClient)
+    images = [f"image {i}".encode() for i in range(20)]
+    res = google_ocr.run_batch(images, language="hi")
+
+    assert [len(c) for c in calls] == [16, 4]
+    assert calls[1][0].image.content == b"image 16"
+    assert list(calls[0][0].image_context.language_hints) == ["hi"]
+    assert len(res) == 20
+    assert res[0].text_content == "ab\n\n"
+
+
+def test_run_with_selection__vips(monkeypatch):
+    crops = []
+
+    class FakeVipsImage:
+        width = 100
+        height = 50
+
+        def crop(self, left, top, width, height):
+            crops.append((left, top, width, height))
+            return self
+
+        def pngsave_buffer(self):
+            return b"png bytes"
+
+    class FakeVips:
+        class Image:
+            @staticmethod
+            def new_from_file(path, access):
+                return FakeVipsImage()
+
+    sent = []
+
+    def fake_run_from_bytes(data, language):
+        sent.append(data)
+        return google_ocr.OcrResponse("hi", [(1, 2, 3, 4, "hi")])
+
+    monkeypatch.setattr(google_ocr, "pyvips", FakeVips)
+    monkeypatch.setattr(google_ocr, "run_from_bytes", fake_run_from_bytes)
+
+    selection = {"left": 10, "top": 5, "width": 30, "height": 20}
+    res = google_ocr.run_with_selection(Path("page.jpg"), selection)
+    assert crops == [(10, 5, 30, 20)]
+    assert sent == [b"png bytes"]
+    # Boxes are in page coordinates, not crop coordinates.
+    assert res.bounding_boxes == [(11, 7, 13, 9, "hi")]
@@ -0,0 +1,127 @@
+import os
+import threading
+import time
+
+import pytest
+
+from kalanjiyam.utils import ocr_cache
+from kalanjiyam.utils.google_ocr import OcrResponse
+
+
+@pytest.fixture(autouse=True)
+def clear_memory_cache():
+    ocr_cache._memory_cache.clear()
+
+
+def test_cache_key(tmp_path):
+    image = tmp_path / "page.jpg"
+    image.write_bytes(b"fake image data")
+
+    key = ocr_cache.cache_key(image, engine="google", language="sa")
+    assert key == ocr_cache.cache_key(image, language="sa", engine="google")
+    assert key != ocr_cache.cache_key(image, engine="google", language="hi")
+
+    image.write_bytes(b"other image data")
+    assert key != ocr_cache.cache_key(image, engine="google", language="sa")
+
+
+def test_get_or_run(tmp_path, monkeypatch):
+    monkeypatch.setenv("KALANJIYAM_OCR_CACHE_DIR", str(tmp_path / "cache"))
+    response = OcrResponse(
+        text_content="agniH", bounding_boxes=[(0, 0, 10, 20, "agniH")]
+    )
+    calls = []
+
+    def run():
+        calls.append(1)
+        return response
+
+    assert ocr_cache.get("abc") is None
+    assert ocr_cache.get_or_run("abc", run) == response
+    assert ocr_cache.get_or_run("abc", run) == response
+    assert len(calls) == 1
+    assert list((tmp_path / "cache").iterdir()) == [tmp_path / "cache" / "abc.json"]
+
+
+def test_get__from_memory(tmp_path, monkeypatch):
+    monkeypatch.setenv("KALANJIYAM_OCR_CACHE_DIR", str(tmp_path))
+    response = OcrResponse(text_content="agniH", bounding_boxes=[])
+    ocr_cache.put("in-memory", response)
+
+    # Entries stay available in this process even if the file is removed.
+    (tmp_path / "in-memory.json").unlink()
+    assert ocr_cache.get("in-memory") == response
+
+
+def test_get__corrupt_entry(tmp_path, monkeypatch):
+    monkeypatch.setenv("KALANJIYAM_OCR_CACHE_DIR", str(tmp_path))
+    (tmp_path / "abc.json").write_bytes(b"not json")
+    assert ocr_cache.get("abc") is None
+
+
+def test_get_or_run__concurrent_callers_share_one_run(tmp_path, monkeypatch):
+    monkeypatch.setenv("KALANJIYAM_OCR_CACHE_DIR", str(tmp_path))
+    response = OcrResponse(text_content="agniH", bounding_boxes=[])
+    release = threading.Event()
+    calls = []
+
+    def run():
+        calls.append(1)
+        release.wait(timeout=5)
+        return response
+
+    results = []
+
+    def call():
+        results.append(ocr_cache.get_or_run("shared", run))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    while "shared" not in ocr_cache._inflight:
+        pass
+    follower = threading.Thread(target=call)
+    follower.start()
+    release.set()
+    leader.join()
+    follower.join()
+
+    assert results == [response, response]
+    assert len(calls) == 1
+    assert not ocr_cache._inflight
+
+
+def test_cache_keys(tmp_path):
+    image = tmp_path / "page.jpg"
+    image.write_bytes(b"fake image data")
+
+    page_key, selection_key = ocr_cache.cache_keys(
+        image, {"engine": "google"}, {"engine": "google", "selection": [1, 2]}
+    )
+    assert page_key == ocr_cache.cache_key(image, engine="google")
+    assert selection_key == ocr_cache.cache_key(
+        image, engine="google", selection=[1, 2]
+    )
+
+
+def test_put__unlinks_temp_file_on_failure(tmp_path, monkeypatch):
+    monkeypatch.setenv("KALANJIYAM_OCR_CACHE_DIR", str(tmp_path))
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(ocr_cache.os, "replace", fail)
+    ocr_cache.put("abc", OcrResponse(text_content="agniH", bounding_boxes=[]))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_prune(tmp_path, monkeypatch):
+    monkeypatch.setenv("KALANJIYAM_OCR_CACHE_DIR", str(tmp_path))
+    old = tmp_path / "old.json"
+    new = tmp_path / "new.json"
+    old.write_bytes(b"{}")
+    new.write_bytes(b"{}")
+    an_hour_ago = time.time() - 3600
+    os.utime(old, (an_hour_ago, an_hour_ago))
+
+    ocr_cache.prune(max_age=60)
+    assert list(tmp_path.iterdir()) == [new]
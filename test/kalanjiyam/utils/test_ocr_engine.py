@@ -0,0 +1,67 @@
+from kalanjiyam.utils import google_ocr, ocr_cache, ocr_engine
+
+
+def test_select_from_page():
+    page = google_ocr.OcrResponse(
+        text_content="",
+        bounding_boxes=[
+            (0, 0, 40, 20, "outside"),
+            (100, 100, 140, 120, "“hari”"),
+            (150, 102, 170, 118, "|"),
+            (100, 130, 140, 150, "hara"),
+            (150, 131, 170, 149, "||"),
+        ],
+    )
+    selection = {"left": 90, "top": 90, "width": 100, "height": 70}
+
+    res = ocr_engine._select_from_page(page, selection, google_ocr.post_process)
+    assert res.text_content == '"hari" ।\nhara ॥'
+    # Boxes stay in page coordinates.
+    assert res.bounding_boxes == page.bounding_boxes[1:]
+
+
+def test_select_from_page__no_boxes():
+    page = google_ocr.OcrResponse(
+        text_content="", bounding_boxes=[(0, 0, 40, 20, "outside")]
+    )
+    selection = {"left": 90, "top": 90, "width": 100, "height": 70}
+    assert ocr_engine._select_from_page(page, selection, str) is None
+
+
+def test_select_from_page__surya_selection():
+    page = google_ocr.OcrResponse(
+        text_content="",
+        bounding_boxes=[(0, 0, 40, 20, "outside"), (100, 100, 140, 120, "hari")],
+    )
+    selection = {"x1": 90, "y1": 90, "x2": 190, "y2": 160}
+
+    res = ocr_engine._select_from_page(page, selection, str)
+    assert res.text_content == "hari"
+
+
+def test_select_from_page__unknown_selection():
+    page = google_ocr.OcrResponse(
+        text_content="", bounding_boxes=[(100, 100, 140, 120, "hari")]
+    )
+    assert ocr_engine._select_from_page(page, {"x1": 90}, str) is None
+
+
+def test_run_ocr_with_selection__cached_page(tmp_path, monkeypatch):
+    monkeypatch.setenv("KALANJIYAM_OCR_CACHE_DIR", str(tmp_path / "cache"))
+    image = tmp_path / "page.jpg"
+    image.write_bytes(b"fake image data")
+    page_key = ocr_cache.cache_key(image, engine="surya")
+    ocr_cache.put(
+        page_key,
+        google_ocr.OcrResponse(
+            text_content="hari", bounding_boxes=[(100, 100, 140, 120, " hari ")]
+        ),
+    )
+
+    def fail(*args, **kwargs):
+        raise AssertionError("should not create an engine")
+
+    monkeypatch.setattr(ocr_engine.OcrEngineFactory, "create", fail)
+    selection = {"x1": 90, "y1": 90, "x2": 190, "y2": 160}
+    res = ocr_engine.run_ocr_with_selection(image, selection, engine_name="surya")
+    assert res.text_content == "hari"
@@ -0,0 +1,50 @@
+import os
+
+import pytest
+
+from kalanjiyam.utils import surya_gpu_config
+
+
+def test_setup_gpu_environment__runs_once(monkeypatch):
+    monkeypatch.setattr(surya_gpu_config, "_GPU_CONFIGURED", False)
+    monkeypatch.setenv("TORCH_DEVICE", "")
+
+    surya_gpu_config.setup_gpu_environment(surya_gpu_config.get_cpu_config())
+    assert os.environ["TORCH_DEVICE"] == "cpu"
+
+    surya_gpu_config.setup_gpu_environment(
+        {**surya_gpu_config.get_cpu_config(), "device": "cuda:1"}
+    )
+    assert os.environ["TORCH_DEVICE"] == "cpu"
+
+
+def test_normalize_device():
+    assert surya_gpu_config.normalize_device("auto") == "auto"
+    assert surya_gpu_config.normalize_device("cpu") == "cpu"
+    assert surya_gpu_config.normalize_device("cuda:1") == "cuda:1"
+    assert surya_gpu_config.normalize_device("2") == "cuda:2"
+    with pytest.raises(ValueError):
+        surya_gpu_config.normalize_device("tpu")
+
+
+def test_validate_gpu_config():
+    config = {**surya_gpu_config.get_default_gpu_config(), "device": "2"}
+    assert surya_gpu_config.validate_gpu_config(config)
+    # Validation doesn't modify the config.
+    assert config["device"] == "2"
+
+    assert not surya_gpu_config.validate_gpu_config({**config, "device": "tpu"})
+    assert not surya_gpu_config.validate_gpu_config({**config, "memory_fraction": 1.5})
+    assert not surya_gpu_config.validate_gpu_config({**config, "max_memory_mb": -1})
+
+
+def test_print_gpu_config(capsys):
+    surya_gpu_config.print_gpu_config(surya_gpu_config.get_multi_gpu_config([0, 1]))
+    assert capsys.readouterr().out == (
+        "Surya OCR GPU Configuration:\n"
+        "  Device: cuda:0\n"
+        "  Memory Fraction: 0.8\n"
+        "  Max Memory: No limit\n"
+        "  Allow Growth: True\n"
+        "  Multi-GPU: Yes (GPUs: [0, 1])\n"
+    )
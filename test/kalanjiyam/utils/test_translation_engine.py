@@ -1,7 +1,7 @@
 """Tests for translation engine functionality."""
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, create_autospec, patch
 
 from kalanjiyam.utils.translation_engine import (
     TranslationResponse,
@@ -9,6 +9,7 @@ from kalanjiyam.utils.translation_engine import (
     OpenAITranslateEngine,
     TranslationEngineFactory,
     translate_text,
+    translate_texts_batch,
     segment_text_for_translation,
 )
 
@@ -113,6 +114,31 @@ class TestGoogleTranslateEngine:
             assert response.target_language == "en"
             assert response.engine == "google"
     
+    def test_translate_batch_one_string_per_request(self):
+        """Test that a batch calls `Translator.translate` with one string at a time."""
+
+        class Translator:
+            """The `Translator.translate` signature from googletrans 4.0.0rc1."""
+
+            def translate(self, text, dest="en", src="auto", **kwargs):
+                pass
+
+        mock_translator = create_autospec(Translator, instance=True)
+        mock_translator.translate.side_effect = lambda text, src, dest: Mock(
+            text=text.upper() if isinstance(text, str) else None
+        )
+
+        with patch('kalanjiyam.utils.translation_engine.GoogleTranslateEngine.__init__', return_value=None):
+            engine = GoogleTranslateEngine()
+            engine.translator = mock_translator
+
+            responses = engine.translate_batch(["one.", "two. three."], "sa", "en")
+
+            for call in mock_translator.translate.call_args_list:
+                assert isinstance(call.args[0], str)
+            assert [r.translated_text for r in responses] == ["ONE.", "TWO.\nTHREE."]
+            assert all(r.engine == "google" for r in responses)
+    
     def test_get_supported_languages(self):
         """Test getting supported languages."""
         with patch('kalanjiyam.utils.translation_engine.GoogleTranslateEngine.__init__', return_value=None):
@@ -151,6 +177,17 @@ class TestOpenAITranslateEngine:
             assert response.engine == "openai"
             assert response.metadata["model"] == "gpt-3.5-turbo"
     
+    def test_translate_batch_keeps_order(self):
+        """Test that the default batch translation returns results in order."""
+        with patch('kalanjiyam.utils.translation_engine.OpenAITranslateEngine.__init__', return_value=None):
+            engine = OpenAITranslateEngine()
+            with patch.object(engine, 'translate', side_effect=lambda text, s, t: text.upper()) as mock_translate:
+                texts = [f"text {i}" for i in range(20)]
+                responses = engine.translate_batch(texts, "sa", "en")
+            
+            assert responses == [t.upper() for t in texts]
+            assert mock_translate.call_count == 20
+    
     def test_get_supported_languages(self):
         """Test getting supported languages."""
         with patch('kalanjiyam.utils.translation_engine.OpenAITranslateEngine.__init__', return_value=None):
@@ -181,4 +218,20 @@ class TestTranslateTextFunction:
         
         assert response.translated_text == "Hello world"
         mock_factory.create.assert_called_once_with("google")
-        mock_engine.translate.assert_called_once_with("नमस्ते दुनिया", "sa", "en") 
\ No newline at end of file
+        mock_engine.translate.assert_called_once_with("नमस्ते दुनिया", "sa", "en") 
+    
+    @patch('kalanjiyam.utils.translation_engine.TranslationEngineFactory')
+    def test_translate_texts_batch(self, mock_factory):
+        """Test the translate_texts_batch convenience function."""
+        mock_engine = Mock()
+        mock_engine.translate_batch.return_value = ["response"]
+        mock_factory.create.return_value = mock_engine
+        
+        assert translate_texts_batch(["नमस्ते"], "sa", "en", "google") == ["response"]
+        mock_factory.create.assert_called_once_with("google")
+        mock_engine.translate_batch.assert_called_once_with(["नमस्ते"], "sa", "en")
+    
+    def test_translate_texts_batch_rejects_empty_text(self):
+        """Test that translate_texts_batch rejects blank texts."""
+        with pytest.raises(ValueError, match="cannot be empty"):
+            translate_texts_batch(["नमस्ते", "  "], "sa", "en")
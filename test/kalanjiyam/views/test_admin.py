@@ -1,3 +1,12 @@
+import io
+import json
+import zipfile
+from pathlib import Path
+
+import kalanjiyam.queries as q
+from kalanjiyam.tasks import projects as project_tasks
+
+
 def test_admin_index__unauth(client):
     resp = client.get("/admin/")
     assert resp.status_code == 404
@@ -42,3 +51,113 @@ def test_admin_text__admin_only(admin_client, moderator_client):
 def test_admin_text__inactive(deleted_client, banned_client):
     assert deleted_client.get("/admin/text/").status_code == 404
     assert banned_client.get("/admin/text/").status_code == 404
+
+
+def _read_zip_json(data: bytes, name: str):
+    with zipfile.ZipFile(io.BytesIO(data)) as zipf:
+        return json.loads(zipf.read(name))
+
+
+def test_export_project(admin_client):
+    resp = admin_client.get("/admin/export/project/test-project")
+    assert resp.status_code == 200
+    assert resp.mimetype == "application/zip"
+
+    data = _read_zip_json(resp.data, "project_data.json")
+    assert data["metadata"]["slug"] == "test-project"
+    assert [p["slug"] for p in data["pages"]] == ["1"]
+    assert [r["content"] for r in data["revisions"]] == ["Foo"]
+
+
+def test_export_project__with_files(flask_app, admin_client, tmp_path):
+    upload_folder = flask_app.config["UPLOAD_FOLDER"]
+    flask_app.config["UPLOAD_FOLDER"] = str(tmp_path)
+    try:
+        project_dir = tmp_path / "projects" / "test-project"
+        (project_dir / "pdf").mkdir(parents=True)
+        (project_dir / "pdf" / "source.pdf").write_bytes(b"%PDF-1.4 test")
+        (project_dir / "pages").mkdir()
+        (project_dir / "pages" / "1.jpg").write_bytes(b"\xff\xd8 test")
+
+        resp = admin_client.get("/admin/export/project/test-project")
+    finally:
+        flask_app.config["UPLOAD_FOLDER"] = upload_folder
+
+    assert resp.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(resp.data)) as zipf:
+        assert zipf.read("files/source.pdf") == b"%PDF-1.4 test"
+        assert zipf.read("files/pages/1.jpg") == b"\xff\xd8 test"
+        # Already-compressed files are stored as-is.
+        assert zipf.getinfo("files/source.pdf").compress_type == zipfile.ZIP_STORED
+        assert zipf.getinfo("files/pages/1.jpg").compress_type == zipfile.ZIP_STORED
+        assert zipf.getinfo("project_data.json").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_export_project__moderator(moderator_client):
+    resp = moderator_client.get("/admin/export/project/test-project")
+    assert resp.status_code == 404
+
+
+def test_export_all_projects(admin_client):
+    resp = admin_client.get("/admin/export/all-projects")
+    assert resp.status_code == 200
+
+    data = _read_zip_json(resp.data, "all_projects_data.json")
+    assert data["export_info"]["total_projects"] == len(data["projects"])
+    assert "test-project" in {p["metadata"]["slug"] for p in data["projects"]}
+
+
+def test_export_all_projects__skips_deleted(admin_client, monkeypatch):
+    project_for_export = q.project_for_export
+
+    def fake_project_for_export(slug):
+        # Act as if this project was deleted after the export started.
+        if slug == "test-project":
+            return None
+        return project_for_export(slug)
+
+    monkeypatch.setattr(q, "project_for_export", fake_project_for_export)
+    resp = admin_client.get("/admin/export/all-projects")
+    assert resp.status_code == 200
+
+    data = _read_zip_json(resp.data, "all_projects_data.json")
+    assert "test-project" not in {p["metadata"]["slug"] for p in data["projects"]}
+
+
+def test_import_project__starts_task(flask_app, admin_client, monkeypatch):
+    calls = []
+
+    class FakeTask:
+        id = "task-id"
+        status = "PENDING"
+
+    def fake_delay(**kwargs):
+        calls.append(kwargs)
+        return FakeTask()
+
+    monkeypatch.setattr(project_tasks.import_projects, "delay", fake_delay)
+
+    upload = io.BytesIO()
+    with zipfile.ZipFile(upload, "w") as zipf:
+        zipf.writestr("project_data.json", "{}")
+    archive = upload.getvalue()
+    upload.seek(0)
+
+    resp = admin_client.post(
+        "/admin/import",
+        data={"project_file": (upload, "export.zip")},
+        content_type="multipart/form-data",
+    )
+    assert resp.status_code == 200
+    assert "/admin/import/status/task-id" in resp.text
+
+    [kwargs] = calls
+    zip_path = Path(kwargs["zip_path"])
+    assert zip_path.parent == Path(flask_app.config["UPLOAD_FOLDER"]) / "imports"
+    assert zip_path.read_bytes() == archive
+    zip_path.unlink()
+
+
+def test_import_project__moderator(moderator_client):
+    resp = moderator_client.post("/admin/import")
+    assert resp.status_code == 404
@@ -3,7 +3,7 @@
 from config import create_config_only_app
 from kalanjiyam.utils.translation_engine import translate_text, TranslationEngineFactory
 
-app = create_config_only_app('development')
+app = create_config_only_app('development', one_shot=True)
 
 with app.app_context():
     # Test text